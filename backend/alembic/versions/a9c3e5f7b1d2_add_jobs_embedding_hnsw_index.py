@@ -0,0 +1,37 @@
+"""add HNSW index on jobs.embedding (cosine)
+
+Revision ID: a9c3e5f7b1d2
+Revises: c9f2a7b41e30
+Create Date: 2026-10-16 00:00:00.000000
+
+Índice ANN para las consultas `ORDER BY embedding <=> :v LIMIT k` (Stage 1 del
+matching con MATCH_STAGE1_TOP_K > 0). Se crea CONCURRENTLY para no bloquear las
+escrituras de la cosecha; por eso corre fuera de la transacción de Alembic.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a9c3e5f7b1d2"
+down_revision: str | None = "c9f2a7b41e30"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # El build del grafo HNSW es mucho más rápido si cabe en memoria.
+        op.execute("SET maintenance_work_mem = '512MB'")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jobs_embedding_hnsw "
+            "ON jobs USING hnsw (embedding vector_cosine_ops) "
+            "WITH (m = 16, ef_construction = 64)"
+        )
+        op.execute("RESET maintenance_work_mem")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_embedding_hnsw")
@@ -0,0 +1,47 @@
+"""store jobs.embedding and user_profiles.cv_embedding as halfvec(384)
+
+Revision ID: b4d6f8a0c2e1
+Revises: a9c3e5f7b1d2
+Create Date: 2026-10-16 00:00:00.000000
+
+FP16 en lugar de FP32: la mitad de bytes por fila en los scans de Stage 1 y un
+índice HNSW ~2× más pequeño. Requiere pgvector >= 0.7 (imagen pgvector:pg16).
+El ALTER ... TYPE reescribe la tabla con lock exclusivo; el índice HNSW se
+reconstruye sobre la nueva columna con halfvec_cosine_ops.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b4d6f8a0c2e1"
+down_revision: str | None = "a9c3e5f7b1d2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _rebuild_embeddings(column_type: str, opclass: str) -> None:
+    op.execute("DROP INDEX IF EXISTS ix_jobs_embedding_hnsw")
+    op.execute(
+        f"ALTER TABLE jobs ALTER COLUMN embedding TYPE {column_type} "
+        f"USING embedding::{column_type}"
+    )
+    op.execute(
+        f"ALTER TABLE user_profiles ALTER COLUMN cv_embedding TYPE {column_type} "
+        f"USING cv_embedding::{column_type}"
+    )
+    op.execute("SET LOCAL maintenance_work_mem = '512MB'")
+    op.execute(
+        "CREATE INDEX ix_jobs_embedding_hnsw "
+        f"ON jobs USING hnsw (embedding {opclass}) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+
+
+def upgrade() -> None:
+    _rebuild_embeddings("halfvec(384)", "halfvec_cosine_ops")
+
+
+def downgrade() -> None:
+    _rebuild_embeddings("vector(384)", "vector_cosine_ops")
@@ -0,0 +1,33 @@
+"""add (user_id, score_final, id) index on match_results for keyset pagination
+
+Revision ID: d1e3f5a7b9c0
+Revises: b4d6f8a0c2e1
+Create Date: 2026-10-16 00:00:00.000000
+
+Sirve el `ORDER BY score_final DESC, id DESC` de /match/results y /match/history
+tanto con offset como con cursor `(score_final, id) < (:s, :id)`. Se crea
+CONCURRENTLY para no bloquear las escrituras del matching.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d1e3f5a7b9c0"
+down_revision: str | None = "b4d6f8a0c2e1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_match_results_user_score_id "
+            "ON match_results (user_id, score_final, id)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_match_results_user_score_id")
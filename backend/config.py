@@ -85,6 +85,13 @@ class Settings(BaseSettings):
     MATCH_LLM_RERANK_TOP: int = 50  # tope de re-ranking cuando el pool es enorme
     MATCH_LLM_RERANK_MAX: int = 150  # por debajo de esto, se re-rankea todo
     SEMANTIC_DEDUP_THRESHOLD: float = 0.95
+    # Stage 1: nº de candidatos por similitud coseno. 0 = catálogo completo (el
+    # Stage 2 puntúa todo, comportamiento por defecto). >0 = top-K vía el índice
+    # HNSW, para catálogos grandes donde el scan secuencial domina la latencia.
+    MATCH_STAGE1_TOP_K: int = 0
+    # Candidatos que explora HNSW por consulta (recall vs latencia). Se fija
+    # como mínimo a MATCH_STAGE1_TOP_K, o HNSW devolvería menos filas que K.
+    MATCH_HNSW_EF_SEARCH: int = 100
 
     # Groq LLM
     GROQ_API_KEY: str = ""
@@ -124,8 +131,14 @@ class Settings(BaseSettings):
     # Database pool (TD-20)
     DB_POOL_SIZE: int = 10
     DB_MAX_OVERFLOW: int = 20
+    # Segundos que una petición espera por una conexión libre antes de fallar.
+    DB_POOL_TIMEOUT: int = 30
     DB_POOL_RECYCLE: int = 1800
     DB_POOL_PRE_PING: bool = True
+    # Sentencias preparadas cacheadas por conexión (asyncpg + SQLAlchemy): las
+    # consultas de listados repiten SQL y reutilizan el plan. 0 las desactiva
+    # (obligatorio detrás de pgbouncer en modo transaction).
+    DB_STATEMENT_CACHE_SIZE: int = 500
 
     # Celery task pool (smaller, disposable)
     DB_TASK_POOL_SIZE: int = 2
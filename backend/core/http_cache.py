@@ -0,0 +1,99 @@
+"""Conditional GET (ETag / 304) for slow-changing JSON endpoints."""
+
+import hashlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class ETagMiddleware:
+    """Adds a weak ETag + Cache-Control to GETs on ``paths``; answers 304 on match.
+
+    ASGI puro (no BaseHTTPMiddleware) para no interferir con el stream SSE: las
+    rutas no listadas pasan sin tocar. El cuerpo se sigue generando, pero un
+    cliente con la versión vigente recibe un 304 sin payload.
+
+    Las rutas de ``revalidate_paths`` (datos del propio usuario) van con
+    ``no-cache``: el navegador revalida siempre y nunca sirve la respuesta de
+    otro token tras un logout/login. Todas llevan ``Vary: Authorization``.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        paths: set[str],
+        max_age: int = 30,
+        stale_while_revalidate: int = 60,
+        revalidate_paths: set[str] | None = None,
+    ) -> None:
+        self.app = app
+        self.revalidate_paths = revalidate_paths or set()
+        self.paths = paths | self.revalidate_paths
+        self.cache_control = (
+            f"private, max-age={max_age}, "
+            f"stale-while-revalidate={stale_while_revalidate}"
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or scope["path"] not in self.paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match", "")
+        start: Message | None = None
+        chunks: list[bytes] = []
+
+        async def buffered_send(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            cache_control = (
+                "private, no-cache"
+                if scope["path"] in self.revalidate_paths
+                else self.cache_control
+            )
+            await self._send_conditional(
+                start, b"".join(chunks), if_none_match, cache_control, send
+            )
+
+        await self.app(scope, receive, buffered_send)
+
+    async def _send_conditional(
+        self,
+        start: Message,
+        body: bytes,
+        if_none_match: str,
+        cache_control: str,
+        send: Send,
+    ) -> None:
+        if start["status"] != 200:
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        etag = f'W/"{hashlib.md5(body).hexdigest()}"'
+        headers = MutableHeaders(raw=start["headers"])
+        headers["ETag"] = etag
+        headers["Cache-Control"] = cache_control
+        headers.add_vary_header("Authorization")
+
+        if etag in {tag.strip() for tag in if_none_match.split(",")}:
+            del headers["content-length"]
+            del headers["content-type"]
+            await send({**start, "status": 304, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        await send({**start, "headers": headers.raw})
+        await send({"type": "http.response.body", "body": body})
@@ -7,6 +7,7 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from config import settings
 from database import get_db
@@ -68,7 +69,10 @@ async def get_current_user(
 
     user_id = decode_token(token, expected_type="access")
 
-    result = await db.execute(select(User).where(User.id == user_id))
+    # El perfil llega en el mismo SELECT (1:1): los handlers no hacen refresh
+    result = await db.execute(
+        select(User).options(joinedload(User.profile)).where(User.id == user_id)
+    )
     user = result.scalar_one_or_none()
 
     if user is None:
@@ -3,20 +3,51 @@ from contextlib import asynccontextmanager
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from config import settings
 
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=False,
+    # Pool explícito del stack ASGI (no QueuePool síncrono: con asyncio debe
+    # ser la variante adaptada, que usa colas compatibles con el event loop).
+    poolclass=AsyncAdaptedQueuePool,
     pool_size=settings.DB_POOL_SIZE,
     max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
     pool_recycle=settings.DB_POOL_RECYCLE,
     pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args={
+        # Caché del dialecto SQLAlchemy (prepare() por SQL) y caché propia de
+        # asyncpg para las sentencias que ejecuta directamente.
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    },
 )
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+def pool_stats() -> dict[str, int | float]:
+    """Snapshot of the API connection pool for health/saturation checks.
+
+    ``saturation`` is checked-out connections over the hard limit
+    (pool_size + max_overflow): 1.0 means new requests wait up to
+    ``pool_timeout`` for a connection.
+    """
+    pool = engine.pool
+    capacity = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    checked_out = pool.checkedout()
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": checked_out,
+        "overflow": max(pool.overflow(), 0),
+        "capacity": capacity,
+        "saturation": round(checked_out / capacity, 3) if capacity else 0.0,
+    }
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -9,7 +9,9 @@ from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
 from config import settings
+from core.http_cache import ETagMiddleware
 from core.rate_limit import limiter
+from database import pool_stats
 from logging_setup import configure_logging
 from providers import log_provider_status
 from services.scheduler import run_scheduler_with_leader_lock
@@ -109,6 +111,9 @@ async def lifespan(app: FastAPI):
     await redis_client.aclose()
 
 
+# Sin default_response_class: con response_model FastAPI serializa directamente a
+# bytes con pydantic-core (TypeAdapter.dump_json), sin jsonable_encoder ni
+# json.dumps. Un response class propio (p.ej. ORJSONResponse) desactiva esa vía.
 app = FastAPI(
     title=settings.APP_NAME,
     version="0.1.0",
@@ -128,6 +133,13 @@ app.add_middleware(
     allow_headers=settings.BACKEND_CORS_HEADERS,
 )
 
+# ETag/304 para GETs que cambian poco y el frontend consulta a menudo
+app.add_middleware(
+    ETagMiddleware,
+    paths={"/api/v1/jobs/stats", "/api/v1/jobs/sources"},
+    revalidate_paths={"/api/v1/auth/me"},
+)
+
 # Routers
 app.include_router(analytics_router)
 app.include_router(applications_router)
@@ -149,3 +161,9 @@ async def health():
 @app.get("/api/v1/health")
 async def health_v1():
     return {"status": "healthy"}
+
+
+@app.get("/healthz")
+async def healthz():
+    """Liveness + saturación del pool de conexiones a la DB."""
+    return {"status": "healthy", "db_pool": pool_stats()}
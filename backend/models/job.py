@@ -2,8 +2,18 @@
 
 from datetime import datetime
 
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import Boolean, DateTime, Integer, String, Text, cast, func, or_
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    cast,
+    func,
+    or_,
+)
 from sqlalchemy.dialects.postgresql import ENUM, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -13,6 +23,16 @@ from models.enums import ContractType, SalaryPeriod, Seniority
 
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        # ANN (HNSW) para ORDER BY embedding <=> :v LIMIT k (Stage 1 del matching)
+        Index(
+            "ix_jobs_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+        ),
+    )
 
     # Primary key — MD5(title+company+url)
     hash: Mapped[str] = mapped_column(String(32), primary_key=True)
@@ -53,8 +73,9 @@ class Job(Base):
     remote: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     tags: Mapped[list] = mapped_column(JSONB, default=list, nullable=False)
 
-    # AI embedding (paraphrase-multilingual-MiniLM-L12-v2, 384 dims)
-    embedding = mapped_column(Vector(384), nullable=True)
+    # AI embedding (paraphrase-multilingual-MiniLM-L12-v2, 384 dims), FP16:
+    # la mitad de bytes por fila y por nodo HNSW sin pérdida de recall apreciable
+    embedding = mapped_column(HALFVEC(384), nullable=True)
 
     # Extra metadata
     logo: Mapped[str | None] = mapped_column(String(2048))
@@ -2,6 +2,7 @@
 
 import uuid
 from datetime import datetime
+from typing import ClassVar
 
 from sqlalchemy import DateTime, Enum, ForeignKey, String, Text, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
@@ -16,6 +17,8 @@ class JobApplication(Base):
     __table_args__ = (
         UniqueConstraint("user_id", "job_hash", name="uq_application_user_job"),
     )
+    # Recupera updated_at (onupdate=now()) vía RETURNING en el propio UPDATE.
+    __mapper_args__: ClassVar[dict] = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -3,7 +3,16 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, ForeignKey, String, Text, UniqueConstraint, func
+from sqlalchemy import (
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -18,6 +27,8 @@ class MatchResult(Base):
     __tablename__ = "match_results"
     __table_args__ = (
         UniqueConstraint("user_id", "job_hash", name="uq_match_user_job"),
+        # Orden de /match/results (score_final DESC, id DESC) y su keyset
+        Index("ix_match_results_user_score_id", "user_id", "score_final", "id"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -47,6 +47,8 @@ class User(Base):
         back_populates="user",
         uselist=False,
         cascade="all, delete-orphan",
+        # Se carga en get_current_user; un acceso sin cargar es un bug, no un SELECT
+        lazy="raise",
     )
 
     def __repr__(self) -> str:
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC
 from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import JSON, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -42,7 +42,7 @@ class UserProfile(Base):
         nullable=False,
     )
     cv_text: Mapped[str | None] = mapped_column(Text, nullable=True)
-    cv_embedding = mapped_column(Vector(384), nullable=True)
+    cv_embedding = mapped_column(HALFVEC(384), nullable=True)
     score_weights: Mapped[dict | None] = mapped_column(JSON, nullable=True)
 
     # Vigilancia de colegios suizos (watchlist swiss_schools_*).
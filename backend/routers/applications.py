@@ -5,8 +5,9 @@ import uuid
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import String, cast, func, select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from core.security import get_current_user
 from database import get_db
@@ -26,6 +27,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/applications", tags=["applications"])
 
+# Columnas de Job que _to_response desnormaliza; el resto (descripción,
+# embedding...) no se trae en los listados.
+_JOB_DISPLAY_COLUMNS = load_only(Job.title, Job.company, Job.location, Job.source)
+
 
 def _to_response(app: JobApplication, job: Job | None) -> ApplicationResponse:
     """Convert a JobApplication + optional Job to response schema."""
@@ -79,6 +84,7 @@ async def list_applications(
     stmt = (
         select(JobApplication, Job)
         .outerjoin(Job, JobApplication.job_hash == Job.hash)
+        .options(_JOB_DISPLAY_COLUMNS)
         .where(*conditions)
         .order_by(JobApplication.updated_at.desc())
         .limit(limit)
@@ -89,15 +95,12 @@ async def list_applications(
 
     # Status summary
     status_stmt = (
-        select(
-            cast(JobApplication.status, String),
-            func.count(),
-        )
+        select(JobApplication.status, func.count())
         .where(JobApplication.user_id == current_user.id)
         .group_by(JobApplication.status)
     )
     status_rows = (await db.execute(status_stmt)).all()
-    by_status = {row[0]: row[1] for row in status_rows}
+    by_status = {row[0].value: row[1] for row in status_rows}
 
     return ApplicationsListResponse(data=data, total=total, by_status=by_status)
 
@@ -159,12 +162,12 @@ async def get_application_stats(
 
     # By status
     status_stmt = (
-        select(cast(JobApplication.status, String), func.count())
+        select(JobApplication.status, func.count())
         .where(*base)
         .group_by(JobApplication.status)
     )
     status_rows = (await db.execute(status_stmt)).all()
-    by_status = {row[0]: row[1] for row in status_rows}
+    by_status = {row[0].value: row[1] for row in status_rows}
 
     # By source (join with Job)
     source_stmt = (
@@ -202,7 +205,8 @@ async def get_application_stats(
         if interviews > 0:
             conversion_rates["interview_to_offer"] = round(offers / interviews, 3)
 
-    return ApplicationStatsResponse(
+    # Histogramas construidos aquí desde el GROUP BY: sin revalidación
+    return ApplicationStatsResponse.model_construct(
         by_status=by_status,
         conversion_rates=conversion_rates,
         by_source=by_source,
@@ -217,19 +221,25 @@ async def update_application(
     db: AsyncSession = Depends(get_db),
 ):
     """Update application status, notes, or follow-up date."""
-    app = (
+    # La oferta viaja en la misma consulta (outer join): la respuesta no
+    # necesita un segundo SELECT tras el commit.
+    row = (
         await db.execute(
-            select(JobApplication).where(
+            select(JobApplication, Job)
+            .outerjoin(Job, JobApplication.job_hash == Job.hash)
+            .options(_JOB_DISPLAY_COLUMNS)
+            .where(
                 JobApplication.id == application_id,
                 JobApplication.user_id == current_user.id,
             )
         )
-    ).scalar_one_or_none()
-    if app is None:
+    ).one_or_none()
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Application not found",
         )
+    app, job = row
 
     update_data = body.model_dump(exclude_unset=True)
     for field, value in update_data.items():
@@ -239,12 +249,9 @@ async def update_application(
     if body.status == ApplicationStatus.applied and app.applied_at is None:
         app.applied_at = datetime.now(timezone.utc)
 
+    # updated_at vuelve en el RETURNING del UPDATE (eager_defaults en el
+    # modelo), así que no hace falta refresh.
     await db.commit()
-    await db.refresh(app)
-
-    job = (
-        await db.execute(select(Job).where(Job.hash == app.job_hash))
-    ).scalar_one_or_none()
 
     return _to_response(app, job)
 
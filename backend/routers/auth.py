@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
@@ -44,10 +45,13 @@ async def register(
             detail="A user with this email already exists",
         )
 
+    # bcrypt es CPU puro (~100 ms): en un hilo para no bloquear el event loop.
+    hashed_password = await asyncio.to_thread(hash_password, body.password)
+
     now = datetime.now(timezone.utc)
     user = User(
         email=body.email,
-        hashed_password=hash_password(body.password),
+        hashed_password=hashed_password,
         gdpr_consent=True,
         gdpr_consent_at=now,
         last_login=now,
@@ -100,7 +104,9 @@ async def login(request: Request, body: UserLogin, db: AsyncSession = Depends(ge
             detail="Account is deactivated",
         )
 
-    if not verify_password(body.password, user.hashed_password):
+    if not await asyncio.to_thread(
+        verify_password, body.password, user.hashed_password
+    ):
         raise invalid_credentials
 
     user.last_login = datetime.now(timezone.utc)
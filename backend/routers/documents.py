@@ -1,11 +1,13 @@
 """Document generation endpoints — AI-tailored CV and cover letter."""
 
+import asyncio
 import json
 import logging
 import uuid
+from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-from sqlalchemy import select
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config import settings
@@ -29,6 +31,23 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/documents", tags=["documents"])
 
+# Single-flight de generación: el primer request toma el lock y llama al LLM;
+# los concurrentes con la misma cache_key esperan su resultado en Redis en vez de
+# pagar otra llamada (y otra fila) por el mismo documento.
+_GEN_LOCK_TTL_SECONDS = 90  # cubre la latencia de generación (Gemini ~9-30 s)
+_GEN_WAIT_MAX_SECONDS = 60.0
+_GEN_POLL_INITIAL_SECONDS = 0.25
+_GEN_POLL_MAX_SECONDS = 4.0
+
+# Borra el lock solo si sigue siendo nuestro: si la generación excedió el TTL,
+# otro request puede haberlo tomado y no hay que soltárselo.
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
 
 def _get_groq(request: Request) -> GroqService:
     """Build GroqService with Redis from app state."""
@@ -41,6 +60,74 @@ def _get_gemini() -> GeminiService:
     return GeminiService()
 
 
+async def _read_cached_document(
+    redis, cache_key: str
+) -> GeneratedDocumentResponse | None:
+    try:
+        cached = await redis.get(cache_key)
+    except Exception:
+        logger.debug("Redis cache read failed for %s", cache_key)
+        return None
+    if not cached:
+        return None
+    return GeneratedDocumentResponse(**json.loads(cached))
+
+
+async def _acquire_generation_lock(redis, cache_key: str) -> tuple[bool, str | None]:
+    """(generar, token) — token del lock si este request lo ha tomado."""
+    token = uuid.uuid4().hex
+    try:
+        acquired = await redis.set(
+            f"{cache_key}:lock", token, nx=True, px=_GEN_LOCK_TTL_SECONDS * 1000
+        )
+    except Exception:
+        # Sin Redis no hay coordinación posible: generar igualmente.
+        logger.debug("Redis lock failed for %s", cache_key)
+        return True, None
+    return (True, token) if acquired else (False, None)
+
+
+async def _release_generation_lock(redis, cache_key: str, token: str) -> None:
+    try:
+        await redis.eval(_RELEASE_LOCK_SCRIPT, 1, f"{cache_key}:lock", token)
+    except Exception:
+        logger.debug("Redis lock release failed for %s", cache_key)
+
+
+async def _wait_for_generation(
+    redis, cache_key: str
+) -> tuple[GeneratedDocumentResponse | None, str | None]:
+    """Espera (backoff exponencial) a que otro request publique el documento.
+
+    Devuelve (documento, None) si aparece en caché, o (None, token) si el lock
+    queda libre sin documento (el otro request falló) y este lo toma para
+    generar. Si vence el plazo con la generación aún en curso → 409, sin
+    lanzar una segunda llamada al LLM.
+    """
+    delay = _GEN_POLL_INITIAL_SECONDS
+    waited = 0.0
+    while waited < _GEN_WAIT_MAX_SECONDS:
+        await asyncio.sleep(delay)
+        waited += delay
+        cached = await _read_cached_document(redis, cache_key)
+        if cached is not None:
+            return cached, None
+        generate, token = await _acquire_generation_lock(redis, cache_key)
+        if generate:
+            # El anterior pudo publicar y soltar el lock entre las dos lecturas
+            cached = await _read_cached_document(redis, cache_key)
+            if cached is not None:
+                if token:
+                    await _release_generation_lock(redis, cache_key, token)
+                return cached, None
+            return None, token
+        delay = min(delay * 2, _GEN_POLL_MAX_SECONDS)
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="This document is already being generated. Retry shortly.",
+    )
+
+
 def _to_response(
     doc: GeneratedDocument,
     job_title: str | None = None,
@@ -74,8 +161,6 @@ async def generate_document(
             detail="AI service unavailable. Configure GEMINI_API_KEY or GROQ_API_KEY.",
         )
 
-    # Load user profile with CV text
-    await db.refresh(current_user, ["profile"])
     profile = current_user.profile
     if not profile or not profile.cv_text:
         raise HTTPException(
@@ -98,82 +183,88 @@ async def generate_document(
     cache_key = DocumentGeneratorService.cache_key(
         str(current_user.id), body.job_hash, body.doc_type.value, body.language
     )
+    lock_token = None
     if redis:
-        try:
-            cached = await redis.get(cache_key)
-            if cached:
-                cached_data = json.loads(cached)
-                return GeneratedDocumentResponse(**cached_data)
-        except Exception:
-            logger.debug("Redis cache read failed for %s", cache_key)
-
-    # Load match data if available (for matching/missing skills)
-    match_result = (
-        await db.execute(
-            select(MatchResult).where(
-                MatchResult.user_id == current_user.id,
-                MatchResult.job_hash == body.job_hash,
+        cached = await _read_cached_document(redis, cache_key)
+        if cached is not None:
+            return cached
+        generate, lock_token = await _acquire_generation_lock(redis, cache_key)
+        if not generate:
+            cached, lock_token = await _wait_for_generation(redis, cache_key)
+            if cached is not None:
+                return cached
+
+    try:
+        # Load match data if available (for matching/missing skills)
+        match_result = (
+            await db.execute(
+                select(MatchResult).where(
+                    MatchResult.user_id == current_user.id,
+                    MatchResult.job_hash == body.job_hash,
+                )
             )
-        )
-    ).scalar_one_or_none()
+        ).scalar_one_or_none()
 
-    matching_skills = match_result.matching_skills if match_result else None
-    missing_skills = match_result.missing_skills if match_result else None
-
-    # Generate document (Gemini primario, Groq fallback)
-    generator = DocumentGeneratorService(groq, gemini)
-    if body.doc_type == DocType.cv:
-        content = await generator.generate_cv(
-            cv_text=profile.cv_text,
-            skills=profile.skills or [],
-            job_title=job.title,
-            job_company=job.company,
-            job_description=job.description or "",
-            job_tags=job.tags or [],
-            matching_skills=matching_skills,
-            missing_skills=missing_skills,
-            language=body.language,
-        )
-    else:
-        content = await generator.generate_cover_letter(
-            cv_text=profile.cv_text,
-            skills=profile.skills or [],
-            job_title=job.title,
-            job_company=job.company,
-            job_description=job.description or "",
-            job_tags=job.tags or [],
-            matching_skills=matching_skills,
-            missing_skills=missing_skills,
+        matching_skills = match_result.matching_skills if match_result else None
+        missing_skills = match_result.missing_skills if match_result else None
+
+        # Generate document (Gemini primario, Groq fallback)
+        generator = DocumentGeneratorService(groq, gemini)
+        if body.doc_type == DocType.cv:
+            content = await generator.generate_cv(
+                cv_text=profile.cv_text,
+                skills=profile.skills or [],
+                job_title=job.title,
+                job_company=job.company,
+                job_description=job.description or "",
+                job_tags=job.tags or [],
+                matching_skills=matching_skills,
+                missing_skills=missing_skills,
+                language=body.language,
+            )
+        else:
+            content = await generator.generate_cover_letter(
+                cv_text=profile.cv_text,
+                skills=profile.skills or [],
+                job_title=job.title,
+                job_company=job.company,
+                job_description=job.description or "",
+                job_tags=job.tags or [],
+                matching_skills=matching_skills,
+                missing_skills=missing_skills,
+                language=body.language,
+            )
+
+        # Save to DB
+        doc = GeneratedDocument(
+            user_id=current_user.id,
+            job_hash=body.job_hash,
+            doc_type=body.doc_type.value,
+            content=content,
             language=body.language,
         )
+        db.add(doc)
+        await db.commit()
+        await db.refresh(doc)
 
-    # Save to DB
-    doc = GeneratedDocument(
-        user_id=current_user.id,
-        job_hash=body.job_hash,
-        doc_type=body.doc_type.value,
-        content=content,
-        language=body.language,
-    )
-    db.add(doc)
-    await db.commit()
-    await db.refresh(doc)
-
-    response = _to_response(doc, job_title=job.title, job_company=job.company)
+        response = _to_response(doc, job_title=job.title, job_company=job.company)
 
-    # Cache in Redis
-    if redis:
-        try:
-            ttl = settings.GROQ_DOC_CACHE_TTL_HOURS * 3600
-            await redis.set(
-                cache_key,
-                json.dumps(response.model_dump(), default=str),
-                ex=ttl,
-            )
-        except Exception:
-            logger.debug("Redis cache write failed for %s", cache_key)
+        # Cache in Redis
+        if redis:
+            try:
+                ttl = settings.GROQ_DOC_CACHE_TTL_HOURS * 3600
+                await redis.set(
+                    cache_key,
+                    json.dumps(response.model_dump(), default=str),
+                    ex=ttl,
+                )
+            except Exception:
+                logger.debug("Redis cache write failed for %s", cache_key)
 
-    return response
+        return response
+    finally:
+        if lock_token:
+            await _release_generation_lock(redis, cache_key, lock_token)
 
 
 @router.get("/{job_hash}", response_model=DocumentListResponse)
@@ -182,8 +273,19 @@ async def list_documents(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
     doc_type: str | None = Query(None),
+    limit: int | None = Query(None, ge=1, le=200),
+    before: datetime | None = Query(
+        None, description="Cursor: created_at of the last document already seen"
+    ),
+    before_id: uuid.UUID | None = Query(
+        None, description="Cursor tiebreak: id of the last document already seen"
+    ),
 ):
-    """List generated documents for a specific job."""
+    """List generated documents for a specific job (newest first).
+
+    Sin ``limit`` devuelve todos; con ``limit``/``before`` pagina por keyset y
+    ``total`` cuenta todos los documentos del filtro, no solo los de la página.
+    """
     conditions = [
         GeneratedDocument.user_id == current_user.id,
         GeneratedDocument.job_hash == job_hash,
@@ -191,24 +293,45 @@ async def list_documents(
     if doc_type:
         conditions.append(GeneratedDocument.doc_type == doc_type)
 
+    # Keyset (created_at, id): con el id de desempate no se saltan documentos
+    # con el mismo created_at en el borde de página.
+    page_conditions = list(conditions)
+    if before is not None:
+        if before_id is not None:
+            page_conditions.append(
+                tuple_(GeneratedDocument.created_at, GeneratedDocument.id)
+                < (before, before_id)
+            )
+        else:
+            page_conditions.append(GeneratedDocument.created_at < before)
+
+    # Solo título y empresa de la oferta, no la entidad Job completa por fila.
     stmt = (
-        select(GeneratedDocument, Job)
+        select(GeneratedDocument, Job.title, Job.company)
         .outerjoin(Job, GeneratedDocument.job_hash == Job.hash)
-        .where(*conditions)
-        .order_by(GeneratedDocument.created_at.desc())
+        .where(*page_conditions)
+        .order_by(GeneratedDocument.created_at.desc(), GeneratedDocument.id.desc())
     )
+    if limit is not None:
+        stmt = stmt.limit(limit)
     rows = (await db.execute(stmt)).all()
 
     data = [
-        _to_response(
-            doc,
-            job_title=job.title if job else None,
-            job_company=job.company if job else None,
-        )
-        for doc, job in rows
+        _to_response(doc, job_title=job_title, job_company=job_company)
+        for doc, job_title, job_company in rows
     ]
 
-    return DocumentListResponse(data=data, total=len(data))
+    paginated = limit is not None or before is not None
+    if paginated:
+        total = (
+            await db.execute(
+                select(func.count()).select_from(GeneratedDocument).where(*conditions)
+            )
+        ).scalar_one()
+    else:
+        total = len(data)
+
+    return DocumentListResponse(data=data, total=total)
 
 
 @router.delete("/{document_id}", status_code=status.HTTP_204_NO_CONTENT)
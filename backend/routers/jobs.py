@@ -1,16 +1,22 @@
 """Job search, detail, stats, and sources endpoints."""
 
 import logging
+from typing import Any
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import String, cast, func, select, text
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import String, any_, bindparam, func, select, text
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database import get_db
+from models.enums import ContractType, Seniority
 from models.job import Job
 from schemas.job import (
-    JobBrief,
+    SEARCH_CARD_MAX_TAGS,
     JobResponse,
+    JobSearchCard,
     JobSearchResponse,
     JobStats,
     SalaryStats,
@@ -21,24 +27,54 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/jobs", tags=["jobs"])
 
+# Columnas de JobSearchCard, en el orden del schema
+_JOB_CARD_FIELDS = tuple(JobSearchCard.model_fields)
+_JOB_CARD_COLUMNS = tuple(getattr(Job, name) for name in _JOB_CARD_FIELDS)
 
-@router.get("/search", response_model=JobSearchResponse)
-async def search_jobs(
-    db: AsyncSession = Depends(get_db),
+# Tope de filas por petición de /search.ndjson
+_NDJSON_MAX_ROWS = 5000
+
+
+def _card(row) -> dict[str, Any]:
+    """Fila de BD (columnas de ``_JOB_CARD_COLUMNS``) → tarjeta JSON-serializable.
+
+    Datos ya tipados por la BD: no pasan por pydantic, así que el recorte de
+    tags de JobSearchCard se aplica aquí (un ``tags`` JSON null queda ``[]``).
+    Los null se omiten (el frontend trata ausente igual que null) y los enums
+    los escribe orjson como su valor.
+    """
+    card = {
+        name: value for name, value in zip(_JOB_CARD_FIELDS, row) if value is not None
+    }
+    card["tags"] = (card.get("tags") or [])[:SEARCH_CARD_MAX_TAGS]
+    return card
+
+
+def _matches_any(column, param_name: str, values: list[str]):
+    """``column = ANY(:param)`` con un único array ligado.
+
+    A diferencia de ``in_()``, el SQL no cambia con el nº de valores, así que
+    asyncpg reutiliza el prepared statement entre peticiones.
+    """
+    return column == any_(bindparam(param_name, values, type_=ARRAY(String)))
+
+
+def _search_query(
     q: str | None = Query(None, max_length=200),
     source: str | None = Query(None),
     remote_only: bool = Query(False),
     canton: str | None = Query(None),
     language: str | None = Query(None),
-    seniority: str | None = Query(None),
-    contract_type: str | None = Query(None),
+    seniority: Seniority | None = Query(None),
+    contract_type: ContractType | None = Query(None),
     salary_min: int | None = Query(None, ge=0),
     salary_max: int | None = Query(None, ge=0),
     sort: str = Query("newest", pattern="^(newest|oldest|salary|relevance)$"),
-    limit: int = Query(20, ge=1, le=100),
-    offset: int = Query(0, ge=0),
-):
-    """Search jobs with full-text search and structured filters."""
+) -> tuple[list, Any]:
+    """Filtros de búsqueda comunes a /search y /search.ndjson.
+
+    Devuelve ``(conditions, order_clause)``.
+    """
     # Base conditions: only active, non-duplicate, non-student jobs
     conditions = [
         Job.is_active.is_(True),
@@ -58,21 +94,22 @@ async def search_jobs(
     if source:
         sources = [s.strip() for s in source.split(",") if s.strip()]
         if sources:
-            conditions.append(Job.source.in_(sources))
+            conditions.append(_matches_any(Job.source, "sources", sources))
     if canton:
         cantons = [c.strip().upper() for c in canton.split(",") if c.strip()]
         if cantons:
-            conditions.append(Job.canton.in_(cantons))
+            conditions.append(_matches_any(Job.canton, "cantons", cantons))
 
     # Simple filters
     if remote_only:
         conditions.append(Job.remote.is_(True))
     if language:
         conditions.append(Job.language == language)
+    # Comparación con el enum nativo: sin cast a texto por fila.
     if seniority:
-        conditions.append(cast(Job.seniority, String) == seniority)
+        conditions.append(Job.seniority == seniority)
     if contract_type:
-        conditions.append(cast(Job.contract_type, String) == contract_type)
+        conditions.append(Job.contract_type == contract_type)
 
     # Salary range overlap
     if salary_min is not None:
@@ -80,10 +117,6 @@ async def search_jobs(
     if salary_max is not None:
         conditions.append(Job.salary_min_chf <= salary_max)
 
-    # Count total before pagination
-    count_stmt = select(func.count()).select_from(Job).where(*conditions)
-    total = (await db.execute(count_stmt)).scalar_one()
-
     # Sort order
     if sort == "oldest":
         order_clause = Job.first_seen_at.asc()
@@ -96,26 +129,77 @@ async def search_jobs(
     else:  # newest (default)
         order_clause = Job.last_seen_at.desc()
 
+    return conditions, order_clause
+
+
+# JobSearchResponse documenta la respuesta en OpenAPI, pero en runtime la página
+# se serializa con orjson desde las filas (sin instancias ORM ni pydantic).
+@router.get("/search", response_model=JobSearchResponse)
+async def search_jobs(
+    db: AsyncSession = Depends(get_db),
+    query: tuple[list, Any] = Depends(_search_query),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+):
+    """Search jobs with full-text search and structured filters."""
+    conditions, order_clause = query
+
+    # Count total before pagination
+    count_stmt = select(func.count()).select_from(Job).where(*conditions)
+    total = (await db.execute(count_stmt)).scalar_one()
+
     # Main query with pagination
     stmt = (
-        select(Job)
+        select(*_JOB_CARD_COLUMNS)
         .where(*conditions)
         .order_by(order_clause)
         .limit(limit)
         .offset(offset)
     )
+    rows = (await db.execute(stmt)).all()
+
+    payload = {
+        "data": [_card(row) for row in rows],
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "has_more": (offset + limit) < total,
+    }
+    return Response(orjson.dumps(payload), media_type="application/json")
 
-    result = await db.execute(stmt)
-    jobs = result.scalars().all()
 
-    return JobSearchResponse(
-        data=[JobBrief.model_validate(j) for j in jobs],
-        total=total,
-        limit=limit,
-        offset=offset,
-        has_more=(offset + limit) < total,
+@router.get(
+    "/search.ndjson",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def search_jobs_ndjson(
+    db: AsyncSession = Depends(get_db),
+    query: tuple[list, Any] = Depends(_search_query),
+    limit: int = Query(1000, ge=1, le=_NDJSON_MAX_ROWS),
+    offset: int = Query(0, ge=0),
+):
+    """Same search as ``/search``, streamed as one JSON card per line.
+
+    Para exportaciones grandes: sin ``total`` ni sobre JSON, cada fila se
+    serializa y se envía según llega del cursor de servidor.
+    """
+    conditions, order_clause = query
+    stmt = (
+        select(*_JOB_CARD_COLUMNS)
+        .where(*conditions)
+        .order_by(order_clause)
+        .limit(limit)
+        .offset(offset)
     )
 
+    async def lines():
+        rows = await db.stream(stmt)
+        async for row in rows:
+            yield orjson.dumps(_card(row)) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
 
 @router.get("/stats", response_model=JobStats)
 async def get_job_stats(db: AsyncSession = Depends(get_db)):
@@ -136,7 +220,8 @@ async def get_job_stats(db: AsyncSession = Depends(get_db)):
             .group_by(column)
         )
         rows = (await db.execute(stmt)).all()
-        return {str(row[0]): row[1] for row in rows}
+        # Las columnas enum llegan como miembros del enum: clave = su .value.
+        return {getattr(row[0], "value", row[0]): row[1] for row in rows}
 
     by_source = await _group_by(Job.source)
     by_canton = await _group_by(Job.canton)
@@ -158,13 +243,15 @@ async def get_job_stats(db: AsyncSession = Depends(get_db)):
 
     salary_stats = SalaryStats()
     if salary_row and salary_row[0] is not None:
-        salary_stats = SalaryStats(
+        salary_stats = SalaryStats.model_construct(
             min=salary_row[0],
             max=salary_row[1],
             mean=round(float(salary_row[2]), 2) if salary_row[2] else None,
         )
 
-    return JobStats(
+    # Agregados del GROUP BY ya tipados (str -> int): no se revalida cada
+    # clave/valor de los histogramas
+    return JobStats.model_construct(
         total_jobs=total,
         by_source=by_source,
         by_canton=by_canton,
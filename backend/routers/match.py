@@ -1,6 +1,8 @@
 """AI Match endpoints — analyze, results, history, feedback, implicit."""
 
 import logging
+import uuid
+from collections.abc import Mapping, Sequence
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -8,6 +10,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from core.rate_limit import limiter
 from core.security import get_current_user
 from database import get_db
+from models.job import Job
+from models.match_result import MatchResult
 from models.user import User
 from schemas.match import (
     ImplicitFeedbackRequest,
@@ -16,15 +20,21 @@ from schemas.match import (
     MatchAnalyzeResponse,
     MatchFeedbackRequest,
     MatchFeedbackResponse,
+    MatchResultBrief,
     MatchResultResponse,
+    MatchResultsBriefResponse,
     MatchResultsResponse,
     MatchScoreBreakdown,
 )
-from scrapers.swiss_schools_config import get_school
+from scrapers.swiss_schools_config import WatchedSchool, get_school
 from services.gemini_service import GeminiService
 from services.groq_service import GroqService
 from services.job_matcher import DEFAULT_WEIGHTS
-from services.match_result_service import MatchResultService
+from services.match_result_service import (
+    MatchResultService,
+    decode_results_cursor,
+    encode_results_cursor,
+)
 from services.match_service import MatchService
 from services.translation_service import TranslationService
 
@@ -39,6 +49,33 @@ def _get_groq(request: Request) -> GroqService:
     return GroqService(redis_client=redis_client)
 
 
+def _decode_cursor(cursor: str | None) -> tuple[float, uuid.UUID] | None:
+    if cursor is None:
+        return None
+    try:
+        return decode_results_cursor(cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def _next_cursor(results: Sequence[tuple[MatchResult, Job]], limit: int) -> str | None:
+    """Cursor tras el último resultado si la página vino llena."""
+    if len(results) < limit:
+        return None
+    return encode_results_cursor(results[-1][0])
+
+
+def _resolve_weights(user: User) -> Mapping[str, float]:
+    """Pesos personalizados del perfil, o los de por defecto (profile ya cargado)."""
+    profile = user.profile
+    return (
+        profile.score_weights if profile and profile.score_weights else DEFAULT_WEIGHTS
+    )
+
+
 @router.post("/analyze", response_model=MatchAnalyzeResponse)
 @limiter.limit("3/minute")
 async def analyze_matches(
@@ -79,11 +116,10 @@ async def analyze_matches(
     )
 
 
-def _to_match_response(item: dict, translations: dict[str, str]) -> MatchResultResponse:
-    """Mapea un resultado del servicio a MatchResultResponse (traducción ya calculada)."""
-    match = item["match"]
-    job = item["job"]
-
+def _brief_fields(
+    match: MatchResult, job: Job, translations: dict[str, str]
+) -> tuple[dict, WatchedSchool | None]:
+    """Campos de MatchResultBrief (traducción ya calculada) y colegio de la watchlist."""
     original_title = job.title or ""
     translated = translations.get(original_title)
     # Mostrar traducción si el LLM produjo algo diferente al original.
@@ -103,125 +139,176 @@ def _to_match_response(item: dict, translations: dict[str, str]) -> MatchResultR
         if school:
             break
 
-    return MatchResultResponse(
-        id=match.id,
-        job_hash=match.job_hash,
-        score_final=match.score_final,
-        scores=MatchScoreBreakdown(
+    fields = {
+        "id": match.id,
+        "job_hash": match.job_hash,
+        "score_final": match.score_final,
+        "scores": MatchScoreBreakdown.model_construct(
             embedding=match.score_embedding,
             salary=match.score_salary,
             location=match.score_location,
             recency=match.score_recency,
             llm=match.score_llm,
         ),
+        "feedback": match.feedback,
+        "school_id": school.id if school else None,
+        "created_at": match.created_at,
+        "job_title": job.title,
+        "job_title_en": job_title_en,
+        "job_language": job_language,
+        "job_company": job.company,
+        "job_location": job.location,
+        "job_url": job.url,
+        "job_salary_min": job.salary_min_chf,
+        "job_salary_max": job.salary_max_chf,
+        "job_tags": job.tags or [],
+        "job_source": job.source,
+        "job_category": job.category,
+    }
+    return fields, school
+
+
+def _to_match_brief(
+    match: MatchResult, job: Job, translations: dict[str, str]
+) -> MatchResultBrief:
+    """Mapea un resultado a MatchResultBrief; no toca las columnas diferidas."""
+    fields, _school = _brief_fields(match, job, translations)
+    return MatchResultBrief.model_construct(**fields)
+
+
+def _to_match_response(
+    match: MatchResult, job: Job, translations: dict[str, str]
+) -> MatchResultResponse:
+    """Mapea un resultado del servicio a MatchResultResponse (traducción ya calculada).
+
+    Los campos vienen de columnas NOT NULL ya tipadas por el ORM: se construye
+    sin validar.
+    """
+    fields, school = _brief_fields(match, job, translations)
+    return MatchResultResponse.model_construct(
+        **fields,
         explanation=match.explanation,
         matching_skills=match.matching_skills,
         missing_skills=match.missing_skills,
-        feedback=match.feedback,
         application_status=match.application_status,
         urgency_score=match.urgency_score,
         has_draft=bool(match.draft_letter),
-        school_id=school.id if school else None,
         school_policy=school.policy if school else None,
-        created_at=match.created_at,
-        job_title=job.title,
-        job_title_en=job_title_en,
-        job_language=job_language,
-        job_company=job.company,
-        job_location=job.location,
-        job_url=job.url,
         job_description=job.description_snippet,
-        job_salary_min=job.salary_min_chf,
-        job_salary_max=job.salary_max_chf,
-        job_tags=job.tags or [],
-        job_source=job.source,
-        job_category=job.category,
     )
 
 
+async def _translate_titles(
+    results: Sequence[tuple[MatchResult, Job]], groq: GroqService | None
+) -> dict[str, str]:
+    """Batch-translate non-EN/ES titles (vacío sin Groq)."""
+    if not groq:
+        return {}
+    titles_with_lang = [
+        {"title": job.title or "", "language": job.language or ""}
+        for _match, job in results
+    ]
+    return await TranslationService(groq).translate_titles(titles_with_lang)
+
+
 async def _build_results_response(
-    results: list[dict],
+    results: Sequence[tuple[MatchResult, Job]],
     total: int,
     weights: dict,
     groq: GroqService | None = None,
+    next_cursor: str | None = None,
+    brief: bool = False,
 ):
-    """Build MatchResultsResponse from service results, with title translations."""
-    # Batch-translate non-EN/ES titles
-    translations: dict[str, str] = {}
-    if groq:
-        titles_with_lang = [
-            {"title": item["job"].title or "", "language": item["job"].language or ""}
-            for item in results
-        ]
-        translator = TranslationService(groq)
-        translations = await translator.translate_titles(titles_with_lang)
-
-    data = [_to_match_response(item, translations) for item in results]
-
-    return MatchResultsResponse(
-        data=data,
+    """Build MatchResultsResponse (o la variante brief) with title translations."""
+    translations = await _translate_titles(results, groq)
+
+    # Filas del ORM, de confianza: ni los items ni la lista se revalidan
+    if brief:
+        return MatchResultsBriefResponse.model_construct(
+            data=[_to_match_brief(m, j, translations) for m, j in results],
+            total=total,
+            weights_used=dict(weights),
+            next_cursor=next_cursor,
+        )
+    return MatchResultsResponse.model_construct(
+        data=[_to_match_response(m, j, translations) for m, j in results],
         total=total,
-        weights_used=weights,
+        weights_used=dict(weights),  # model_construct no convierte el mappingproxy
+        next_cursor=next_cursor,
     )
 
 
-@router.get("/results", response_model=MatchResultsResponse)
+@router.get("/results", response_model=MatchResultsResponse | MatchResultsBriefResponse)
 async def get_match_results(
     request: Request,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
     limit: int = Query(20, ge=1, le=3000),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
     translate: bool = Query(True),
+    brief: bool = Query(False, description="Omit explanation, skills and draft"),
 ):
     """Get latest AI match results for the current user.
 
     translate=false omite la traducción de títulos (útil para carga masiva
     de categorización donde las traducciones no son necesarias).
     """
+    after = _decode_cursor(cursor)
     service = MatchResultService(db)
     results, total = await service.get_results(
         user_id=current_user.id,
         limit=limit,
         offset=offset,
+        after=after,
+        brief=brief,
     )
 
-    await db.refresh(current_user, ["profile"])
-    weights = (
-        current_user.profile.score_weights
-        if current_user.profile and current_user.profile.score_weights
-        else DEFAULT_WEIGHTS
-    )
+    weights = _resolve_weights(current_user)
 
     groq = _get_groq(request) if translate else None
-    return await _build_results_response(results, total, weights, groq)
+    return await _build_results_response(
+        results,
+        total,
+        weights,
+        groq,
+        next_cursor=_next_cursor(results, limit),
+        brief=brief,
+    )
 
 
-@router.get("/history", response_model=MatchResultsResponse)
+@router.get("/history", response_model=MatchResultsResponse | MatchResultsBriefResponse)
 async def get_match_history(
     request: Request,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+    brief: bool = Query(False, description="Omit explanation, skills and draft"),
 ):
     """Get full match history for the current user (all past results)."""
+    after = _decode_cursor(cursor)
     service = MatchResultService(db)
     results, total = await service.get_results(
         user_id=current_user.id,
         limit=limit,
         offset=offset,
+        after=after,
+        brief=brief,
     )
 
-    await db.refresh(current_user, ["profile"])
-    weights = (
-        current_user.profile.score_weights
-        if current_user.profile and current_user.profile.score_weights
-        else DEFAULT_WEIGHTS
-    )
+    weights = _resolve_weights(current_user)
 
     groq = _get_groq(request)
-    return await _build_results_response(results, total, weights, groq)
+    return await _build_results_response(
+        results,
+        total,
+        weights,
+        groq,
+        next_cursor=_next_cursor(results, limit),
+        brief=brief,
+    )
 
 
 @router.post("/{job_hash}/feedback", response_model=MatchFeedbackResponse)
@@ -294,12 +381,7 @@ async def get_saved_jobs(
         offset=offset,
     )
 
-    await db.refresh(current_user, ["profile"])
-    weights = (
-        current_user.profile.score_weights
-        if current_user.profile and current_user.profile.score_weights
-        else DEFAULT_WEIGHTS
-    )
+    weights = _resolve_weights(current_user)
 
     groq = _get_groq(request)
     return await _build_results_response(results, total, weights, groq)
@@ -332,3 +414,22 @@ async def submit_implicit_feedback(
         job_hash=job_hash,
         action=body.action,
     )
+
+
+# Registrada al final: GET /{job_hash} no debe capturar /results, /history, /saved
+@router.get("/{job_hash}", response_model=MatchResultResponse)
+async def get_match_result(
+    job_hash: str,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Full match result (explanation, skills, draft flag) for the detail view."""
+    row = await MatchResultService(db).get_result(current_user.id, job_hash)
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Match result not found for this job",
+        )
+    translations = await _translate_titles([row], _get_groq(request))
+    return _to_match_response(*row, translations)
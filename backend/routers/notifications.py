@@ -1,12 +1,14 @@
 """Notification endpoints — SSE stream + history + mark read."""
 
-import asyncio
 import logging
 import uuid
+from collections.abc import AsyncIterator
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-from fastapi.responses import StreamingResponse
-from sqlalchemy import func, select
+from fastapi.sse import EventSourceResponse, ServerSentEvent
+from pydantic import TypeAdapter
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.security import get_current_user
@@ -23,59 +25,52 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/notifications", tags=["notifications"])
 
+# Valida la página entera en una sola llamada (bucle en Rust, schema resuelto una vez)
+_NOTIFICATION_LIST = TypeAdapter(list[NotificationResponse])
 
-@router.get("/stream")
-async def notification_stream(
-    request: Request,
+
+def _stream_user_id(
     token: str = Query(
         ..., description="JWT access token (EventSource can't send headers)"
     ),
-):
+) -> uuid.UUID:
+    """Validate the token before the stream opens, so a bad one gets a plain 401."""
+    from core.security import decode_token
+
+    return decode_token(token, expected_type="access")
+
+
+@router.get("/stream", response_class=EventSourceResponse)
+async def notification_stream(
+    request: Request,
+    user_id: uuid.UUID = Depends(_stream_user_id),
+) -> AsyncIterator[ServerSentEvent]:
     """SSE stream for real-time notifications.
 
     Uses query parameter token since browser EventSource doesn't support headers.
+    FastAPI enmarca los eventos, envía keepalives (": ping") cuando el stream
+    está inactivo y cancela el generador al desconectarse el cliente.
     """
-    from core.security import decode_token
-
-    user_id = decode_token(token, expected_type="access")
-
     sse: SSEManager = request.app.state.sse_manager
 
-    queue = await sse.subscribe(user_id)
-
-    async def event_generator():
-        try:
-            # Send initial connected event
-            yield SSEManager.format_sse("connected", {"user_id": str(user_id)})
-
-            while True:
-                # Check if client disconnected
-                if await request.is_disconnected():
-                    break
-
-                try:
-                    message = await asyncio.wait_for(queue.get(), timeout=30.0)
-                    yield SSEManager.format_sse(
-                        message.get("event", "message"),
-                        message.get("data", {}),
-                    )
-                except asyncio.TimeoutError:
-                    # Send keepalive ping
-                    yield ": keepalive\n\n"
-        except asyncio.CancelledError:
-            pass
-        finally:
-            sse.unsubscribe(user_id, queue)
-
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
-    )
+    subscription = await sse.subscribe(user_id)
+    try:
+        yield ServerSentEvent(
+            event="connected", raw_data=orjson.dumps({"user_id": str(user_id)}).decode()
+        )
+
+        # None = SSEManager cerrado (shutdown)
+        while (message := await subscription.get()) is not None:
+            # raw_data ya viene serializado por SSEManager: FastAPI no vuelve a
+            # pasar el payload por jsonable_encoder + json.dumps
+            raw_data = message.get("raw_data")
+            if raw_data is None:
+                raw_data = orjson.dumps(message.get("data", {})).decode()
+            yield ServerSentEvent(
+                event=message.get("event", "message"), raw_data=raw_data
+            )
+    finally:
+        sse.unsubscribe(user_id, subscription)
 
 
 @router.get("", response_model=NotificationListResponse)
@@ -88,31 +83,40 @@ async def list_notifications(
     """Get paginated notification history."""
     conditions = [Notification.user_id == current_user.id]
 
-    total = (
-        await db.execute(
-            select(func.count()).select_from(Notification).where(*conditions)
-        )
-    ).scalar_one()
-
-    unread_count = (
-        await db.execute(
-            select(func.count())
-            .select_from(Notification)
-            .where(*conditions, Notification.is_read.is_(False))
-        )
-    ).scalar_one()
-
+    # Totales como ventanas sobre el mismo SELECT: 1 roundtrip en lugar de 3.
+    # OVER() se evalúa antes de LIMIT/OFFSET, así que cuentan todo el conjunto.
     stmt = (
-        select(Notification)
+        select(
+            Notification,
+            func.count().over().label("total"),
+            func.count().filter(Notification.is_read.is_(False)).over().label("unread"),
+        )
         .where(*conditions)
         .order_by(Notification.created_at.desc())
         .limit(limit)
         .offset(offset)
     )
-    rows = (await db.execute(stmt)).scalars().all()
+    rows = (await db.execute(stmt)).all()
+
+    if rows:
+        total, unread_count = rows[0].total, rows[0].unread
+    elif offset:
+        # Página fuera de rango: no hay fila que lleve los totales
+        total, unread_count = (
+            await db.execute(
+                select(
+                    func.count(),
+                    func.count().filter(Notification.is_read.is_(False)),
+                ).where(*conditions)
+            )
+        ).one()
+    else:
+        total = unread_count = 0
 
     return NotificationListResponse(
-        data=[NotificationResponse.model_validate(n) for n in rows],
+        data=_NOTIFICATION_LIST.validate_python(
+            [row[0] for row in rows], from_attributes=True
+        ),
         total=total,
         unread_count=unread_count,
     )
@@ -125,12 +129,16 @@ async def mark_notification_read(
     db: AsyncSession = Depends(get_db),
 ):
     """Mark a notification as read."""
+    # UPDATE ... RETURNING: lectura, escritura y fila final en un solo roundtrip
     notification = (
         await db.execute(
-            select(Notification).where(
+            update(Notification)
+            .where(
                 Notification.id == notification_id,
                 Notification.user_id == current_user.id,
             )
+            .values(is_read=True)
+            .returning(Notification)
         )
     ).scalar_one_or_none()
     if notification is None:
@@ -138,9 +146,6 @@ async def mark_notification_read(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Notification not found",
         )
-
-    notification.is_read = True
     await db.commit()
-    await db.refresh(notification)
 
     return NotificationResponse.model_validate(notification)
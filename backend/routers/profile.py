@@ -1,11 +1,25 @@
 """Profile CRUD: preferences, CV upload, GDPR export/delete."""
 
+import asyncio
+import heapq
 import logging
+import os
 from datetime import datetime, timezone
-
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from itertools import pairwise
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Response,
+    UploadFile,
+    status,
+)
+from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from celery_app import celery_app
 from config import settings
 from core.security import get_current_user, verify_password
 from database import get_db
@@ -29,10 +43,8 @@ router = APIRouter(prefix="/api/v1/profile", tags=["profile"])
 @router.get("", response_model=ProfileResponse)
 async def get_profile(
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
 ):
     """Get the authenticated user's complete profile."""
-    await db.refresh(current_user, ["profile"])
     profile = current_user.profile
     if profile is None:
         raise HTTPException(
@@ -41,7 +53,8 @@ async def get_profile(
         )
     resp = ProfileResponse.model_validate(profile)
     resp.has_cv_embedding = profile.cv_embedding is not None
-    return resp
+    # Ya validado: se serializa una vez en lugar de revalidar con response_model
+    return Response(content=resp.model_dump_json(), media_type="application/json")
 
 
 @router.put("", response_model=ProfileResponse)
@@ -51,7 +64,6 @@ async def update_profile(
     db: AsyncSession = Depends(get_db),
 ):
     """Update user profile preferences (partial update)."""
-    await db.refresh(current_user, ["profile"])
     profile = current_user.profile
     if profile is None:
         raise HTTPException(
@@ -71,6 +83,33 @@ async def update_profile(
     return resp
 
 
+def _merge_skills(existing: list[str], extracted: list[str]) -> list[str]:
+    """Une skills sin duplicados, ordenadas sin distinguir mayúsculas.
+
+    ``existing`` suele venir ordenada de la subida anterior: basta un merge
+    lineal con las extraídas (ordenadas aparte) en lugar de reordenar todo.
+    """
+    if any(a.lower() > b.lower() for a, b in pairwise(existing)):
+        # Editadas por PUT /profile sin ordenar
+        return sorted(dict.fromkeys([*existing, *extracted]), key=str.lower)
+
+    merged: list[str] = []
+    group_key: str | None = None
+    group: set[str] = set()
+    # Duplicados exactos quedan en el mismo grupo de clave (lower); solo se
+    # compara dentro del grupo.
+    for skill in heapq.merge(
+        existing, sorted(dict.fromkeys(extracted), key=str.lower), key=str.lower
+    ):
+        key = skill.lower()
+        if key != group_key:
+            group_key, group = key, set()
+        if skill not in group:
+            group.add(skill)
+            merged.append(skill)
+    return merged
+
+
 @router.post("/cv", response_model=CVUploadResponse)
 async def upload_cv(
     file: UploadFile = File(...),
@@ -85,16 +124,20 @@ async def upload_cv(
             detail=f"Unsupported file type: {file.content_type}. Allowed: PDF, DOCX",
         )
 
-    # Read and validate size
-    file_bytes = await file.read()
+    # Starlette ya ha volcado el multipart a un SpooledTemporaryFile (a disco
+    # por encima de 1 MB): se valida el tamaño sin cargar el fichero en RAM.
+    size = file.size
+    if size is None:
+        file.file.seek(0, os.SEEK_END)
+        size = file.file.tell()
     max_bytes = settings.CV_MAX_SIZE_MB * 1024 * 1024
-    if len(file_bytes) > max_bytes:
+    if size > max_bytes:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
             detail=f"File too large. Maximum: {settings.CV_MAX_SIZE_MB} MB",
         )
 
-    if len(file_bytes) == 0:
+    if size == 0:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Empty file",
@@ -104,7 +147,9 @@ async def upload_cv(
     from services.cv_parser import CVParser
 
     try:
-        raw_text = CVParser.extract_text(file_bytes, file.content_type)
+        raw_text = await asyncio.to_thread(
+            CVParser.extract_text_from_stream, file.file, file.content_type
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -121,22 +166,25 @@ async def upload_cv(
     skills = CVParser.extract_skills(cleaned_text)
 
     # Update profile
-    await db.refresh(current_user, ["profile"])
     profile = current_user.profile
     profile.cv_text = cleaned_text
-    # Merge extracted skills with existing ones
-    existing_skills = set(profile.skills or [])
-    existing_skills.update(skills)
-    profile.skills = sorted(existing_skills)
+    # Solo se toca la columna JSONB si el merge aporta algo: sin cambios, el
+    # UPDATE lleva únicamente cv_text.
+    if skills:
+        merged = _merge_skills(profile.skills or [], skills)
+        if merged != profile.skills:
+            profile.skills = merged
 
     await db.commit()
 
     # Dispatch embedding generation task
     task_id = None
     try:
-        from tasks.embedding_tasks import generate_profile_embedding
-
-        result = generate_profile_embedding.delay(str(current_user.id))
+        # Por nombre: el proceso web no importa tasks.embedding_tasks (modelo y
+        # clientes pesados). task_routes lo envía a la cola "ai".
+        result = celery_app.send_task(
+            "tasks.ai.generate_profile_embedding", args=[str(current_user.id)]
+        )
         task_id = result.id
     except Exception:
         logger.warning("Failed to dispatch embedding task for user %s", current_user.id)
@@ -155,7 +203,6 @@ async def delete_cv(
     db: AsyncSession = Depends(get_db),
 ):
     """Delete CV text and embedding from the user's profile."""
-    await db.refresh(current_user, ["profile"])
     profile = current_user.profile
     if profile is None:
         raise HTTPException(
@@ -176,11 +223,8 @@ async def delete_cv(
 @router.get("/export", response_model=UserExport)
 async def export_user_data(
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
 ):
     """GDPR data portability: export all user data as JSON."""
-    await db.refresh(current_user, ["profile"])
-
     profile_data = None
     if current_user.profile:
         profile_data = ProfileData.model_validate(current_user.profile)
@@ -220,7 +264,10 @@ async def delete_all_user_data(
     user_id = current_user.id
     now = datetime.now(timezone.utc)
 
-    await db.delete(current_user)
+    # Un solo DELETE: las FKs a users.id son ON DELETE CASCADE, así que
+    # Postgres borra el resto sin que el ORM cargue cada colección.
+    db.expunge(current_user)
+    await db.execute(delete(User).where(User.id == user_id))
     await db.commit()
 
     return DeleteConfirmation(
@@ -4,6 +4,7 @@ import logging
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -22,6 +23,8 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/searches", tags=["saved_searches"])
 
+_SAVED_SEARCH_LIST = TypeAdapter(list[SavedSearchResponse])
+
 
 @router.get("", response_model=SavedSearchListResponse)
 async def list_saved_searches(
@@ -33,23 +36,32 @@ async def list_saved_searches(
     """List user's saved searches."""
     conditions = [SavedSearch.user_id == current_user.id]
 
-    total = (
-        await db.execute(
-            select(func.count()).select_from(SavedSearch).where(*conditions)
-        )
-    ).scalar_one()
-
+    # total como ventana sobre el mismo SELECT: 1 roundtrip en lugar de 2
     stmt = (
-        select(SavedSearch)
+        select(SavedSearch, func.count().over().label("total"))
         .where(*conditions)
         .order_by(SavedSearch.created_at.desc())
         .limit(limit)
         .offset(offset)
     )
-    rows = (await db.execute(stmt)).scalars().all()
+    rows = (await db.execute(stmt)).all()
+
+    if rows:
+        total = rows[0].total
+    elif offset:
+        # Página fuera de rango: no hay fila que lleve el total
+        total = (
+            await db.execute(
+                select(func.count()).select_from(SavedSearch).where(*conditions)
+            )
+        ).scalar_one()
+    else:
+        total = 0
 
     return SavedSearchListResponse(
-        data=[SavedSearchResponse.model_validate(s) for s in rows],
+        data=_SAVED_SEARCH_LIST.validate_python(
+            [row[0] for row in rows], from_attributes=True
+        ),
         total=total,
     )
 
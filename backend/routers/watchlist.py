@@ -144,8 +144,6 @@ async def generate_draft(
             detail="This job is not part of the watchlist (no school metadata).",
         )
 
-    # Resolver perfil del usuario para placeholders
-    await db.refresh(current_user, ["profile"])
     profile = current_user.profile
 
     template_id = body.template_override or school.template_id
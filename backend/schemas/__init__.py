@@ -20,9 +20,9 @@ from schemas.auth import (
     UserResponse,
 )
 from schemas.job import (
-    JobBrief,
     JobCreate,
     JobResponse,
+    JobSearchCard,
     JobSearchResponse,
     JobStats,
     SalaryStats,
@@ -62,9 +62,9 @@ __all__ = [
     "CVDeleteResponse",
     "CVUploadResponse",
     "DeleteConfirmation",
-    "JobBrief",
     "JobCreate",
     "JobResponse",
+    "JobSearchCard",
     "JobSearchResponse",
     "JobStats",
     "NotificationListResponse",
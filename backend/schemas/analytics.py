@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -28,7 +29,7 @@ class PatternSuggestionsResponse(BaseModel):
 
 
 class ReviewSuggestionRequest(BaseModel):
-    action: str = Field(pattern=r"^(approve|reject)$")
+    action: Literal["approve", "reject"]
 
 
 class ReviewSuggestionResponse(BaseModel):
@@ -57,7 +58,7 @@ class JobFiltersResponse(BaseModel):
 
 
 class CreateFilterRequest(BaseModel):
-    filter_type: str = Field(pattern=r"^(title_contains|tag_contains)$")
+    filter_type: Literal["title_contains", "tag_contains"]
     pattern: str = Field(min_length=2, max_length=200)
     description: str | None = Field(default=None, max_length=500)
 
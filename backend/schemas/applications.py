@@ -6,12 +6,13 @@ from datetime import datetime
 from pydantic import BaseModel, ConfigDict, Field
 
 from models.enums import ApplicationStatus
+from schemas.job import JobHash
 
 
 class ApplicationCreate(BaseModel):
     """Request body for POST /api/v1/applications."""
 
-    job_hash: str = Field(..., max_length=32)
+    job_hash: JobHash
     notes: str | None = Field(None, max_length=2000)
 
 
@@ -27,7 +28,7 @@ class ApplicationUpdate(BaseModel):
 class ApplicationResponse(BaseModel):
     """Single application with denormalized job info."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: uuid.UUID
     user_id: uuid.UUID
@@ -5,8 +5,11 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 from enum import Enum
+from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
+
+from schemas.job import JobHash
 
 
 class DocType(str, Enum):
@@ -17,9 +20,9 @@ class DocType(str, Enum):
 class GenerateDocumentRequest(BaseModel):
     """Request body for POST /api/v1/documents/generate."""
 
-    job_hash: str = Field(..., max_length=32)
+    job_hash: JobHash
     doc_type: DocType
-    language: str = Field("en", max_length=5, pattern=r"^(en|de|fr|it)$")
+    language: Literal["en", "de", "fr", "it"] = "en"
 
 
 class GeneratedDocumentResponse(BaseModel):
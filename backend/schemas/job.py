@@ -1,8 +1,13 @@
 """Pydantic schemas for Job entities."""
 
 from datetime import datetime
+from typing import Annotated
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator
+
+# Hash de oferta tal como lo genera BaseJobProvider.compute_hash (md5 hex);
+# el patrón se valida en pydantic-core antes de llegar a la BD
+JobHash = Annotated[str, StringConstraints(pattern=r"^[0-9a-f]{32}$")]
 
 
 class JobBase(BaseModel):
@@ -43,6 +48,8 @@ class JobResponse(JobBase):
 
     hash: str
     source: str
+    # Los datetime se serializan a ISO-8601 dentro de pydantic-core (Rust): un
+    # PlainSerializer(datetime.isoformat) añadiría una llamada Python por campo.
     first_seen_at: datetime
     last_seen_at: datetime
     is_active: bool
@@ -50,10 +57,17 @@ class JobResponse(JobBase):
     duplicate_of: str | None = None
 
 
-class JobBrief(BaseModel):
-    """Lightweight schema for search results / listing."""
+# Tags mostrados en cada tarjeta de resultados
+SEARCH_CARD_MAX_TAGS = 5
 
-    model_config = ConfigDict(from_attributes=True)
+
+class JobSearchCard(BaseModel):
+    """Search result card: only the fields the listing renders.
+
+    The full record (url, description, logo...) is served by ``GET /jobs/{hash}``.
+    """
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     hash: str
     title: str
@@ -61,7 +75,6 @@ class JobBrief(BaseModel):
     location: str | None = None
     canton: str | None = None
     description_snippet: str | None = None
-    url: str
     salary_min_chf: int | None = None
     salary_max_chf: int | None = None
     remote: bool = False
@@ -70,15 +83,17 @@ class JobBrief(BaseModel):
     contract_type: str | None = None
     tags: list[str] = Field(default_factory=list)
     source: str
-    logo: str | None = None
-    first_seen_at: datetime
-    is_active: bool
+
+    @field_validator("tags")
+    @classmethod
+    def top_tags(cls, v: list[str]) -> list[str]:
+        return v[:SEARCH_CARD_MAX_TAGS]
 
 
 class JobSearchResponse(BaseModel):
     """Paginated search response."""
 
-    data: list[JobBrief]
+    data: list[JobSearchCard]
     total: int
     limit: int
     offset: int
@@ -2,6 +2,7 @@
 
 import uuid
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -22,27 +23,17 @@ class MatchScoreBreakdown(BaseModel):
     llm: float = 0.0
 
 
-class MatchResultResponse(BaseModel):
-    """Single match result with job summary."""
+class MatchResultBrief(BaseModel):
+    """Match result as shown in list views (?brief=true): no LLM text or skills."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: uuid.UUID
     job_hash: str
     score_final: float
     scores: MatchScoreBreakdown
-    explanation: str | None = None
-    matching_skills: list[str] = Field(default_factory=list)
-    missing_skills: list[str] = Field(default_factory=list)
     feedback: str | None = None
-
-    # Watchlist colegios suizos: state machine + urgency boost + carta
-    application_status: str = "detected"
-    urgency_score: float = 0.0
-    has_draft: bool = False
     school_id: str | None = None  # Si pertenece a la watchlist, slug del colegio
-    school_policy: str | None = None  # direct_email_ok, portal_only, etc.
-
     created_at: datetime
 
     # Denormalized job fields for display
@@ -52,7 +43,6 @@ class MatchResultResponse(BaseModel):
     job_company: str | None = None
     job_location: str | None = None
     job_url: str | None = None
-    job_description: str | None = None  # snippet corto para la tarjeta
     job_salary_min: int | None = None
     job_salary_max: int | None = None
     job_tags: list[str] = Field(default_factory=list)
@@ -60,16 +50,36 @@ class MatchResultResponse(BaseModel):
     job_category: str | None = None  # A–M o "otros"
 
 
+class MatchResultResponse(MatchResultBrief):
+    """Single match result with job summary."""
+
+    explanation: str | None = None
+    matching_skills: list[str] = Field(default_factory=list)
+    missing_skills: list[str] = Field(default_factory=list)
+
+    # Watchlist colegios suizos: state machine + urgency boost + carta
+    application_status: str = "detected"
+    urgency_score: float = 0.0
+    has_draft: bool = False
+    school_policy: str | None = None  # direct_email_ok, portal_only, etc.
+
+    job_description: str | None = None  # snippet corto para la tarjeta
+
+
 class ApplicationStatusRequest(BaseModel):
     """Cambio de estado en el state machine de candidatura."""
 
-    application_status: str = Field(
-        ...,
-        pattern=(
-            r"^(detected|reviewed|drafted|sent|awaiting|followup_due|"
-            r"interview|closed_positive|closed_negative)$"
-        ),
-    )
+    application_status: Literal[
+        "detected",
+        "reviewed",
+        "drafted",
+        "sent",
+        "awaiting",
+        "followup_due",
+        "interview",
+        "closed_positive",
+        "closed_negative",
+    ]
 
 
 class ApplicationStatusResponse(BaseModel):
@@ -81,9 +91,7 @@ class ApplicationStatusResponse(BaseModel):
 class GenerateDraftRequest(BaseModel):
     """Solicita generar borrador de carta a partir de plantilla del colegio."""
 
-    template_override: str | None = Field(
-        default=None, pattern=r"^[AB]$"
-    )  # Si se pasa, ignora school.template_id
+    template_override: Literal["A", "B"] | None = None  # Ignora school.template_id
 
 
 class GenerateDraftResponse(BaseModel):
@@ -106,12 +114,23 @@ class MatchResultsResponse(BaseModel):
     data: list[MatchResultResponse]
     total: int
     weights_used: dict[str, float]
+    # Keyset cursor for the next page (pass as ?cursor=); None on the last page
+    next_cursor: str | None = None
+
+
+class MatchResultsBriefResponse(BaseModel):
+    """Paginated match results with ?brief=true."""
+
+    data: list[MatchResultBrief]
+    total: int
+    weights_used: dict[str, float]
+    next_cursor: str | None = None
 
 
 class MatchFeedbackRequest(BaseModel):
     """Request body for POST /api/v1/match/{job_hash}/feedback."""
 
-    feedback: str = Field(..., pattern=r"^(thumbs_up|thumbs_down|applied|dismissed)$")
+    feedback: Literal["thumbs_up", "thumbs_down", "applied", "dismissed"]
 
 
 class MatchFeedbackResponse(BaseModel):
@@ -125,10 +144,7 @@ class MatchFeedbackResponse(BaseModel):
 class ImplicitFeedbackRequest(BaseModel):
     """Request body for POST /api/v1/match/{job_hash}/implicit."""
 
-    action: str = Field(
-        ...,
-        pattern=r"^(opened|view_time|saved|applied|dismissed|skipped)$",
-    )
+    action: Literal["opened", "view_time", "saved", "applied", "dismissed", "skipped"]
     duration_ms: int | None = Field(default=None, ge=0)
 
 
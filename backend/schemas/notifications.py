@@ -9,7 +9,7 @@ from pydantic import BaseModel, ConfigDict
 class NotificationResponse(BaseModel):
     """Single notification."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: uuid.UUID
     event_type: str
@@ -1,7 +1,16 @@
 import uuid
 from datetime import datetime
-
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from typing import Annotated, Literal
+
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    field_validator,
+    model_validator,
+)
 
 from models.enums import RemotePreference
 
@@ -23,18 +32,39 @@ class ProfileData(BaseModel):
     updated_at: datetime
 
 
+# Strip en pydantic-core; los elementos vacíos se descartan en validate_list_items
+_ListItem = Annotated[str, StringConstraints(strip_whitespace=True)]
+_ItemList = Annotated[list[_ListItem], Field(max_length=50)]
+_WeightKey = Literal["embedding", "salary", "location", "recency", "llm", "language"]
+
+
+def _check_weights_sum(v: dict[str, float]) -> dict[str, float]:
+    total = sum(v.values())
+    if abs(total - 1.0) > 0.01:
+        raise ValueError(f"Weights must sum to 1.0, got {total}")
+    return v
+
+
+# Claves y rangos se validan en pydantic-core; en Python solo queda la suma,
+# y solo cuando llega un dict (None no pasa por el validador)
+_ScoreWeights = Annotated[
+    dict[_WeightKey, Annotated[float, Field(ge=0, le=1)]],
+    AfterValidator(_check_weights_sum),
+]
+
+
 class ProfileUpdate(BaseModel):
     """Schema for PUT /api/v1/profile — update user preferences."""
 
     title: str | None = Field(None, max_length=200)
-    skills: list[str] | None = None
+    skills: _ItemList | None = None
     experience_years: int | None = Field(None, ge=0, le=50)
-    languages: list[str] | None = None
-    locations: list[str] | None = None
+    languages: _ItemList | None = None
+    locations: _ItemList | None = None
     salary_min: int | None = Field(None, ge=0)
     salary_max: int | None = Field(None, ge=0)
     remote_pref: RemotePreference | None = None
-    score_weights: dict[str, float] | None = None
+    score_weights: _ScoreWeights | None = None
     watchlist_schools_enabled: bool | None = None
 
     @model_validator(mode="after")
@@ -47,29 +77,10 @@ class ProfileUpdate(BaseModel):
             raise ValueError("salary_min must be <= salary_max")
         return self
 
-    @field_validator("score_weights")
-    @classmethod
-    def validate_weights(cls, v):
-        if v is None:
-            return v
-        valid_keys = {"embedding", "salary", "location", "recency", "llm", "language"}
-        if not set(v.keys()).issubset(valid_keys):
-            raise ValueError(f"Invalid weight keys. Allowed: {valid_keys}")
-        if any(not (0 <= val <= 1) for val in v.values()):
-            raise ValueError("Each weight must be between 0 and 1")
-        total = sum(v.values())
-        if not (0.99 <= total <= 1.01):
-            raise ValueError(f"Weights must sum to 1.0, got {total}")
-        return v
-
     @field_validator("skills", "languages", "locations")
     @classmethod
     def validate_list_items(cls, v):
-        if v is None:
-            return v
-        if len(v) > 50:
-            raise ValueError("Maximum 50 items allowed")
-        return [item.strip() for item in v if item.strip()]
+        return v if v is None else [item for item in v if item]
 
 
 class ProfileResponse(BaseModel):
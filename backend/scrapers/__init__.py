@@ -1,67 +1,73 @@
-"""Scraper registry: discover and instantiate all HTML-scraping providers."""
+"""Scraper registry: discover and instantiate all HTML-scraping providers.
+
+Los módulos de scraping (bs4, soupsieve, parsers...) se importan bajo
+demanda: importar el registry solo para listar nombres no los carga.
+"""
+
+import importlib
 
-from scrapers.financejobs import FinancejobsScraper
-from scrapers.gastrojob import GastrojobScraper
-from scrapers.irishjobs import IrishJobsScraper
-from scrapers.myscience import MyScienceScraper
-from scrapers.schuljobs import SchulJobsScraper
-from scrapers.stelle_admin import StelleAdminScraper
-from scrapers.swiss_schools_ecolint import SwissSchoolsEcolintScraper
-from scrapers.swiss_schools_hautlac import SwissSchoolsHautLacScraper
-from scrapers.swiss_schools_inspired import SwissSchoolsInspiredScraper
-from scrapers.swiss_schools_isb import SwissSchoolsISBScraper
-from scrapers.swiss_schools_iscs import SwissSchoolsISCSScraper
-from scrapers.swiss_schools_isp import SwissSchoolsISPScraper
-from scrapers.swiss_schools_nae import SwissSchoolsNAEScraper
-from scrapers.swiss_schools_zis import SwissSchoolsZISScraper
-from scrapers.tes import TESScraper
 from services.job_service import BaseJobProvider
 
-_SCRAPER_CLASSES: dict[str, type[BaseJobProvider]] = {
-    "gastrojob": GastrojobScraper,
-    "stelle_admin": StelleAdminScraper,
-    "tes": TESScraper,
-    "schuljobs": SchulJobsScraper,
+# Registry: nombre → "módulo:Clase", resuelto en el primer uso
+_SCRAPER_PATHS: dict[str, str] = {
+    "gastrojob": "scrapers.gastrojob:GastrojobScraper",
+    "stelle_admin": "scrapers.stelle_admin:StelleAdminScraper",
+    "tes": "scrapers.tes:TESScraper",
+    "schuljobs": "scrapers.schuljobs:SchulJobsScraper",
     # Reactivados gracias a la capa anti-detección (scraper_stealth): con las
     # cabeceras realistas (client hints + Sec-Fetch) ambos vuelven a devolver
     # HTTP 200 con datos. Sonda en vivo: myscience ~14 jobs/pág, financejobs ~10.
-    "myscience": MyScienceScraper,
-    "financejobs": FinancejobsScraper,
+    "myscience": "scrapers.myscience:MyScienceScraper",
+    "financejobs": "scrapers.financejobs:FinancejobsScraper",
     # Irlanda: IrishJobs.ie + Jobs.ie (misma plataforma StepStone, SSR
     # __PRELOADED_STATE__; remoto derivado del scope /jobs/work-from-home)
-    "irishjobs": IrishJobsScraper,
+    "irishjobs": "scrapers.irishjobs:IrishJobsScraper",
     # medjobs (med-jobs.com) SIGUE deshabilitado: está tras un challenge duro de
     # Cloudflare (/cdn-cgi/challenge-platform) que el Playwright endurecido local
     # NO supera. Requiere un browser stealth remoto de pago vía CDP
     # (settings.SCRAPER_BROWSER_CDP_URL). Reactívalo solo con ese opt-in.
     # Watchlist Fase 1: portales centralizados (NAE + ISP + Inspired)
-    "swiss_schools_nae": SwissSchoolsNAEScraper,
-    "swiss_schools_isp": SwissSchoolsISPScraper,
-    "swiss_schools_inspired": SwissSchoolsInspiredScraper,
+    "swiss_schools_nae": "scrapers.swiss_schools_nae:SwissSchoolsNAEScraper",
+    "swiss_schools_isp": "scrapers.swiss_schools_isp:SwissSchoolsISPScraper",
+    "swiss_schools_inspired": "scrapers.swiss_schools_inspired:SwissSchoolsInspiredScraper",
     # Watchlist Fase 2: Group A propios (ZIS + ISB + Ecolint)
-    "swiss_schools_zis": SwissSchoolsZISScraper,
-    "swiss_schools_isb": SwissSchoolsISBScraper,
-    "swiss_schools_ecolint": SwissSchoolsEcolintScraper,
+    "swiss_schools_zis": "scrapers.swiss_schools_zis:SwissSchoolsZISScraper",
+    "swiss_schools_isb": "scrapers.swiss_schools_isb:SwissSchoolsISBScraper",
+    "swiss_schools_ecolint": "scrapers.swiss_schools_ecolint:SwissSchoolsEcolintScraper",
     # Watchlist Fase 3: HTML propio menores (Haut-Lac + ISCS)
     # Riviera, Verbier, ISR quedan como "manual": Riviera no expone jobs
     # en HTML estático; Verbier solo enlaza a TES (ya cubierto); ISR usa
     # SPA AbaServices que requeriría Playwright para ~1 vacante.
-    "swiss_schools_hautlac": SwissSchoolsHautLacScraper,
-    "swiss_schools_iscs": SwissSchoolsISCSScraper,
+    "swiss_schools_hautlac": "scrapers.swiss_schools_hautlac:SwissSchoolsHautLacScraper",
+    "swiss_schools_iscs": "scrapers.swiss_schools_iscs:SwissSchoolsISCSScraper",
 }
 
+# Clases ya importadas
+_RESOLVED: dict[str, type[BaseJobProvider]] = {}
+
+
+def _resolve(name: str) -> type[BaseJobProvider]:
+    """Import (once) and return the scraper class registered as ``name``."""
+    cls = _RESOLVED.get(name)
+    if cls is None:
+        module_path, cls_name = _SCRAPER_PATHS[name].split(":")
+        cls = getattr(importlib.import_module(module_path), cls_name)
+        _RESOLVED[name] = cls
+    return cls
+
 
 def get_all_scrapers() -> list[BaseJobProvider]:
     """Return instances of all registered scrapers."""
-    return [cls() for cls in _SCRAPER_CLASSES.values()]
+    return [_resolve(name)() for name in _SCRAPER_PATHS]
 
 
 def get_scraper(name: str) -> BaseJobProvider | None:
     """Return a single scraper instance by name, or None."""
-    cls = _SCRAPER_CLASSES.get(name)
-    return cls() if cls else None
+    if name not in _SCRAPER_PATHS:
+        return None
+    return _resolve(name)()
 
 
 def get_scraper_names() -> list[str]:
     """Return all registered scraper names."""
-    return list(_SCRAPER_CLASSES.keys())
+    return list(_SCRAPER_PATHS.keys())
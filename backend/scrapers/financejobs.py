@@ -4,9 +4,9 @@ Uses Next.js __NEXT_DATA__ embedded JSON rather than DOM scraping,
 which is more reliable than CSS selectors on styled-components.
 """
 
-import json
 import logging
 
+import orjson
 from bs4 import BeautifulSoup
 
 from services.scraper_engine import BaseScraper
@@ -37,20 +37,19 @@ class FinancejobsScraper(BaseScraper):
             return []
 
         try:
-            data = json.loads(script_el.string)
-        except json.JSONDecodeError as e:
+            # orjson solo acepta str exacto, no la subclase NavigableString
+            data = orjson.loads(str(script_el.string))
+        except orjson.JSONDecodeError as e:
             logger.error("financejobs: failed to parse __NEXT_DATA__: %s", e)
             return []
 
         # Navigate the Next.js data structure (verified 2026-02-28)
         # Path: props.initialProps.pageProps.jobsSSR.jobs
-        jobs_data = (
-            data.get("props", {})
-            .get("initialProps", {})
-            .get("pageProps", {})
-            .get("jobsSSR", {})
-            .get("jobs", [])
-        )
+        try:
+            jobs_data = data["props"]["initialProps"]["pageProps"]["jobsSSR"]["jobs"]
+        except (KeyError, TypeError):
+            logger.warning("financejobs: unexpected __NEXT_DATA__ layout")
+            return []
 
         stubs: list[dict] = []
         for job in jobs_data:
@@ -91,11 +90,13 @@ class FinancejobsScraper(BaseScraper):
         return {}
 
     def normalize_job(self, raw: dict) -> dict:
-        title = raw.get("title", "").strip()
-        company = raw.get("company", "Unknown").strip()
-        url = raw.get("url", "").strip()
+        # parse_listing_page ya deja title/company/location limpios y la url se
+        # construye desde el jobId: no se vuelve a hacer strip()
+        title = raw["title"]
+        company = raw.get("company", "Unknown")
+        url = raw["url"]
         description = raw.get("description", "")
-        location = raw.get("location", "Switzerland").strip()
+        location = raw.get("location", "Switzerland")
 
         tags = extract_job_skills(title, description)
 
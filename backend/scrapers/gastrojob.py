@@ -6,15 +6,41 @@ so this scraper also checks for JSON API endpoints.
 
 import logging
 
+import soupsieve
 from bs4 import BeautifulSoup
 
-from services.scraper_engine import BaseScraper
+from services.scraper_engine import BaseScraper, PrioritySelector
+from utils.http import absolute_url
 from utils.text import extract_canton, extract_job_skills, strip_html_tags
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://www.gastrojob.ch"
 
+_LISTING_ITEM = PrioritySelector(
+    ".job-item",
+    ".job-list-item",
+    ".stellenangebot",
+    "article.job",
+    ".teaser-job",
+    ".list-group-item",
+)
+_JOB_LINK = soupsieve.compile(
+    'a[href*="/stelle/"], a[href*="/job/"], a[href*="/detail/"]'
+)
+_RECORD_TITLE = soupsieve.compile("h2, h3, h4, .title, a")
+_RECORD_LINK = soupsieve.compile("a[href]")
+_RECORD_COMPANY = soupsieve.compile(".company, .employer, .firma")
+_RECORD_LOCATION = soupsieve.compile(".location, .ort, .region")
+
+# Detalle; la descripción también por prioridad
+_DETAIL_DESCRIPTION_PATTERNS = tuple(
+    soupsieve.compile(s)
+    for s in (".job-detail", ".stellenbeschreibung", "article", ".content")
+)
+_DETAIL_COMPANY = soupsieve.compile(".company-name, .arbeitgeber, h2.company")
+_DETAIL_LOCATION = soupsieve.compile(".arbeitsort, .location")
+
 
 class GastrojobScraper(BaseScraper):
     SOURCE_NAME = "gastrojob"
@@ -38,35 +64,16 @@ class GastrojobScraper(BaseScraper):
         """
         stubs: list[dict] = []
 
-        # Strategy 1: look for common job listing selectors
-        selectors = [
-            ".job-item",
-            ".job-list-item",
-            ".stellenangebot",
-            "article.job",
-            ".teaser-job",
-            ".list-group-item",
-        ]
-
-        records = []
-        for sel in selectors:
-            records = soup.select(sel)
-            if records:
-                break
+        # Strategy 1: structured listing items, by selector priority
+        records = _LISTING_ITEM.first_matching(soup)
 
         # Strategy 2: fallback to <a> links with job-like href patterns
         if not records:
-            for link in soup.select("a[href]"):
+            for link in _JOB_LINK.select(soup):
                 href = link.get("href", "")
                 text = link.get_text(strip=True)
-                if (
-                    text
-                    and len(text) > 10
-                    and any(p in href for p in ["/stelle/", "/job/", "/detail/"])
-                ):
-                    detail_url = (
-                        href if href.startswith("http") else f"{BASE_URL}{href}"
-                    )
+                if text and len(text) > 10:
+                    detail_url = absolute_url(BASE_URL, href)
                     stubs.append(
                         {
                             "title": text,
@@ -79,7 +86,7 @@ class GastrojobScraper(BaseScraper):
 
         # Process records found via selectors
         for record in records:
-            title_el = record.select_one("h2, h3, h4, .title, a")
+            title_el = _RECORD_TITLE.select_one(record)
             if not title_el:
                 continue
 
@@ -88,20 +95,20 @@ class GastrojobScraper(BaseScraper):
                 continue
 
             # Find the link
-            link_el = record.select_one("a[href]") or title_el
+            link_el = _RECORD_LINK.select_one(record) or title_el
             href = link_el.get("href", "") if link_el.name == "a" else ""
             if not href:
                 link_el = record.find("a", href=True)
                 href = link_el["href"] if link_el else ""
 
-            detail_url = href if href.startswith("http") else f"{BASE_URL}{href}"
+            detail_url = absolute_url(BASE_URL, href)
 
             # Company
-            company_el = record.select_one(".company, .employer, .firma")
+            company_el = _RECORD_COMPANY.select_one(record)
             company = company_el.get_text(strip=True) if company_el else "Unknown"
 
             # Location
-            loc_el = record.select_one(".location, .ort, .region")
+            loc_el = _RECORD_LOCATION.select_one(record)
             location = loc_el.get_text(strip=True) if loc_el else ""
 
             stubs.append(
@@ -121,8 +128,8 @@ class GastrojobScraper(BaseScraper):
         detail: dict = {}
 
         # Description: look for common content containers
-        for sel in [".job-detail", ".stellenbeschreibung", "article", ".content"]:
-            desc_el = soup.select_one(sel)
+        for pattern in _DETAIL_DESCRIPTION_PATTERNS:
+            desc_el = pattern.select_one(soup)
             if desc_el:
                 detail["description"] = strip_html_tags(
                     desc_el.get_text(separator="\n", strip=True)
@@ -130,23 +137,25 @@ class GastrojobScraper(BaseScraper):
                 break
 
         # Company from meta or heading
-        company_el = soup.select_one(".company-name, .arbeitgeber, h2.company")
+        company_el = _DETAIL_COMPANY.select_one(soup)
         if company_el:
             detail["company"] = company_el.get_text(strip=True)
 
         # Location
-        loc_el = soup.select_one(".arbeitsort, .location")
+        loc_el = _DETAIL_LOCATION.select_one(soup)
         if loc_el:
             detail["location"] = loc_el.get_text(strip=True)
 
         return detail
 
     def normalize_job(self, raw: dict) -> dict:
-        title = raw.get("title", "").strip()
-        company = raw.get("company", "Unknown").strip()
-        url = raw.get("url", "").strip()
+        # title/company/location llegan de get_text(strip=True); el href no
+        # se normaliza en origen, así que la url sí se limpia
+        title = raw["title"]
+        company = raw.get("company", "Unknown")
+        url = raw["url"].strip()
         description = raw.get("description", "")
-        location = raw.get("location", "Switzerland").strip()
+        location = raw.get("location", "Switzerland")
 
         tags = extract_job_skills(title, description)
 
@@ -20,6 +20,7 @@ from bs4 import BeautifulSoup
 
 from services.circuit_breaker import CircuitBreakerOpen
 from services.scraper_engine import BaseScraper
+from utils.http import absolute_url
 from utils.text import extract_canton, extract_job_skills, strip_html_tags
 
 logger = logging.getLogger(__name__)
@@ -190,7 +191,7 @@ class IrishJobsScraper(BaseScraper):
             if not title or not rel_url:
                 continue  # se descartaría luego; evitamos crear stubs inservibles
 
-            url = rel_url if rel_url.startswith("http") else f"{host}{rel_url}"
+            url = absolute_url(host, rel_url)
             description = strip_html_tags(item.get("textSnippet") or "")
             # Solo currency+period del display; los importes vienen en EUR/GBP y la
             # conversión a CHF + anualización la hace DataNormalizer.normalize_salary
@@ -5,16 +5,50 @@ Cloudflare-protected — requires Playwright headless browser.
 
 import logging
 
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, Tag
 
-from services.scraper_engine import BaseScraper
+from services.scraper_engine import BaseScraper, PrioritySelector
 from services.scraper_stealth import realistic_headers
-from utils.text import extract_canton, extract_job_skills, strip_html_tags
+from utils.http import absolute_url
+from utils.text import collapse_whitespace, extract_canton, extract_job_skills
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://www.med-jobs.com"
 
+_LISTING_ITEM = PrioritySelector(
+    ".job-item",
+    ".stellenangebot",
+    ".job-listing",
+    "article.job",
+    ".search-result-item",
+    "tr.job-row",
+    ".list-group-item",
+)
+_JOB_LINK = soupsieve.compile(
+    'a[href*="/stelle/"], a[href*="/job/"], a[href*="/detail/"], '
+    'a[href*="/stellenangebot/"], a[href*="/vacancy/"]'
+)
+_RECORD_TITLE = soupsieve.compile("h2, h3, h4, .title, .job-title, a")
+_RECORD_LINK = soupsieve.compile("a[href]")
+_RECORD_COMPANY = soupsieve.compile(".company, .employer, .arbeitgeber, .firma")
+_RECORD_LOCATION = soupsieve.compile(".location, .ort, .arbeitsort")
+
+# Detalle; la descripción también por prioridad
+_DETAIL_DESCRIPTION_PATTERNS = tuple(
+    soupsieve.compile(s)
+    for s in (
+        ".job-description",
+        ".stellenbeschreibung",
+        ".detail-content",
+        "article",
+        ".content-main",
+    )
+)
+_DETAIL_COMPANY = soupsieve.compile(".company-name, .arbeitgeber, h2.employer")
+_DETAIL_LOCATION = soupsieve.compile(".arbeitsort, .location, .standort")
+
 
 class MedJobsScraper(BaseScraper):
     SOURCE_NAME = "medjobs"
@@ -39,59 +73,19 @@ class MedJobsScraper(BaseScraper):
 
     def parse_listing_page(self, soup: BeautifulSoup) -> list[dict]:
         """Extract job stubs from med-jobs.com listing page."""
-        stubs: list[dict] = []
+        records = _LISTING_ITEM.first_matching(soup)
+        if records:
+            return self._parse_records(records)
 
-        # Common job listing selectors for medical job portals
-        selectors = [
-            ".job-item",
-            ".stellenangebot",
-            ".job-listing",
-            "article.job",
-            ".search-result-item",
-            "tr.job-row",
-            ".list-group-item",
-        ]
-
-        records = []
-        for sel in selectors:
-            records = soup.select(sel)
-            if records:
-                break
+        # Fallback (solo sin tarjetas estructuradas): links con pinta de oferta
+        return self._parse_job_links(soup)
 
-        # Fallback: find links with job-like patterns
-        if not records:
-            for link in soup.select("a[href]"):
-                href = link.get("href", "")
-                text = link.get_text(strip=True)
-                if (
-                    text
-                    and len(text) > 10
-                    and any(
-                        p in href
-                        for p in [
-                            "/stelle/",
-                            "/job/",
-                            "/detail/",
-                            "/stellenangebot/",
-                            "/vacancy/",
-                        ]
-                    )
-                ):
-                    detail_url = (
-                        href if href.startswith("http") else f"{BASE_URL}{href}"
-                    )
-                    stubs.append(
-                        {
-                            "title": text,
-                            "company": "Unknown",
-                            "location": "",
-                            "detail_url": detail_url,
-                            "url": detail_url,
-                        }
-                    )
+    def _parse_records(self, records: list[Tag]) -> list[dict]:
+        """Build stubs from structured listing items."""
+        stubs: list[dict] = []
 
         for record in records:
-            title_el = record.select_one("h2, h3, h4, .title, .job-title, a")
+            title_el = _RECORD_TITLE.select_one(record)
             if not title_el:
                 continue
 
@@ -99,18 +93,18 @@ class MedJobsScraper(BaseScraper):
             if not title:
                 continue
 
-            link_el = record.select_one("a[href]") or title_el
+            link_el = _RECORD_LINK.select_one(record) or title_el
             href = link_el.get("href", "") if link_el.name == "a" else ""
             if not href:
                 link_el = record.find("a", href=True)
                 href = link_el["href"] if link_el else ""
 
-            detail_url = href if href.startswith("http") else f"{BASE_URL}{href}"
+            detail_url = absolute_url(BASE_URL, href)
 
-            company_el = record.select_one(".company, .employer, .arbeitgeber, .firma")
+            company_el = _RECORD_COMPANY.select_one(record)
             company = company_el.get_text(strip=True) if company_el else "Unknown"
 
-            loc_el = record.select_one(".location, .ort, .arbeitsort")
+            loc_el = _RECORD_LOCATION.select_one(record)
             location = loc_el.get_text(strip=True) if loc_el else ""
 
             stubs.append(
@@ -125,43 +119,60 @@ class MedJobsScraper(BaseScraper):
 
         return stubs
 
+    def _parse_job_links(self, soup: BeautifulSoup) -> list[dict]:
+        """Build minimal stubs from job-like links anywhere on the page."""
+        stubs: list[dict] = []
+
+        for link in _JOB_LINK.select(soup):
+            href = link.get("href", "")
+            text = link.get_text(strip=True)
+            if text and len(text) > 10:
+                detail_url = absolute_url(BASE_URL, href)
+                stubs.append(
+                    {
+                        "title": text,
+                        "company": "Unknown",
+                        "location": "",
+                        "detail_url": detail_url,
+                        "url": detail_url,
+                    }
+                )
+
+        return stubs
+
     def parse_job_detail(self, soup: BeautifulSoup) -> dict:
         """Extract full details from med-jobs.com detail page."""
         detail: dict = {}
 
         # Description
-        for sel in [
-            ".job-description",
-            ".stellenbeschreibung",
-            ".detail-content",
-            "article",
-            ".content-main",
-        ]:
-            desc_el = soup.select_one(sel)
+        for pattern in _DETAIL_DESCRIPTION_PATTERNS:
+            desc_el = pattern.select_one(soup)
             if desc_el:
-                detail["description"] = strip_html_tags(
-                    desc_el.get_text(separator="\n", strip=True)
+                detail["description"] = collapse_whitespace(
+                    desc_el.get_text(separator=" ")
                 )
                 break
 
         # Company
-        company_el = soup.select_one(".company-name, .arbeitgeber, h2.employer")
+        company_el = _DETAIL_COMPANY.select_one(soup)
         if company_el:
             detail["company"] = company_el.get_text(strip=True)
 
         # Location
-        loc_el = soup.select_one(".arbeitsort, .location, .standort")
+        loc_el = _DETAIL_LOCATION.select_one(soup)
         if loc_el:
             detail["location"] = loc_el.get_text(strip=True)
 
         return detail
 
     def normalize_job(self, raw: dict) -> dict:
-        title = raw.get("title", "").strip()
-        company = raw.get("company", "Unknown").strip()
+        # Listado y detalle ya dan title/company/location con get_text(strip=True);
+        # solo la url (href crudo) necesita strip()
+        title = raw["title"]
+        company = raw.get("company", "Unknown")
         url = raw.get("url", "").strip()
         description = raw.get("description", "")
-        location = raw.get("location", "Switzerland").strip()
+        location = raw.get("location", "Switzerland")
 
         tags = extract_job_skills(title, description)
 
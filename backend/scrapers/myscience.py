@@ -2,15 +2,31 @@
 
 import logging
 
+import soupsieve
 from bs4 import BeautifulSoup
 
 from services.scraper_engine import BaseScraper
+from utils.http import absolute_url
 from utils.text import extract_canton, extract_job_skills
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://www.myscience.ch"
 
+_RESULTS_TABLE = soupsieve.compile("#results_table")
+_RESULT_RECORD = soupsieve.compile("div[itemscope]")
+_RECORD_TITLE = soupsieve.compile(".results_title")
+_RECORD_LINK = soupsieve.compile("a[href]")
+_RECORD_ORGANIZATION = soupsieve.compile(".results_organization")
+_LOCATION = soupsieve.compile(".location")
+_LOGO = soupsieve.compile(".centered_logo img")
+_DETAIL_CONTAINER = soupsieve.compile("#middle_content #results_table")
+_DETAIL_CONTAINER_FALLBACK = soupsieve.compile("#middle_content")
+_DETAIL_DESCRIPTION = soupsieve.compile("#Description")
+_DETAIL_ROW = soupsieve.compile(".long_value_row")
+_DETAIL_ROW_LABEL = soupsieve.compile(".descriptor")
+_DETAIL_ROW_VALUE = soupsieve.compile(".long_value")
+
 
 class MyScienceScraper(BaseScraper):
     SOURCE_NAME = "myscience"
@@ -19,6 +35,7 @@ class MyScienceScraper(BaseScraper):
     MAX_PAGES = 5
     NEEDS_PLAYWRIGHT = False
     FETCH_DETAILS = True
+    CACHE_DETAILS = True  # GET condicional: un 304 reutiliza el detalle previo
     PAGE_SIZE = 20
 
     def build_listing_url(self, page: int, query: str) -> str:
@@ -36,12 +53,12 @@ class MyScienceScraper(BaseScraper):
         """
         stubs: list[dict] = []
 
-        results_table = soup.select_one("#results_table")
+        results_table = _RESULTS_TABLE.select_one(soup)
         if not results_table:
             return stubs
 
-        for record in results_table.select("div[itemscope]"):
-            title_el = record.select_one(".results_title")
+        for record in _RESULT_RECORD.select(results_table):
+            title_el = _RECORD_TITLE.select_one(record)
             if not title_el:
                 continue
 
@@ -49,22 +66,22 @@ class MyScienceScraper(BaseScraper):
             if not title:
                 continue
 
-            link_el = record.select_one("a[href]")
+            link_el = _RECORD_LINK.select_one(record)
             href = link_el.get("href", "") if link_el else ""
-            detail_url = href if href.startswith("http") else f"{BASE_URL}{href}"
+            detail_url = absolute_url(BASE_URL, href)
 
-            org_el = record.select_one(".results_organization")
+            org_el = _RECORD_ORGANIZATION.select_one(record)
             company = org_el.get_text(strip=True) if org_el else "Unknown"
 
-            loc_el = record.select_one(".location")
+            loc_el = _LOCATION.select_one(record)
             location = loc_el.get_text(strip=True) if loc_el else ""
 
             # Logo from listing if present
-            logo_el = record.select_one(".centered_logo img")
+            logo_el = _LOGO.select_one(record)
             logo = None
             if logo_el and logo_el.get("src"):
                 src = logo_el["src"]
-                logo = src if src.startswith("http") else f"{BASE_URL}{src}"
+                logo = absolute_url(BASE_URL, src)
 
             stubs.append(
                 {
@@ -92,27 +109,27 @@ class MyScienceScraper(BaseScraper):
         """
         detail: dict = {}
 
-        container = soup.select_one("#middle_content #results_table")
+        container = _DETAIL_CONTAINER.select_one(soup)
         if not container:
-            container = soup.select_one("#middle_content")
+            container = _DETAIL_CONTAINER_FALLBACK.select_one(soup)
         if not container:
             return detail
 
         # Description from #Description element
-        desc_el = container.select_one("#Description")
+        desc_el = _DETAIL_DESCRIPTION.select_one(container)
         if desc_el:
             detail["description"] = desc_el.get_text(separator="\n", strip=True)
 
         # Logo
-        logo_el = container.select_one(".centered_logo img")
+        logo_el = _LOGO.select_one(container)
         if logo_el and logo_el.get("src"):
             src = logo_el["src"]
-            detail["logo"] = src if src.startswith("http") else f"{BASE_URL}{src}"
+            detail["logo"] = absolute_url(BASE_URL, src)
 
         # Metadata from .long_value_row
-        for row in container.select(".long_value_row"):
-            descriptor = row.select_one(".descriptor")
-            value = row.select_one(".long_value")
+        for row in _DETAIL_ROW.select(container):
+            descriptor = _DETAIL_ROW_LABEL.select_one(row)
+            value = _DETAIL_ROW_VALUE.select_one(row)
             if not descriptor or not value:
                 continue
             label = descriptor.get_text(strip=True).lower()
@@ -126,11 +143,13 @@ class MyScienceScraper(BaseScraper):
         return detail
 
     def normalize_job(self, raw: dict) -> dict:
-        title = raw.get("title", "").strip()
-        company = raw.get("company", "Unknown").strip()
+        # Listado y detalle ya dan title/company/location con get_text(strip=True);
+        # solo la url (href crudo) necesita strip()
+        title = raw["title"]
+        company = raw.get("company", "Unknown")
         url = raw.get("url", "").strip()
         description = raw.get("description", "") or raw.get("description_snippet", "")
-        location = raw.get("location", "Switzerland").strip()
+        location = raw.get("location", "Switzerland")
 
         tags = extract_job_skills(title, description)
 
@@ -4,14 +4,19 @@ SSR HTML listing + JSON-LD (Schema.org JobPosting) on detail pages.
 AJAX pagination via /scroll/searchhash/{hash}/page/{N} endpoint.
 """
 
-import json
+import asyncio
 import logging
+import re
+from collections.abc import Iterable
 
 import httpx
-from bs4 import BeautifulSoup
+import orjson
+import soupsieve
+from bs4 import BeautifulSoup, Tag
 
 from services.circuit_breaker import CircuitBreakerOpen
 from services.scraper_engine import BaseScraper
+from utils.http import absolute_url
 from utils.text import extract_canton, extract_job_skills, strip_html_tags
 
 logger = logging.getLogger(__name__)
@@ -20,6 +25,89 @@ BASE_URL = "https://www.schuljobs.ch"
 SCROLL_URL = f"{BASE_URL}/scroll/searchhash/{{searchhash}}/page/{{page}}"
 SCROLL_PAGE_SIZE = 20  # AJAX returns 20 jobs per scroll page
 MAX_SCROLL_PAGES = 25  # Up to 500 additional jobs
+MAX_DUPLICATE_PAGES = 2  # Scroll pages in a row with only known URLs
+
+_JOB_LINK = soupsieve.compile("a.js-joboffer-detail")
+_SEARCHHASH = soupsieve.compile("[data-searchhash]")
+_NEXT_PAGE = soupsieve.compile("[data-nextpage]")
+_JSON_LD = soupsieve.compile('script[type="application/ld+json"]')
+
+# Separador de la línea de metadatos del listado: "ZH · Zürich · Schule"
+_META_SEPARATOR = re.compile(r"\s*·\s*")
+
+# Bloques JSON-LD del HTML crudo de una página de detalle (sin parsear el árbol)
+_JSON_LD_RE = re.compile(
+    rb"<script[^>]+type=[\"']application/ld\+json[\"'][^>]*>(.*?)</script>",
+    re.DOTALL | re.IGNORECASE,
+)
+
+
+def _meta_paragraph(link: Tag) -> Tag | None:
+    """The metadata <p> of a listing card: the first <p> after the link's <h3>.
+
+    Un <h3> siguiente marca el inicio de otra tarjeta: sin <p> propio antes
+    de él, la tarjeta no tiene metadatos.
+    """
+    h3 = link.parent
+    if h3 is None:
+        return None
+    # Recorrer los hermanos directos es ~15x más barato que card.find("p"),
+    # que pasa por la maquinaria de búsqueda de bs4; find solo como respaldo.
+    for sibling in h3.next_siblings:
+        if sibling.name == "p":
+            return sibling
+        if sibling.name == "h3":
+            return None
+    card = h3.parent
+    # Respaldo solo si el contenedor es la tarjeta de este enlace (un único h3)
+    if card is None or len(card.find_all("h3", limit=2)) > 1:
+        return None
+    return card.find("p")
+
+
+def _job_posting_detail(blocks: Iterable[str | bytes]) -> dict:
+    """Detail fields from the first JobPosting among JSON-LD blocks."""
+    detail: dict = {}
+
+    for block in blocks:
+        try:
+            data = orjson.loads(block)
+        except orjson.JSONDecodeError:
+            continue
+
+        if not isinstance(data, dict) or data.get("@type") != "JobPosting":
+            continue
+
+        # Title (prefer JSON-LD over listing)
+        if data.get("title"):
+            detail["title"] = data["title"]
+
+        # Company
+        org = data.get("hiringOrganization") or {}
+        if org.get("name"):
+            detail["company"] = org["name"]
+        if org.get("logo"):
+            detail["logo"] = org["logo"]
+
+        # Location
+        loc = data.get("jobLocation") or {}
+        addr = loc.get("address") or {}
+        if addr.get("addressLocality"):
+            detail["location"] = addr["addressLocality"]
+        if addr.get("addressRegion"):
+            detail["canton"] = addr["addressRegion"]
+
+        # Description
+        if data.get("description"):
+            detail["description"] = strip_html_tags(data["description"])
+
+        # Employment type
+        if data.get("employmentType"):
+            detail["employment_type"] = data["employmentType"]
+
+        break  # Only need the first JobPosting
+
+    return detail
 
 
 class SchulJobsScraper(BaseScraper):
@@ -31,6 +119,12 @@ class SchulJobsScraper(BaseScraper):
     MAX_PAGES = 1 + MAX_SCROLL_PAGES
     NEEDS_PLAYWRIGHT = False
     FETCH_DETAILS = True  # Detail page has JSON-LD with full info
+    PARSE_DETAIL_RAW = True  # El JSON-LD se extrae por regex, sin soup
+    STREAM_DETAIL = True  # JSON-LD al inicio: se corta la descarga al leerlo
+    CACHE_DETAILS = True  # GET condicional: un 304 reutiliza el detalle previo
+    # Cientos de detalles por run: se solapan sus latencias (la cadencia de
+    # arranques sigue siendo RATE_LIMIT_SECONDS)
+    DETAIL_CONCURRENCY = 4
     # Unidad de paginación que se repite (scroll AJAX). El presupuesto dinámico
     # divide las novedades por este tamaño; usar el real evita infra/sobrestimar.
     PAGE_SIZE = SCROLL_PAGE_SIZE
@@ -38,7 +132,9 @@ class SchulJobsScraper(BaseScraper):
     def build_listing_url(self, page: int, query: str) -> str:
         return self.LISTING_URL
 
-    def parse_listing_page(self, soup: BeautifulSoup) -> list[dict]:
+    def parse_listing_page(
+        self, soup: BeautifulSoup, seen: set[str] | None = None
+    ) -> list[dict]:
         """Extract job stubs from schuljobs.ch listing page.
 
         Structure (verified 2026-03-01):
@@ -47,42 +143,42 @@ class SchulJobsScraper(BaseScraper):
           </h3>
           <p>CANTON · City · Company</p>
           <div>Date  Workload%</div>
+
+        With `seen`, URLs already in the set are skipped and new ones added.
         """
+        return self._stubs_from_links(_JOB_LINK.select(soup), seen)
+
+    def _stubs_from_links(self, links: list[Tag], seen: set[str] | None) -> list[dict]:
+        """Build stubs from job links, skipping URLs already in `seen`."""
         stubs: list[dict] = []
 
-        for link in soup.select("a.js-joboffer-detail"):
+        for link in links:
             title = link.get_text(strip=True)
             href = link.get("href", "")
             if not title or not href:
                 continue
 
-            detail_url = href if href.startswith("http") else f"{BASE_URL}{href}"
-
-            # Parse metadata from sibling <p> element
-            h3 = link.parent
-            card = h3.parent if h3 else None
+            detail_url = absolute_url(BASE_URL, href)
+            # Dedup al vuelo: un duplicado no llega a construir su stub
+            if seen is not None:
+                if detail_url in seen:
+                    continue
+                seen.add(detail_url)
 
             company = "Unknown"
             location = ""
             canton = None
 
-            if card:
-                p_el = card.find("p")
-                if p_el:
-                    meta_text = p_el.get_text(strip=True)
-                    # Format: "ZH · Zurich · Company Name"
-                    parts = [p.strip() for p in meta_text.split("·")]
+            p_el = _meta_paragraph(link)
+            if p_el:
+                # Format: "ZH · Zurich · Company Name"
+                parts = _META_SEPARATOR.split(p_el.get_text(strip=True))
+                if len(parts) >= 2:
+                    code = parts[0]
+                    canton = code if len(code) == 2 else None
+                    location = parts[1]
                     if len(parts) >= 3:
-                        canton = (
-                            parts[0].strip() if len(parts[0].strip()) == 2 else None
-                        )
-                        location = parts[1].strip()
-                        company = parts[2].strip()
-                    elif len(parts) == 2:
-                        canton = (
-                            parts[0].strip() if len(parts[0].strip()) == 2 else None
-                        )
-                        location = parts[1].strip()
+                        company = parts[2]
 
             stubs.append(
                 {
@@ -103,8 +199,12 @@ class SchulJobsScraper(BaseScraper):
         Phase 1: Fetch initial /suche page → parse stubs + extract searchhash.
         Phase 2: Loop AJAX /scroll/searchhash/{hash}/page/{N} for more stubs.
         Phase 3: Fetch detail pages (JSON-LD) for all stubs.
+
+        Stubs are deduplicated by URL while parsing; the scroll loop stops
+        after MAX_DUPLICATE_PAGES consecutive pages with nothing new.
         """
         all_stubs: list[dict] = []
+        seen_urls: set[str] = set()
 
         ajax_headers = {
             **self.DEFAULT_HEADERS,
@@ -130,8 +230,12 @@ class SchulJobsScraper(BaseScraper):
                 )
                 return []
 
-            soup = BeautifulSoup(response.text, "lxml")
-            initial_stubs = self.parse_listing_page(soup)
+            # lxml decodifica los bytes en C con el charset de la respuesta: no
+            # se materializa response.text salvo en el path de soft-block.
+            soup = BeautifulSoup(
+                response.content, "lxml", from_encoding=response.encoding
+            )
+            initial_stubs = self.parse_listing_page(soup, seen_urls)
             # 0 resultados + marcador anti-bot => soft-block (200 sin datos).
             # Reutiliza el helper base (una sola implementación del soft-block).
             if not initial_stubs and await self._maybe_report_soft_block(
@@ -141,7 +245,7 @@ class SchulJobsScraper(BaseScraper):
             all_stubs.extend(initial_stubs)
 
             # Extract searchhash for AJAX pagination
-            result_list = soup.select_one("[data-searchhash]")
+            result_list = _SEARCHHASH.select_one(soup)
             searchhash = result_list.get("data-searchhash") if result_list else None
 
             # Crawler incremental: si TODA la página inicial ya es conocida no
@@ -154,99 +258,104 @@ class SchulJobsScraper(BaseScraper):
                 )
             # Phase 2: AJAX scroll pages
             elif searchhash:
-                btn = soup.select_one("[data-nextpage]")
+                btn = _NEXT_PAGE.select_one(soup)
                 next_page = int(btn.get("data-nextpage")) if btn else None
 
-                # Presupuesto del run menos la página inicial ya pedida.
-                for _ in range(self._pages_budget() - 1):
-                    if not next_page:
-                        break
-
-                    await self._rate_limit_delay()
-                    scroll_url = SCROLL_URL.format(
-                        searchhash=searchhash, page=next_page
-                    )
-
-                    try:
-                        resp = await self._request_with_retry(
-                            lambda u=scroll_url: client.get(u, headers=ajax_headers)
-                        )
-                    except (CircuitBreakerOpen, httpx.HTTPError) as e:
-                        logger.error(
-                            "%s scroll page %d error: %s",
-                            self.SOURCE_NAME,
-                            next_page,
-                            e,
+                duplicate_pages = 0
+                # La espera del rate-limit arranca al llegar cada respuesta y
+                # corre mientras se parsea: el hueco entre peticiones sigue
+                # siendo >= RATE_LIMIT_SECONDS, pero el parseo ya no se le suma.
+                pacing = asyncio.create_task(self._rate_limit_delay())
+                try:
+                    # Presupuesto del run menos la página inicial ya pedida.
+                    for _ in range(self._pages_budget() - 1):
+                        if not next_page:
+                            break
+
+                        await pacing
+                        scroll_url = SCROLL_URL.format(
+                            searchhash=searchhash, page=next_page
                         )
-                        break
-
-                    if resp.status_code in self.BLOCK_STATUS:
-                        await self._report_block(resp.status_code)
-                        break
-                    if resp.status_code != 200:
-                        break
-
-                    try:
-                        data = resp.json()
-                    except Exception:
-                        break
-
-                    html_fragment = data.get("html", "")
-                    if not html_fragment:
-                        break
-
-                    frag_soup = BeautifulSoup(html_fragment, "lxml")
-                    page_stubs = self.parse_listing_page(frag_soup)
-                    all_stubs.extend(page_stubs)
-
-                    # Crawler incremental: página de scroll entera ya conocida
-                    # → alcanzado el contenido sincronizado, parar.
-                    if self._page_all_known(page_stubs):
-                        self._stop_reason = "known_page"
-                        logger.info(
-                            "%s early-stop en scroll: sin ofertas nuevas (cursor)",
-                            self.SOURCE_NAME,
-                        )
-                        break
-
-                    np = data.get("nextpage")
-                    next_page = int(np) if np else None
 
-                    if len(page_stubs) < SCROLL_PAGE_SIZE:
-                        break
+                        try:
+                            resp = await self._request_with_retry(
+                                lambda u=scroll_url: client.get(u, headers=ajax_headers)
+                            )
+                        except (CircuitBreakerOpen, httpx.HTTPError) as e:
+                            logger.error(
+                                "%s scroll page %d error: %s",
+                                self.SOURCE_NAME,
+                                next_page,
+                                e,
+                            )
+                            break
+                        pacing = asyncio.create_task(self._rate_limit_delay())
+
+                        if resp.status_code in self.BLOCK_STATUS:
+                            await self._report_block(resp.status_code)
+                            break
+                        if resp.status_code != 200:
+                            break
+
+                        try:
+                            data = orjson.loads(resp.content)
+                        except orjson.JSONDecodeError:
+                            break
+                        if not isinstance(data, dict):
+                            break
+
+                        html_fragment = data.get("html", "")
+                        if not html_fragment:
+                            break
+
+                        frag_soup = BeautifulSoup(html_fragment, "lxml")
+                        links = _JOB_LINK.select(frag_soup)
+                        page_stubs = self._stubs_from_links(links, seen_urls)
+                        all_stubs.extend(page_stubs)
+
+                        # Cursor del portal en bucle: páginas llenas sin nada nuevo
+                        duplicate_pages = (
+                            0 if page_stubs or not links else duplicate_pages + 1
+                        )
+                        if duplicate_pages >= MAX_DUPLICATE_PAGES:
+                            logger.warning(
+                                "%s: %d scroll pages in a row without new jobs, stopping",
+                                self.SOURCE_NAME,
+                                duplicate_pages,
+                            )
+                            break
+
+                        # Crawler incremental: página de scroll entera ya conocida
+                        # → alcanzado el contenido sincronizado, parar.
+                        if self._page_all_known(page_stubs):
+                            self._stop_reason = "known_page"
+                            logger.info(
+                                "%s early-stop en scroll: sin ofertas nuevas (cursor)",
+                                self.SOURCE_NAME,
+                            )
+                            break
+
+                        np = data.get("nextpage")
+                        next_page = int(np) if np else None
+
+                        if len(links) < SCROLL_PAGE_SIZE:
+                            break
+                finally:
+                    # Sin más páginas: la espera pendiente ya no hace falta
+                    pacing.cancel()
             else:
                 logger.warning(
                     "%s: no searchhash found, skipping pagination", self.SOURCE_NAME
                 )
 
-            # Phase 3: deduplicate by URL before fetching details
-            seen_urls: set[str] = set()
-            unique_stubs: list[dict] = []
-            for stub in all_stubs:
-                url = stub.get("url", "")
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    unique_stubs.append(stub)
-
-            logger.info(
-                "%s found %d unique stubs (%d before dedup)",
-                self.SOURCE_NAME,
-                len(unique_stubs),
-                len(all_stubs),
-            )
+            logger.info("%s found %d unique stubs", self.SOURCE_NAME, len(all_stubs))
 
-            # Phase 4: fetch detail pages for JSON-LD
+            # Phase 3: fetch detail pages for JSON-LD
             if self.FETCH_DETAILS:
-                for stub in unique_stubs:
-                    detail_url = stub.get("detail_url")
-                    if detail_url:
-                        await self._rate_limit_delay()
-                        detail = await self._fetch_detail_httpx(client, detail_url)
-                        if detail:
-                            stub.update(detail)
+                await self._fetch_details(client, all_stubs)
 
-        logger.info("%s scraped %d raw jobs", self.SOURCE_NAME, len(unique_stubs))
-        return unique_stubs
+        logger.info("%s scraped %d raw jobs", self.SOURCE_NAME, len(all_stubs))
+        return all_stubs
 
     def parse_job_detail(self, soup: BeautifulSoup) -> dict:
         """Extract full details from JSON-LD on schuljobs.ch detail page.
@@ -256,49 +365,13 @@ class SchulJobsScraper(BaseScraper):
             {"@type": "JobPosting", "title": "...", ...}
           </script>
         """
-        detail: dict = {}
-
-        for script in soup.select('script[type="application/ld+json"]'):
-            if not script.string:
-                continue
-            try:
-                data = json.loads(script.string)
-            except json.JSONDecodeError:
-                continue
-
-            if data.get("@type") != "JobPosting":
-                continue
-
-            # Title (prefer JSON-LD over listing)
-            if data.get("title"):
-                detail["title"] = data["title"]
-
-            # Company
-            org = data.get("hiringOrganization") or {}
-            if org.get("name"):
-                detail["company"] = org["name"]
-            if org.get("logo"):
-                detail["logo"] = org["logo"]
-
-            # Location
-            loc = data.get("jobLocation") or {}
-            addr = loc.get("address") or {}
-            if addr.get("addressLocality"):
-                detail["location"] = addr["addressLocality"]
-            if addr.get("addressRegion"):
-                detail["canton"] = addr["addressRegion"]
-
-            # Description
-            if data.get("description"):
-                detail["description"] = strip_html_tags(data["description"])
-
-            # Employment type
-            if data.get("employmentType"):
-                detail["employment_type"] = data["employmentType"]
-
-            break  # Only need the first JobPosting
+        return _job_posting_detail(
+            str(script.string) for script in _JSON_LD.select(soup) if script.string
+        )
 
-        return detail
+    def parse_job_detail_raw(self, content: bytes) -> dict:
+        """Same as parse_job_detail, straight from the page bytes."""
+        return _job_posting_detail(m.group(1) for m in _JSON_LD_RE.finditer(content))
 
     def normalize_job(self, raw: dict) -> dict:
         title = raw.get("title", "").strip()
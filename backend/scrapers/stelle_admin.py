@@ -5,15 +5,38 @@ Pure JS SPA — requires Playwright headless browser for rendering.
 
 import logging
 
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, Tag
 
-from services.scraper_engine import BaseScraper
+from services.scraper_engine import BaseScraper, PrioritySelector
+from utils.http import absolute_url
 from utils.text import extract_canton, extract_job_skills
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://jobs.admin.ch"
 
+_LISTING_ITEM = PrioritySelector(
+    ".job-card",
+    ".vacancy-item",
+    ".search-result-item",
+    ".job-list-item",
+    "[data-job-id]",
+    "article",
+)
+_TABLE_ROW = soupsieve.compile("table tbody tr")
+# Enlaces con pinta de oferta (href sin distinguir mayúsculas)
+_JOB_LINK = soupsieve.compile(
+    'a[href*="/job/" i], a[href*="/stelle/" i], '
+    'a[href*="/vacancy/" i], a[href*="/detail/" i]'
+)
+_RECORD_TITLE = soupsieve.compile("h2, h3, h4, .title, a")
+_RECORD_LINK = soupsieve.compile("a[href]")
+_RECORD_DEPARTMENT = soupsieve.compile(".department, .organization, .employer, .amt")
+_RECORD_LOCATION = soupsieve.compile(".location, .ort, .arbeitsort")
+_RECORD_SNIPPET = soupsieve.compile(".description, .teaser, p")
+_RECORD_RATE = soupsieve.compile(".pensum, .workload, .rate")
+
 
 class StelleAdminScraper(BaseScraper):
     SOURCE_NAME = "stelle_admin"
@@ -34,31 +57,28 @@ class StelleAdminScraper(BaseScraper):
         job listing elements. Common patterns for government portals:
         .job-card, .vacancy-item, [role="listitem"], .search-result
         """
-        stubs: list[dict] = []
-
-        # Strategy 1: structured job cards
-        selectors = [
-            ".job-card",
-            ".vacancy-item",
-            ".search-result-item",
-            ".job-list-item",
-            "[data-job-id]",
-            "article",
-        ]
-
-        records = []
-        for sel in selectors:
-            records = soup.select(sel)
-            if records:
-                break
+        # Strategy 1: structured job cards, by selector priority
+        records = _LISTING_ITEM.first_matching(soup)
 
         # Strategy 2: table rows (common in government portals)
         if not records:
-            records = soup.select("table tbody tr")
+            records = _TABLE_ROW.select(soup)
+
+        stubs = self._parse_records(records)
+        if stubs:
+            return stubs
+
+        # Strategy 3: fallback to links with job-like patterns, solo si las
+        # estrategias estructuradas no han dado ninguna oferta
+        return self._parse_job_links(soup)
+
+    def _parse_records(self, records: list[Tag]) -> list[dict]:
+        """Build stubs from structured cards or table rows."""
+        stubs: list[dict] = []
 
         for record in records:
             # Title
-            title_el = record.select_one("h2, h3, h4, .title, a")
+            title_el = _RECORD_TITLE.select_one(record)
             if not title_el:
                 continue
 
@@ -67,12 +87,12 @@ class StelleAdminScraper(BaseScraper):
                 continue
 
             # URL
-            link_el = record.select_one("a[href]")
+            link_el = _RECORD_LINK.select_one(record)
             href = link_el.get("href", "") if link_el else ""
-            url = href if href.startswith("http") else f"{BASE_URL}{href}"
+            url = absolute_url(BASE_URL, href)
 
             # Company / Department
-            dept_el = record.select_one(".department, .organization, .employer, .amt")
+            dept_el = _RECORD_DEPARTMENT.select_one(record)
             company = (
                 dept_el.get_text(strip=True)
                 if dept_el
@@ -80,15 +100,15 @@ class StelleAdminScraper(BaseScraper):
             )
 
             # Location
-            loc_el = record.select_one(".location, .ort, .arbeitsort")
+            loc_el = _RECORD_LOCATION.select_one(record)
             location = loc_el.get_text(strip=True) if loc_el else ""
 
             # Description snippet
-            desc_el = record.select_one(".description, .teaser, p")
+            desc_el = _RECORD_SNIPPET.select_one(record)
             snippet = desc_el.get_text(strip=True) if desc_el else ""
 
             # Employment rate
-            rate_el = record.select_one(".pensum, .workload, .rate")
+            rate_el = _RECORD_RATE.select_one(record)
             employment_type = rate_el.get_text(strip=True) if rate_el else None
 
             stubs.append(
@@ -102,32 +122,27 @@ class StelleAdminScraper(BaseScraper):
                 }
             )
 
-        # Strategy 3: fallback to links with job-like patterns
-        if not stubs:
-            seen_urls: set[str] = set()
-            for link in soup.select("a[href]"):
-                href = link.get("href", "")
-                text = link.get_text(strip=True)
-                if (
-                    text
-                    and len(text) > 10
-                    and any(
-                        p in href.lower()
-                        for p in ["/job/", "/stelle/", "/vacancy/", "/detail/"]
-                    )
-                    and href not in seen_urls
-                ):
-                    seen_urls.add(href)
-                    full_url = href if href.startswith("http") else f"{BASE_URL}{href}"
-                    stubs.append(
-                        {
-                            "title": text,
-                            "company": "Swiss Federal Administration",
-                            "location": "",
-                            "url": full_url,
-                            "description": "",
-                        }
-                    )
+        return stubs
+
+    def _parse_job_links(self, soup: BeautifulSoup) -> list[dict]:
+        """Build minimal stubs from job-like links anywhere on the page."""
+        stubs: list[dict] = []
+        seen_urls: set[str] = set()
+        for link in _JOB_LINK.select(soup):
+            href = link.get("href", "")
+            text = link.get_text(strip=True)
+            if text and len(text) > 10 and href not in seen_urls:
+                seen_urls.add(href)
+                full_url = absolute_url(BASE_URL, href)
+                stubs.append(
+                    {
+                        "title": text,
+                        "company": "Swiss Federal Administration",
+                        "location": "",
+                        "url": full_url,
+                        "description": "",
+                    }
+                )
 
         return stubs
 
@@ -136,11 +151,13 @@ class StelleAdminScraper(BaseScraper):
         return {}
 
     def normalize_job(self, raw: dict) -> dict:
-        title = raw.get("title", "").strip()
-        company = raw.get("company", "Swiss Federal Administration").strip()
+        # El listado ya da title/company/location con get_text(strip=True);
+        # solo la url (href crudo) necesita strip()
+        title = raw["title"]
+        company = raw.get("company", "Swiss Federal Administration")
         url = raw.get("url", "").strip()
         description = raw.get("description", "")
-        location = raw.get("location", "Bern").strip()
+        location = raw.get("location", "Bern")
 
         tags = extract_job_skills(title, description)
 
@@ -13,6 +13,7 @@ from bs4 import BeautifulSoup, Tag
 
 from scrapers.swiss_schools_config import get_school
 from scrapers.swiss_schools_base import SwissSchoolBaseScraper
+from utils.http import absolute_url
 
 logger = logging.getLogger(__name__)
 
@@ -59,7 +60,7 @@ class SwissSchoolsEcolintScraper(SwissSchoolBaseScraper):
         if not title or not href:
             return None
 
-        url = href if href.startswith("http") else f"{ECOLINT_BASE}{href}"
+        url = absolute_url(ECOLINT_BASE, href)
         source_id = href.rstrip("/").split("/")[-1] or url
 
         return {
@@ -4,9 +4,10 @@ Uses Next.js __NEXT_DATA__ embedded JSON with tRPC state.
 Pagination: 1 job per page (server-enforced limit), ~32 total.
 """
 
-import json
 import logging
+import re
 
+import orjson
 from bs4 import BeautifulSoup
 
 from services.scraper_engine import BaseScraper
@@ -16,6 +17,12 @@ logger = logging.getLogger(__name__)
 
 BASE_URL = "https://www.tes.com"
 
+# El <script id="__NEXT_DATA__"> sobre los bytes crudos: la página entera de
+# Next.js no necesita árbol HTML, solo este bloque JSON
+_NEXT_DATA_RE = re.compile(
+    rb"<script[^>]*\bid=[\"']__NEXT_DATA__[\"'][^>]*>(.*?)</script>", re.DOTALL
+)
+
 
 class TESScraper(BaseScraper):
     SOURCE_NAME = "tes"
@@ -25,6 +32,7 @@ class TESScraper(BaseScraper):
     NEEDS_PLAYWRIGHT = False
     FETCH_DETAILS = False  # __NEXT_DATA__ contains all info
     PAGE_SIZE = 1  # Server enforces limit=1 per page
+    PARSE_LISTING_RAW = True  # __NEXT_DATA__ se extrae por regex, sin soup
 
     def build_listing_url(self, page: int, query: str) -> str:
         return f"{self.LISTING_URL}?page={page}"
@@ -35,10 +43,22 @@ class TESScraper(BaseScraper):
         if not script_el or not script_el.string:
             logger.warning("tes: no __NEXT_DATA__ found")
             return []
+        # orjson solo acepta str exacto, no la subclase NavigableString
+        return self._stubs_from_next_data(str(script_el.string))
+
+    def parse_listing_page_raw(self, content: bytes) -> list[dict]:
+        """Extract jobs from __NEXT_DATA__ straight from the response bytes."""
+        match = _NEXT_DATA_RE.search(content)
+        if not match:
+            logger.warning("tes: no __NEXT_DATA__ found")
+            return []
+        return self._stubs_from_next_data(match.group(1))
 
+    def _stubs_from_next_data(self, payload: str | bytes) -> list[dict]:
+        """Build stubs from the __NEXT_DATA__ JSON payload."""
         try:
-            data = json.loads(script_el.string)
-        except json.JSONDecodeError as e:
+            data = orjson.loads(payload)
+        except orjson.JSONDecodeError as e:
             logger.error("tes: failed to parse __NEXT_DATA__: %s", e)
             return []
 
@@ -21,10 +21,17 @@ class CircuitBreakerOpen(Exception):
     """Raised when the circuit is open and calls are rejected."""
 
     def __init__(self, source: str, retry_after: float):
+        # El mensaje se formatea solo si alguien lo lee: con el circuito
+        # abierto se rechazan muchas llamadas y casi nunca se imprime.
+        # args = (source, retry_after) mantiene el exception picklable.
+        super().__init__(source, retry_after)
         self.source = source
         self.retry_after = retry_after
-        super().__init__(
-            f"Circuit breaker open for '{source}'. Retry after {retry_after:.0f}s."
+
+    def __str__(self) -> str:
+        return (
+            f"Circuit breaker open for '{self.source}'. "
+            f"Retry after {self.retry_after:.0f}s."
         )
 
 
@@ -42,14 +49,16 @@ class CircuitBreaker:
         self.recovery_timeout = recovery_timeout
         self._state = CircuitState.CLOSED
         self._failure_count = 0
-        self._last_failure_time: float = 0
+        # Instante (monotonic) en que un circuito OPEN pasa a HALF_OPEN; se
+        # fija en cada fallo para que `state` haga una sola comparación
+        self._open_until: float = 0
         self._success_count = 0
         self._half_open_pending = False
 
     @property
     def state(self) -> CircuitState:
         if self._state == CircuitState.OPEN:
-            if time.monotonic() - self._last_failure_time >= self.recovery_timeout:
+            if time.monotonic() >= self._open_until:
                 self._state = CircuitState.HALF_OPEN
                 self._half_open_pending = False
         return self._state
@@ -59,9 +68,7 @@ class CircuitBreaker:
         current_state = self.state
 
         if current_state == CircuitState.OPEN:
-            retry_after = self.recovery_timeout - (
-                time.monotonic() - self._last_failure_time
-            )
+            retry_after = self._open_until - time.monotonic()
             raise CircuitBreakerOpen(self.name, max(retry_after, 0))
 
         # In HALF_OPEN, allow only one probe call at a time
@@ -89,7 +96,7 @@ class CircuitBreaker:
     def _on_failure(self) -> None:
         """Record a failed call."""
         self._failure_count += 1
-        self._last_failure_time = time.monotonic()
+        self._open_until = time.monotonic() + self.recovery_timeout
         self._half_open_pending = False
         if self._failure_count >= self.failure_threshold:
             self._state = CircuitState.OPEN
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import select, update
+from sqlalchemy import and_, case, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config import settings
@@ -24,24 +24,32 @@ class ComplianceEngine:
         return source.is_allowed and source.robots_txt_ok
 
     async def report_block(self, source_key: str, status_code: int) -> None:
-        """Record a block event. If N consecutive blocks → kill-switch."""
-        result = await self.db.execute(
-            select(SourceCompliance).where(SourceCompliance.source_key == source_key)
-        )
-        source = result.scalar_one_or_none()
-        if source is None:
-            return
-
-        now = datetime.now(timezone.utc)
-        source.consecutive_blocks += 1
-        source.last_blocked_at = now
-
-        if (
-            source.auto_disable_on_block
-            and source.consecutive_blocks >= settings.COMPLIANCE_BLOCK_THRESHOLD
-        ):
-            source.is_allowed = False
+        """Record a block event. If N consecutive blocks → kill-switch.
 
+        Un único UPDATE atómico: en el SET, Postgres evalúa las columnas con
+        los valores previos a la fila, así que contador y kill-switch se
+        calculan juntos sin read-modify-write entre scrapers concurrentes.
+        Fuente desconocida → no afecta a ninguna fila.
+        """
+        blocks = SourceCompliance.consecutive_blocks + 1
+        await self.db.execute(
+            update(SourceCompliance)
+            .where(SourceCompliance.source_key == source_key)
+            .values(
+                consecutive_blocks=blocks,
+                last_blocked_at=datetime.now(timezone.utc),
+                is_allowed=case(
+                    (
+                        and_(
+                            SourceCompliance.auto_disable_on_block,
+                            blocks >= settings.COMPLIANCE_BLOCK_THRESHOLD,
+                        ),
+                        False,
+                    ),
+                    else_=SourceCompliance.is_allowed,
+                ),
+            )
+        )
         await self.db.commit()
 
     async def reset_blocks(self, source_key: str) -> None:
@@ -3,6 +3,7 @@
 import io
 import logging
 import re
+from typing import BinaryIO
 
 logger = logging.getLogger(__name__)
 
@@ -10,6 +11,12 @@ logger = logging.getLogger(__name__)
 PDF_TYPE = "application/pdf"
 DOCX_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
 
+# clean_text: no imprimibles (salvo saltos de línea y latín acentuado),
+# 3+ saltos de línea y 2+ espacios.
+_NON_PRINTABLE_RE = re.compile(r"[^\x20-\x7E\n\xC0-\xFF\u0100-\u017F]")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_SPACES_RE = re.compile(r" {2,}")
+
 
 class CVParser:
     """Stateless CV text extraction. All methods are static."""
@@ -55,9 +62,13 @@ class CVParser:
     @staticmethod
     def parse_docx(file_bytes: bytes) -> str:
         """Extract plain text from a DOCX file using python-docx."""
+        return CVParser._docx_text(io.BytesIO(file_bytes))
+
+    @staticmethod
+    def _docx_text(stream: BinaryIO) -> str:
         from docx import Document
 
-        doc = Document(io.BytesIO(file_bytes))
+        doc = Document(stream)
         paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
         return "\n".join(paragraphs).strip()
 
@@ -73,6 +84,20 @@ class CVParser:
             return CVParser.parse_docx(file_bytes)
         raise ValueError(f"Unsupported file type: {content_type}")
 
+    @staticmethod
+    def extract_text_from_stream(stream: BinaryIO, content_type: str) -> str:
+        """Like extract_text, but from a seekable file-like (e.g. UploadFile.file).
+
+        DOCX se lee directamente del stream (zipfile hace seek). PyMuPDF solo
+        acepta buffers en memoria, así que el PDF se lee una vez aquí.
+        """
+        stream.seek(0)
+        if content_type == PDF_TYPE:
+            return CVParser.parse_pdf(stream.read())
+        if content_type == DOCX_TYPE:
+            return CVParser._docx_text(stream)
+        raise ValueError(f"Unsupported file type: {content_type}")
+
     @staticmethod
     def extract_skills(text: str) -> list[str]:
         """Extract skill keywords from parsed CV text.
@@ -82,8 +107,8 @@ class CVParser:
         if not text:
             return []
         seen: dict[str, str] = {}
-        for pattern in CVParser.SKILL_PATTERNS:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for pattern in _COMPILED_SKILL_PATTERNS:
+            for match in pattern.finditer(text):
                 skill = match.group(0)
                 key = skill.lower()
                 if key not in seen:
@@ -94,9 +119,15 @@ class CVParser:
     def clean_text(text: str) -> str:
         """Clean extracted text: normalize whitespace, remove non-printable chars."""
         # Remove non-printable characters except newlines and common accented chars
-        text = re.sub(r"[^\x20-\x7E\n\xC0-\xFF\u0100-\u017F]", " ", text)
+        text = _NON_PRINTABLE_RE.sub(" ", text)
         # Collapse multiple blank lines
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = _BLANK_LINES_RE.sub("\n\n", text)
         # Collapse multiple spaces
-        text = re.sub(r" {2,}", " ", text)
+        text = _SPACES_RE.sub(" ", text)
         return text.strip()
+
+
+# Compilados una vez al importar; extract_skills no pasa por la caché de `re`.
+_COMPILED_SKILL_PATTERNS: tuple[re.Pattern[str], ...] = tuple(
+    re.compile(p, re.IGNORECASE) for p in CVParser.SKILL_PATTERNS
+)
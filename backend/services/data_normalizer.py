@@ -1,7 +1,9 @@
 """DataNormalizer — enrich job dicts with salary, language, seniority, contract type."""
 
+import functools
 import logging
 import re
+import sys
 
 from langdetect import LangDetectException, detect_langs
 
@@ -50,6 +52,24 @@ CONTRACT_VALID = {
     "temporary",
 }
 
+# Campos de dominio pequeño que se repiten en cada oferta de un crawl: se
+# internan para que todas las ofertas compartan el mismo objeto str
+INTERNED_FIELDS: tuple[str, ...] = (
+    "source",
+    "canton",
+    "language",
+    "seniority",
+    "contract_type",
+    "salary_currency",
+    "salary_period",
+    "employment_type",
+    "category",
+)
+
+# langdetect escala con la longitud del texto (~2 ms con 300 caracteres, ~9 ms
+# con 4.4k); el título y el arranque de la descripción bastan para el idioma
+LANGDETECT_MAX_CHARS = 1000
+
 # ---------------------------------------------------------------------------
 # Seniority patterns (checked in priority order: most senior first)
 # ---------------------------------------------------------------------------
@@ -155,6 +175,14 @@ _SALARY_RANGE_RE = re.compile(r"(\d[\d.,]*)\s*[kK]?\s*[-–—to]+\s*(\d[\d.,]*)
 _SALARY_SINGLE_RE = re.compile(r"(\d[\d.,]+)\s*[kK]?")
 _CURRENCY_RE = re.compile(r"\b(CHF|EUR|USD|GBP|€|\$|£)\b", re.IGNORECASE)
 
+# _parse_number: según cuál sea el separador decimal, una sola pasada de
+# translate quita los de miles y deja el decimal como "."
+_NUMBER_SEPARATOR_TRANS: dict[str | None, dict[int, int | None]] = {
+    ".": str.maketrans({",": None}),
+    ",": str.maketrans({".": None, ",": "."}),
+    None: str.maketrans({".": None, ",": None}),
+}
+
 _CURRENCY_SYMBOL_MAP: dict[str, str] = {
     "€": "EUR",
     "$": "USD",
@@ -178,6 +206,16 @@ class DataNormalizer:
         job = DataNormalizer.infer_seniority(job)
         job = DataNormalizer.infer_contract_type(job)
         job = DataNormalizer.classify_category(job)
+        job = DataNormalizer.intern_values(job)
+        return job
+
+    @staticmethod
+    def intern_values(job: dict) -> dict:
+        """Intern the small-domain string fields (see ``INTERNED_FIELDS``)."""
+        for key in INTERNED_FIELDS:
+            value = job.get(key)
+            if type(value) is str:
+                job[key] = sys.intern(value)
         return job
 
     @staticmethod
@@ -251,10 +289,15 @@ class DataNormalizer:
         return job
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _parse_salary_string(
         text: str,
     ) -> tuple[float | None, float | None, str | None]:
-        """Extract min, max salary and currency from a free-text salary string."""
+        """Extract min, max salary and currency from a free-text salary string.
+
+        Memoizada: las ofertas de un mismo portal/empleador repiten la misma
+        cadena de salario; la tupla devuelta es inmutable.
+        """
         currency = None
         cur_match = _CURRENCY_RE.search(text)
         if cur_match:
@@ -281,7 +324,20 @@ class DataNormalizer:
         """Parse a number string, handling 'k' suffix and European formatting."""
         if not raw:
             return None
-        cleaned = raw.replace(",", "").replace(".", "").strip()
+        cleaned = raw.strip()
+        dot, comma = cleaned.rfind("."), cleaned.rfind(",")
+        if dot >= 0 or comma >= 0:
+            if dot >= 0 and comma >= 0:
+                # Ambos separadores: el último es el decimal ("1.234,56" / "1,234.56")
+                decimal = "." if dot > comma else ","
+            else:
+                sep = "." if dot >= 0 else ","
+                pos = max(dot, comma)
+                # Uno solo, una vez y sin 3 dígitos detrás → decimal ("80.5k",
+                # "12,50"); si no, es de miles ("100.000", "80,000", "1.200.000")
+                single = cleaned.count(sep) == 1 and len(cleaned) - pos - 1 != 3
+                decimal = sep if single else None
+            cleaned = cleaned.translate(_NUMBER_SEPARATOR_TRANS[decimal])
         try:
             value = float(cleaned)
         except ValueError:
@@ -306,7 +362,7 @@ class DataNormalizer:
             return job
 
         try:
-            results = detect_langs(text)
+            results = detect_langs(text[:LANGDETECT_MAX_CHARS])
             if results and results[0].prob >= 0.7:
                 lang = results[0].lang
                 if lang in ("de", "fr", "en", "it"):
@@ -53,6 +53,13 @@ SENIORITY_STRIP: set[str] = {
     "w/m/d",
 }
 
+# Una sola pasada para todas las palabras de SENIORITY_STRIP. Sin \b a
+# propósito: fuzzy_hash está persistido y el str.replace original quitaba
+# también subcadenas ("intern" en "international"). Las más largas primero
+# para que "(m/f/d)" gane a "m/f/d" y "sr." a "sr".
+_SENIORITY_RE = re.compile(
+    "|".join(re.escape(w) for w in sorted(SENIORITY_STRIP, key=len, reverse=True))
+)
 _PUNCT_RE = re.compile(r"[^\w\s]", re.UNICODE)
 _SPACES_RE = re.compile(r"\s+")
 
@@ -78,8 +85,7 @@ class Deduplicator:
         """Normalize a job title for fuzzy matching."""
         t = title.lower().strip()
         # Remove seniority keywords
-        for word in SENIORITY_STRIP:
-            t = t.replace(word, " ")
+        t = _SENIORITY_RE.sub(" ", t)
         # Remove punctuation and collapse spaces
         t = _PUNCT_RE.sub(" ", t)
         t = _SPACES_RE.sub(" ", t).strip()
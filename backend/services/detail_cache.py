@@ -0,0 +1,66 @@
+"""Redis cache of scraper detail pages for conditional GETs across runs.
+
+Por cada URL de detalle se guardan los validadores HTTP (ETag / Last-Modified)
+y el dict ya parseado. En el siguiente run el scraper manda If-None-Match /
+If-Modified-Since; si el portal responde 304 se reutiliza el detalle guardado
+sin descargar ni parsear la página. Sin validadores en la respuesta no se
+guarda nada (no habría forma de revalidar).
+"""
+
+import hashlib
+import logging
+
+import orjson
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+DETAIL_CACHE_TTL_SECONDS = 14 * 24 * 3600
+
+
+def detail_cache_key(source: str, url: str) -> str:
+    return f"scraper_detail:{source}:{hashlib.md5(url.encode()).hexdigest()}"
+
+
+class DetailCache:
+    """Validators + parsed detail per (source, url). Redis errors are non-fatal."""
+
+    def __init__(self, redis) -> None:
+        self._redis = redis
+
+    async def get(self, source: str, url: str) -> dict | None:
+        """Cached entry: {"etag", "last_modified", "detail"}, or None."""
+        try:
+            raw = await self._redis.get(detail_cache_key(source, url))
+            return orjson.loads(raw) if raw else None
+        except (RedisError, orjson.JSONDecodeError):
+            logger.debug("Redis detail cache read failed for %s", url)
+            return None
+
+    async def set(self, source: str, url: str, headers, detail: dict) -> None:
+        """Store `detail` with the response validators, if it sent any."""
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        if not etag and not last_modified:
+            return
+        entry = {"etag": etag, "last_modified": last_modified, "detail": detail}
+        try:
+            await self._redis.set(
+                detail_cache_key(source, url),
+                orjson.dumps(entry),
+                ex=DETAIL_CACHE_TTL_SECONDS,
+            )
+        except RedisError:
+            logger.debug("Redis detail cache write failed for %s", url)
+
+    @staticmethod
+    def conditional_headers(entry: dict | None) -> dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for a cached entry."""
+        if not entry:
+            return {}
+        headers: dict[str, str] = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
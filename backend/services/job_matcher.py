@@ -5,6 +5,8 @@ Model loading is deferred until first use (lazy singleton).
 """
 
 import threading
+from collections.abc import Mapping
+from types import MappingProxyType
 
 import numpy as np
 
@@ -12,14 +14,17 @@ from config import settings
 
 # Default scoring weights (user can customize via profile.score_weights)
 # Language factor added: rewards jobs whose required language matches user profile.
-DEFAULT_WEIGHTS = {
-    "embedding": 0.35,
-    "salary": 0.15,
-    "location": 0.10,
-    "recency": 0.15,
-    "llm": 0.15,
-    "language": 0.10,
-}
+# Solo lectura: es un objeto compartido entre requests y se devuelve tal cual
+DEFAULT_WEIGHTS: Mapping[str, float] = MappingProxyType(
+    {
+        "embedding": 0.35,
+        "salary": 0.15,
+        "location": 0.10,
+        "recency": 0.15,
+        "llm": 0.15,
+        "language": 0.10,
+    }
+)
 
 # Maps ISO 639-1 language codes → lowercase name variants used in user profiles
 _LANGUAGE_CODE_MAP: dict[str, set[str]] = {
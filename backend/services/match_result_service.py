@@ -5,10 +5,12 @@ este servicio sirve/edita los MatchResult persistidos (results, history, saved,
 feedback explícito e implícito). Solo depende de la sesión de BD.
 """
 
+import base64
 import uuid
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import func, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, load_only
 
 from models.job import Job
 from models.match_result import (
@@ -18,6 +20,44 @@ from models.match_result import (
 )
 
 
+def encode_results_cursor(match: MatchResult) -> str:
+    """Opaque keyset cursor pointing just after ``match`` in score order."""
+    raw = f"{match.score_final!r}|{match.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_results_cursor(cursor: str) -> tuple[float, uuid.UUID]:
+    """Inverse of encode_results_cursor. Raises ValueError on a malformed cursor."""
+    score, match_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+    return float(score), uuid.UUID(match_id)
+
+
+# Columnas de Job que usan las respuestas de resultados: ni description completa
+# ni embedding viajan desde Postgres.
+_JOB_RESULT_COLUMNS = load_only(
+    Job.title,
+    Job.language,
+    Job.company,
+    Job.location,
+    Job.url,
+    Job.description_snippet,
+    Job.salary_min_chf,
+    Job.salary_max_chf,
+    Job.tags,
+    Job.source,
+    Job.category,
+)
+
+# Texto del LLM, skills y borrador: solo los pide la vista completa/detalle
+_MATCH_DETAIL_COLUMNS = (
+    defer(MatchResult.explanation),
+    defer(MatchResult.matching_skills),
+    defer(MatchResult.missing_skills),
+    defer(MatchResult.draft_letter),
+    defer(MatchResult.feedback_implicit),
+)
+
+
 class MatchResultService:
     """Consulta y edición de MatchResult para un usuario."""
 
@@ -29,10 +69,14 @@ class MatchResultService:
         user_id: uuid.UUID,
         limit: int = 20,
         offset: int = 0,
-    ) -> tuple[list[dict], int]:
+        after: tuple[float, uuid.UUID] | None = None,
+        brief: bool = False,
+    ) -> tuple[list[tuple[MatchResult, Job]], int]:
         """Get persisted match results with job details.
 
-        Returns (results_with_jobs, total_count).
+        Returns ((match, job) rows from a single JOIN, total_count). Con
+        ``after`` (score_final, id) pagina por keyset y se ignora ``offset``.
+        Con ``brief`` no se cargan explicación, skills ni borrador.
 
         Excluye los resultados con feedback negativo (thumbs_down/dismissed):
         una oferta marcada "not for me" deja de mostrarse de inmediato. El
@@ -51,18 +95,25 @@ class MatchResultService:
         )
         total = (await self.db.execute(count_stmt)).scalar_one()
 
+        # id desempata scores iguales: orden total, necesario para el keyset
         stmt = (
             select(MatchResult, Job)
             .join(Job, MatchResult.job_hash == Job.hash)
             .where(MatchResult.user_id == user_id, not_dismissed)
-            .order_by(MatchResult.score_final.desc())
+            .order_by(MatchResult.score_final.desc(), MatchResult.id.desc())
             .limit(limit)
-            .offset(offset)
+            .options(_JOB_RESULT_COLUMNS)
         )
+        if brief:
+            stmt = stmt.options(*_MATCH_DETAIL_COLUMNS)
+        if after is not None:
+            # Keyset sobre ix_match_results_user_score_id: O(limit) a cualquier
+            # profundidad, en lugar de leer y descartar `offset` filas.
+            stmt = stmt.where(tuple_(MatchResult.score_final, MatchResult.id) < after)
+        else:
+            stmt = stmt.offset(offset)
         rows = (await self.db.execute(stmt)).all()
-
-        results = [{"match": match, "job": job} for match, job in rows]
-        return results, total
+        return rows, total
 
     async def submit_feedback(
         self,
@@ -98,7 +149,7 @@ class MatchResultService:
         user_id: uuid.UUID,
         limit: int = 100,
         offset: int = 0,
-    ) -> tuple[list[dict], int]:
+    ) -> tuple[list[tuple[MatchResult, Job]], int]:
         """Devuelve los empleos marcados como thumbs_up o applied."""
         count_stmt = (
             select(func.count())
@@ -120,10 +171,10 @@ class MatchResultService:
             .order_by(MatchResult.score_final.desc())
             .limit(limit)
             .offset(offset)
+            .options(_JOB_RESULT_COLUMNS)
         )
         rows = (await self.db.execute(stmt)).all()
-        results = [{"match": match, "job": job} for match, job in rows]
-        return results, total
+        return rows, total
 
     async def record_implicit_feedback(
         self,
@@ -153,6 +204,18 @@ class MatchResultService:
         await self.db.refresh(match)
         return match
 
+    async def get_result(
+        self, user_id: uuid.UUID, job_hash: str
+    ) -> tuple[MatchResult, Job] | None:
+        """Un resultado completo con su job, o None."""
+        stmt = (
+            select(MatchResult, Job)
+            .join(Job, MatchResult.job_hash == Job.hash)
+            .where(MatchResult.user_id == user_id, MatchResult.job_hash == job_hash)
+            .options(_JOB_RESULT_COLUMNS)
+        )
+        return (await self.db.execute(stmt)).one_or_none()
+
     async def _get_one(self, user_id: uuid.UUID, job_hash: str) -> MatchResult | None:
         """Carga el MatchResult (user_id, job_hash) o None."""
         stmt = select(MatchResult).where(
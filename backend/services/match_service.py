@@ -1,6 +1,7 @@
 """MatchService — orchestrates the 3-stage AI matching pipeline.
 
-Stage 1: pgvector cosine similarity on ALL active jobs (full catalogue scan)
+Stage 1: pgvector cosine similarity on ALL active jobs (full catalogue scan,
+         or HNSW top-K when MATCH_STAGE1_TOP_K > 0)
 Stage 2: Multi-factor scoring (embedding + salary + location + recency)
 Stage 3: LLM re-ranking via Groq (top N only) — score_llm + explanation
 
@@ -12,7 +13,7 @@ import logging
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import cast, delete, func, literal, or_, select
+from sqlalchemy import cast, delete, func, literal, or_, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sqlalchemy.dialects.postgresql import JSONB
@@ -227,6 +228,13 @@ class MatchService:
             .where(*conditions)
             .order_by(Job.embedding.cosine_distance(profile_embedding))
         )
+        top_k = settings.MATCH_STAGE1_TOP_K
+        if top_k > 0:
+            # Forma ORDER BY <=> LIMIT: la única que el planner resuelve con HNSW.
+            # SET LOCAL vive solo en esta transacción (no contamina el pool).
+            ef_search = max(settings.MATCH_HNSW_EF_SEARCH, top_k)
+            await self.db.execute(text(f"SET LOCAL hnsw.ef_search = {int(ef_search)}"))
+            stmt = stmt.limit(top_k)
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
@@ -9,13 +9,16 @@ viven en `scraper_stealth` (SRP): este módulo solo las orquesta.
 
 import asyncio
 import logging
+import re
 from abc import abstractmethod
 
 import httpx
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, Tag
 
 from config import settings
 from services.circuit_breaker import CircuitBreakerOpen
+from services.detail_cache import DetailCache
 from services.job_service import BaseJobProvider
 from services.scraper_stealth import (
     CHROMIUM_CONTAINER_ARGS,
@@ -30,6 +33,28 @@ from services.scraper_stealth import (
 logger = logging.getLogger(__name__)
 
 
+class PrioritySelector:
+    """CSS selectors tried in priority order over a single tree walk.
+
+    Los listados cambian de maquetación: se prueban varios selectores y gana
+    el primero con coincidencias. La unión se evalúa en un solo recorrido y
+    luego cada candidato se asigna al selector de mayor prioridad que casa.
+    """
+
+    def __init__(self, *selectors: str) -> None:
+        self._patterns = tuple(soupsieve.compile(s) for s in selectors)
+        self._any = soupsieve.compile(", ".join(selectors))
+
+    def first_matching(self, soup: BeautifulSoup | Tag) -> list[Tag]:
+        """Elements of the highest-priority selector that matches anything."""
+        candidates = self._any.select(soup)
+        for pattern in self._patterns:
+            records = [el for el in candidates if pattern.match(el)]
+            if records:
+                return records
+        return []
+
+
 class BaseScraper(BaseJobProvider):
     """Abstract base for HTML-scraping providers.
 
@@ -45,10 +70,28 @@ class BaseScraper(BaseJobProvider):
     - MAX_PAGES: max pagination depth (default 10)
     - NEEDS_PLAYWRIGHT: True for JS-rendered SPAs (default False)
     - FETCH_DETAILS: fetch individual detail pages (default True)
+    - PARSE_LISTING_RAW: parse httpx listing pages from raw bytes with
+      parse_listing_page_raw() instead of building a soup (default False)
+    - PARSE_DETAIL_RAW: parse detail pages from raw bytes with
+      parse_job_detail_raw() instead of building a soup (default False)
+    - STREAM_DETAIL: with PARSE_DETAIL_RAW, read detail bodies in chunks and
+      stop as soon as parse_job_detail_raw() finds data (default False)
+    - STREAM_DETAIL_MARKER: compiled bytes pattern for the tag that closes a
+      parseable block; the streamed body is only re-parsed when a chunk
+      completes one (default </script>, case-insensitive)
+    - STREAM_DRAIN_MAX_BYTES: unread remainder still downloaded after a
+      streamed hit so the connection stays reusable (default 128 KiB)
+    - CACHE_DETAILS: revalidate detail pages with conditional GETs against
+      the injected `_detail_cache` (default False)
+    - DETAIL_CONCURRENCY: detail requests in flight at once (default 1);
+      starts stay spaced by RATE_LIMIT_SECONDS
     - PAGE_SIZE: expected jobs per page (default 20)
     - MAX_RETRIES / RETRY_BACKOFF_SECONDS: reintento de errores transitorios
     - JITTER_RATIO: aleatoriedad añadida al rate-limit (anti-patrón de bot)
     - SOFT_BLOCK_MARKERS: substrings que delatan una pantalla anti-bot
+
+    Los scrapers compilan sus selectores CSS a nivel de módulo
+    (`soupsieve.compile` / PrioritySelector): una vez por proceso, no por página.
     """
 
     LISTING_URL: str = ""
@@ -56,6 +99,13 @@ class BaseScraper(BaseJobProvider):
     MAX_PAGES: int = 10
     NEEDS_PLAYWRIGHT: bool = False
     FETCH_DETAILS: bool = True
+    PARSE_LISTING_RAW: bool = False
+    PARSE_DETAIL_RAW: bool = False
+    STREAM_DETAIL: bool = False
+    STREAM_DETAIL_MARKER: re.Pattern[bytes] = re.compile(rb"</script>", re.IGNORECASE)
+    STREAM_DRAIN_MAX_BYTES: int = 128 * 1024
+    CACHE_DETAILS: bool = False
+    DETAIL_CONCURRENCY: int = 1
     PAGE_SIZE: int = 20
 
     # Anti-detección (valores por defecto desde settings; sobreescribibles).
@@ -64,6 +114,10 @@ class BaseScraper(BaseJobProvider):
     RETRY_BACKOFF_SECONDS: float = settings.SCRAPER_RETRY_BACKOFF_SECONDS
     SOFT_BLOCK_MARKERS: tuple[str, ...] = DEFAULT_SOFT_BLOCK_MARKERS
 
+    # Caché de detalles entre runs (ETag/Last-Modified), inyectada por el
+    # pipeline antes de fetch_jobs.
+    _detail_cache: DetailCache | None = None
+
     # Estados HTTP que merecen reintento (servicio temporalmente caído).
     # Alineado con utils.http.DEFAULT_RETRY_STATUSES salvo 429, que aquí se
     # trata como bloqueo de compliance (ver BLOCK_STATUS), no como reintento.
@@ -214,46 +268,68 @@ class BaseScraper(BaseJobProvider):
     async def _scrape_with_httpx(self, query: str) -> list[dict]:
         """Fetch listing pages with httpx, parse with BeautifulSoup."""
         all_jobs: list[dict] = []
+        # Sin páginas de detalle, las peticiones del listado se espacian de
+        # inicio a inicio: la espera corre mientras llega la respuesta y se
+        # parsea. Sigue habiendo una sola petición en vuelo y nunca más de una
+        # cada RATE_LIMIT_SECONDS. Con detalles se espera tras la página, para
+        # no encadenar el último detalle con el siguiente listado.
+        pacing: asyncio.Task | None = None
 
         async with httpx.AsyncClient(**self._build_httpx_kwargs()) as client:
-            for page in range(1, self._pages_budget() + 1):
-                url = self.build_listing_url(page, query)
-
-                try:
-                    response = await self._request_with_retry(
-                        lambda u=url: client.get(u)
-                    )
-                except (CircuitBreakerOpen, httpx.HTTPError) as e:
-                    logger.error(
-                        "%s listing page %d error: %s", self.SOURCE_NAME, page, e
-                    )
-                    break
-
-                if await self._listing_status_stops(response.status_code, page):
-                    break
-
-                stubs = self.parse_listing_page(BeautifulSoup(response.text, "lxml"))
-                if not stubs:
-                    await self._maybe_report_soft_block(response.text, page)
-                    break
-
-                all_jobs.extend(await self._collect_page_jobs(client, stubs))
-
-                # Crawler incremental: si la página entera ya se había visto, hemos
-                # alcanzado el contenido sincronizado → parar (no seguir paginando).
-                if self._page_all_known(stubs):
-                    self._stop_reason = "known_page"
-                    logger.info(
-                        "%s early-stop en página %d: sin ofertas nuevas (cursor)",
-                        self.SOURCE_NAME,
-                        page,
-                    )
-                    break
-
-                if len(stubs) < self.PAGE_SIZE:
-                    break
-
-                await self._rate_limit_delay()
+            try:
+                for page in range(1, self._pages_budget() + 1):
+                    if pacing is not None:
+                        await pacing
+                    if not self.FETCH_DETAILS:
+                        pacing = asyncio.create_task(self._rate_limit_delay())
+                    url = self.build_listing_url(page, query)
+
+                    try:
+                        response = await self._request_with_retry(
+                            lambda u=url: client.get(u)
+                        )
+                    except (CircuitBreakerOpen, httpx.HTTPError) as e:
+                        logger.error(
+                            "%s listing page %d error: %s", self.SOURCE_NAME, page, e
+                        )
+                        break
+
+                    if await self._listing_status_stops(response.status_code, page):
+                        break
+
+                    # Listados con el JSON embebido (__NEXT_DATA__...): sin árbol HTML
+                    if self.PARSE_LISTING_RAW:
+                        stubs = self.parse_listing_page_raw(response.content)
+                    else:
+                        stubs = self.parse_listing_page(
+                            BeautifulSoup(response.text, "lxml")
+                        )
+                    if not stubs:
+                        await self._maybe_report_soft_block(response.text, page)
+                        break
+
+                    all_jobs.extend(await self._collect_page_jobs(client, stubs))
+
+                    # Crawler incremental: si la página entera ya se había visto, hemos
+                    # alcanzado el contenido sincronizado → parar (no seguir paginando).
+                    if self._page_all_known(stubs):
+                        self._stop_reason = "known_page"
+                        logger.info(
+                            "%s early-stop en página %d: sin ofertas nuevas (cursor)",
+                            self.SOURCE_NAME,
+                            page,
+                        )
+                        break
+
+                    if len(stubs) < self.PAGE_SIZE:
+                        break
+
+                    if self.FETCH_DETAILS:
+                        await self._rate_limit_delay()
+            finally:
+                # Sin más páginas: la espera pendiente ya no hace falta
+                if pacing is not None:
+                    pacing.cancel()
 
         logger.info("%s scraped %d raw jobs", self.SOURCE_NAME, len(all_jobs))
         return all_jobs
@@ -302,24 +378,59 @@ class BaseScraper(BaseJobProvider):
         """Devuelve los stubs de una página, enriquecidos con su detalle si procede."""
         if not self.FETCH_DETAILS:
             return stubs
-        for stub in stubs:
-            detail_url = stub.get("detail_url")
-            if detail_url:
-                await self._rate_limit_delay()
-                detail = await self._fetch_detail_httpx(client, detail_url)
-                if detail:
-                    stub.update(detail)
+        await self._fetch_details(client, stubs)
         return stubs
 
+    async def _fetch_details(
+        self, client: httpx.AsyncClient, stubs: list[dict]
+    ) -> None:
+        """Enriquece in place cada stub con ``detail_url`` con su página de detalle.
+
+        Los arranques de petición siguen espaciados por el rate-limit (misma
+        cadencia hacia el portal), pero hasta DETAIL_CONCURRENCY peticiones
+        pueden estar en vuelo: la latencia de una respuesta se solapa con la
+        espera de la siguiente en vez de sumarse a ella.
+        """
+        slots = asyncio.Semaphore(self.DETAIL_CONCURRENCY)
+        pacing = asyncio.Lock()
+
+        async def fetch_one(stub: dict) -> None:
+            async with slots:
+                async with pacing:
+                    await self._rate_limit_delay()
+                detail = await self._fetch_detail_httpx(client, stub["detail_url"])
+            if detail:
+                stub.update(detail)
+
+        await asyncio.gather(
+            *(fetch_one(stub) for stub in stubs if stub.get("detail_url"))
+        )
+
     async def _fetch_detail_httpx(
         self, client: httpx.AsyncClient, url: str
     ) -> dict | None:
-        """Fetch a single job detail page and parse it."""
+        """Fetch a single job detail page and parse it.
+
+        Con CACHE_DETAILS y `_detail_cache` inyectado la petición es condicional:
+        un 304 devuelve el detalle guardado en un run anterior, sin parsear.
+        """
+        cached = await self._cached_detail(url)
+        headers = DetailCache.conditional_headers(cached)
         try:
-            response = await client.get(url)
+            if self.PARSE_DETAIL_RAW and self.STREAM_DETAIL:
+                return await self._fetch_detail_streamed(client, url, headers, cached)
+            response = await client.get(url, headers=headers)
+            if response.status_code == 304 and cached:
+                return cached["detail"]
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, "lxml")
-                return self.parse_job_detail(soup)
+                # Detalles con datos estructurados (JSON-LD...): sin árbol HTML
+                if self.PARSE_DETAIL_RAW:
+                    detail = self.parse_job_detail_raw(response.content)
+                else:
+                    soup = BeautifulSoup(response.text, "lxml")
+                    detail = self.parse_job_detail(soup)
+                await self._remember_detail(url, response, detail)
+                return detail
             # Sin retry aquí: un 503 transitorio no debe contar como bloqueo (solo el
             # path de listado, que sí reintenta, reporta el 503 si persiste).
             if response.status_code in self.IMMEDIATE_BLOCK_STATUS:
@@ -333,6 +444,77 @@ class BaseScraper(BaseJobProvider):
             )
         return None
 
+    async def _fetch_detail_streamed(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        headers: dict[str, str],
+        cached: dict | None,
+    ) -> dict | None:
+        """Fetch a detail page chunk by chunk, stopping once it yields data.
+
+        parse_job_detail_raw() debe devolver {} mientras le falten datos. Solo
+        se reintenta cuando un trozo completa un STREAM_DETAIL_MARKER (el
+        solape cubre un marcador partido entre trozos), no tras cada trozo, y
+        una vez más al final si el cuerpo no cerraba con el marcador.
+        Con el detalle encontrado, un resto pequeño se descarga igualmente: la
+        conexión vuelve al pool, y reabrirla cuesta más que esos bytes.
+        """
+        marker = self.STREAM_DETAIL_MARKER
+        overlap = len(marker.pattern) - 1
+        async with client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 304 and cached:
+                return cached["detail"]
+            if response.status_code != 200:
+                if response.status_code in self.IMMEDIATE_BLOCK_STATUS:
+                    await self._report_block(response.status_code)
+                return None
+            body = bytearray()
+            parsed = 0  # bytes de body ya vistos por el parser
+            detail: dict = {}
+            async for chunk in response.aiter_bytes():
+                if detail:
+                    continue  # drenando el resto
+                start = max(len(body) - overlap, 0)
+                body += chunk
+                if not marker.search(body, start):
+                    continue
+                parsed = len(body)
+                detail = self.parse_job_detail_raw(bytes(body))
+                if detail:
+                    await self._remember_detail(url, response, detail)
+                    if not self._cheap_to_drain(response):
+                        return detail
+            if not detail and len(body) > parsed:
+                # Sin marcador tras el último bloque: el cuerpo completo decide
+                detail = self.parse_job_detail_raw(bytes(body))
+                if detail:
+                    await self._remember_detail(url, response, detail)
+        return detail
+
+    def _cheap_to_drain(self, response: httpx.Response) -> bool:
+        """Whether the unread rest of `response` fits STREAM_DRAIN_MAX_BYTES."""
+        length = response.headers.get("content-length", "")
+        if not length.isdigit():
+            return False
+        remaining = int(length) - response.num_bytes_downloaded
+        return remaining <= self.STREAM_DRAIN_MAX_BYTES
+
+    async def _cached_detail(self, url: str) -> dict | None:
+        """Cached detail entry for `url`, if this scraper caches details."""
+        if not self.CACHE_DETAILS or self._detail_cache is None:
+            return None
+        return await self._detail_cache.get(self.SOURCE_NAME, url)
+
+    async def _remember_detail(
+        self, url: str, response: httpx.Response, detail: dict
+    ) -> None:
+        """Store a freshly parsed detail with the response's validators."""
+        if self.CACHE_DETAILS and self._detail_cache is not None and detail:
+            await self._detail_cache.set(
+                self.SOURCE_NAME, url, response.headers, detail
+            )
+
     # ------------------------------------------------------------------
     # Playwright scraping (for JS-rendered SPAs) — endurecido (stealth)
     # ------------------------------------------------------------------
@@ -462,3 +644,17 @@ class BaseScraper(BaseJobProvider):
         Returns dict of additional fields to merge into the listing stub.
         """
         ...
+
+    def parse_listing_page_raw(self, content: bytes) -> list[dict]:
+        """Extract job stubs from the raw listing page body.
+
+        Used instead of parse_listing_page() when PARSE_LISTING_RAW is True.
+        """
+        return self.parse_listing_page(BeautifulSoup(content, "lxml"))
+
+    def parse_job_detail_raw(self, content: bytes) -> dict:
+        """Extract job details from the raw detail page body.
+
+        Used instead of parse_job_detail() when PARSE_DETAIL_RAW is True.
+        """
+        return self.parse_job_detail(BeautifulSoup(content, "lxml"))
@@ -4,11 +4,11 @@ Events: new_matches, search_complete, job_update
 """
 
 import asyncio
-import json
 import logging
 import uuid
-from collections import defaultdict
+from collections import defaultdict, deque
 
+import orjson
 import redis.asyncio as aioredis
 
 logger = logging.getLogger(__name__)
@@ -17,10 +17,68 @@ SSE_CHANNEL_PREFIX = "sse:"
 SSE_BROADCAST_CHANNEL = "sse:__broadcast__"
 
 
+class SSESubscription:
+    """Bounded per-connection buffer: a deque guarded by an asyncio.Condition.
+
+    A diferencia de asyncio.Queue, el límite (max_buffered) se puede cambiar en
+    caliente sin tocar estado interno de la cola: resize() recorta bajo el lock
+    y hace notify_all() para que los waiters re-evalúen su predicado.
+    """
+
+    def __init__(self, max_buffered: int) -> None:
+        self.max_buffered = max_buffered
+        self._buffer: deque[dict] = deque()
+        self._cond = asyncio.Condition()
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def full(self) -> bool:
+        return len(self._buffer) >= self.max_buffered
+
+    async def put(self, message: dict) -> int:
+        """Append a message, dropping the oldest over the bound. Returns drops."""
+        async with self._cond:
+            self._buffer.append(message)
+            dropped = self._trim()
+            self._cond.notify(1)
+        return dropped
+
+    async def get(self) -> dict | None:
+        """Wait for the next message. Returns None once the subscription is closed."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._buffer or self._closed)
+            if self._closed:
+                return None
+            return self._buffer.popleft()
+
+    async def resize(self, max_buffered: int) -> int:
+        """Change the bound in place. Returns how many buffered events were dropped."""
+        async with self._cond:
+            self.max_buffered = max_buffered
+            dropped = self._trim()
+            self._cond.notify_all()
+        return dropped
+
+    async def close(self) -> None:
+        """Wake every waiter with None so the stream can finish."""
+        async with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def _trim(self) -> int:
+        dropped = 0
+        while len(self._buffer) > self.max_buffered:
+            self._buffer.popleft()
+            dropped += 1
+        return dropped
+
+
 class SSEManager:
     """Manages SSE connections per user with Redis pub/sub for multi-worker support.
 
-    Each worker maintains local asyncio.Queue instances per connection.
+    Each worker maintains a local SSESubscription per connection.
     Redis pub/sub bridges events across workers.
     """
 
@@ -31,7 +89,7 @@ class SSEManager:
     ):
         self._redis = redis_client
         self._queue_maxsize = queue_maxsize
-        self._connections: dict[uuid.UUID, set[asyncio.Queue]] = defaultdict(set)
+        self._connections: dict[uuid.UUID, set[SSESubscription]] = defaultdict(set)
         self._pubsub: aioredis.client.PubSub | None = None
         self._listener_task: asyncio.Task | None = None
         self._dropped_events: int = 0
@@ -58,65 +116,65 @@ class SSEManager:
         if self._pubsub:
             await self._pubsub.punsubscribe()
             await self._pubsub.aclose()
+        for subscriptions in list(self._connections.values()):
+            for subscription in list(subscriptions):
+                await subscription.close()
         self._connections.clear()
         logger.info("SSEManager stopped (dropped events: %d)", self._dropped_events)
 
     # --- Connection management ---
 
-    async def subscribe(self, user_id: uuid.UUID) -> asyncio.Queue:
+    async def subscribe(self, user_id: uuid.UUID) -> SSESubscription:
         """Create a new bounded SSE subscription for a user."""
-        queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_maxsize)
-        self._connections[user_id].add(queue)
-        return queue
+        subscription = SSESubscription(self._queue_maxsize)
+        self._connections[user_id].add(subscription)
+        return subscription
 
-    def unsubscribe(self, user_id: uuid.UUID, queue: asyncio.Queue) -> None:
+    def unsubscribe(self, user_id: uuid.UUID, subscription: SSESubscription) -> None:
         """Remove a subscription when the client disconnects."""
-        queues = self._connections.get(user_id)
-        if queues:
-            queues.discard(queue)
-            if not queues:
+        subscriptions = self._connections.get(user_id)
+        if subscriptions:
+            subscriptions.discard(subscription)
+            if not subscriptions:
                 del self._connections[user_id]
 
+    async def set_max_buffered(self, max_buffered: int) -> None:
+        """Resize every live buffer (and the default for new ones) without reconnecting."""
+        self._queue_maxsize = max_buffered
+        for subscriptions in list(self._connections.values()):
+            for subscription in list(subscriptions):
+                self._dropped_events += await subscription.resize(max_buffered)
+
     # --- Broadcasting (publish to Redis) ---
 
     async def broadcast_to_user(
         self, user_id: uuid.UUID, event_type: str, data: dict
     ) -> None:
         """Publish an event for a specific user via Redis."""
-        message = json.dumps({"event": event_type, "data": data})
+        message = orjson.dumps({"event": event_type, "data": data})
         channel = f"{SSE_CHANNEL_PREFIX}{user_id}"
         await self._redis.publish(channel, message)
 
     async def broadcast_to_all(self, event_type: str, data: dict) -> None:
         """Publish a broadcast event to all connected users via Redis."""
-        message = json.dumps({"event": event_type, "data": data})
+        message = orjson.dumps({"event": event_type, "data": data})
         await self._redis.publish(SSE_BROADCAST_CHANNEL, message)
 
     # --- Local fanout ---
 
-    def _fanout_to_local(self, user_id: uuid.UUID, message: dict) -> int:
-        """Deliver a message to all local queues for a user. Returns count delivered."""
-        queues = self._connections.get(user_id)
-        if not queues:
+    async def _fanout_to_local(self, user_id: uuid.UUID, message: dict) -> int:
+        """Deliver a message to all local subscriptions for a user. Returns count."""
+        subscriptions = self._connections.get(user_id)
+        if not subscriptions:
             return 0
 
         sent = 0
-        for queue in list(queues):
-            try:
-                queue.put_nowait(message)
-                sent += 1
-            except asyncio.QueueFull:
-                # Drop oldest, enqueue new (TD-01 + TD-12)
-                try:
-                    queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    pass
-                try:
-                    queue.put_nowait(message)
-                    sent += 1
-                except asyncio.QueueFull:
-                    pass
-                self._dropped_events += 1
+        for subscription in list(subscriptions):
+            # Overflow: se descarta el más antiguo y entra el nuevo (TD-01 + TD-12)
+            dropped = await subscription.put(message)
+            sent += 1
+            if dropped:
+                self._dropped_events += dropped
                 logger.warning(
                     "SSE queue overflow for user %s — dropped oldest event "
                     "(total drops: %d)",
@@ -125,17 +183,17 @@ class SSEManager:
                 )
         return sent
 
-    def _fanout_to_all_local(self, message: dict) -> int:
+    async def _fanout_to_all_local(self, message: dict) -> int:
         """Deliver a broadcast message to all local connections."""
         total = 0
         for user_id in list(self._connections):
-            total += self._fanout_to_local(user_id, message)
+            total += await self._fanout_to_local(user_id, message)
         return total
 
     # --- Redis listener ---
 
     async def _listen(self) -> None:
-        """Background task: consume Redis pub/sub and fan out to local queues."""
+        """Background task: consume Redis pub/sub and fan out to local buffers."""
         try:
             async for raw_message in self._pubsub.listen():
                 if raw_message["type"] != "pmessage":
@@ -146,19 +204,22 @@ class SSEManager:
                     channel = channel.decode()
 
                 try:
-                    message = json.loads(raw_message["data"])
-                except (json.JSONDecodeError, TypeError):
+                    message = orjson.loads(raw_message["data"])
+                    # El payload se serializa una vez por mensaje, no una vez por
+                    # conexión: un broadcast llega a todas las suscripciones.
+                    message["raw_data"] = orjson.dumps(message.get("data", {})).decode()
+                except (orjson.JSONDecodeError, TypeError, AttributeError):
                     continue
 
                 if channel == SSE_BROADCAST_CHANNEL:
-                    self._fanout_to_all_local(message)
+                    await self._fanout_to_all_local(message)
                 elif channel.startswith(SSE_CHANNEL_PREFIX):
                     uid_str = channel[len(SSE_CHANNEL_PREFIX) :]
                     try:
                         user_id = uuid.UUID(uid_str)
                     except ValueError:
                         continue
-                    self._fanout_to_local(user_id, message)
+                    await self._fanout_to_local(user_id, message)
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -168,16 +229,9 @@ class SSEManager:
 
     def get_active_connections(self) -> dict:
         """Return count of active connections per user (for monitoring)."""
-        return {
-            str(uid): len(queues) for uid, queues in self._connections.items() if queues
-        }
+        return {str(uid): len(subs) for uid, subs in self._connections.items() if subs}
 
     @property
     def dropped_events(self) -> int:
         """Total number of events dropped due to queue overflow."""
         return self._dropped_events
-
-    @staticmethod
-    def format_sse(event_type: str, data: dict) -> str:
-        """Format a message as an SSE text stream."""
-        return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
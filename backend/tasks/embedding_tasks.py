@@ -59,7 +59,8 @@ async def _generate_profile_embedding_async(user_id: str) -> dict[str, Any]:
         combined_text = " ".join(parts)
 
         embedding = await asyncio.to_thread(matcher.encode, combined_text)
-        profile.cv_embedding = embedding.tolist()
+        # La columna es halfvec: cuantizar aquí hace explícito el redondeo a FP16
+        profile.cv_embedding = embedding.astype("float16").tolist()
         await db.commit()
 
         logger.info(
@@ -147,7 +148,7 @@ async def _embed_pending_batch(db, matcher, batch_size: int) -> int:
     ]
     embeddings = await asyncio.to_thread(matcher.encode_batch, texts)
     for job, emb in zip(jobs, embeddings):
-        job.embedding = emb.tolist()
+        job.embedding = emb.astype("float16").tolist()
     await db.commit()
     return len(jobs)
 
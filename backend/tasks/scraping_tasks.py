@@ -8,6 +8,8 @@ import asyncio
 import logging
 from typing import Any
 
+import redis.asyncio as aioredis
+
 from celery_app import celery_app
 from config import settings
 from database import task_session
@@ -16,6 +18,7 @@ from services.crawler_budget import CrawlerBudgetService
 from services.cursor_store import CursorStore
 from services.data_normalizer import DataNormalizer
 from services.deduplicator import Deduplicator
+from services.detail_cache import DetailCache
 from services.job_repository import JobRepository
 
 logger = logging.getLogger(__name__)
@@ -77,11 +80,16 @@ async def _fetch_scrapers_async() -> dict[str, Any]:
         "errors": 0,
     }
 
-    async with task_session() as db:
+    async with (
+        task_session() as db,
+        aioredis.from_url(settings.REDIS_URL) as redis_client,
+    ):
         repo = JobRepository(db)
+        detail_cache = DetailCache(redis_client)
 
         for scraper in scrapers:
             source = scraper.get_source_name()
+            scraper._detail_cache = detail_cache
             cursor = None
             try:
                 if store is not None:
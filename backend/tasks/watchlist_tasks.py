@@ -26,9 +26,9 @@ def _get_watchlist_sources() -> tuple[str, ...]:
     parte de la watchlist. Esto evita la divergencia silenciosa que tenía
     la lista hardcoded cuando se añadían nuevos scrapers (Fase 2-3).
     """
-    from scrapers import _SCRAPER_CLASSES
+    from scrapers import get_scraper_names
 
-    return tuple(k for k in _SCRAPER_CLASSES if k.startswith("swiss_schools_"))
+    return tuple(k for k in get_scraper_names() if k.startswith("swiss_schools_"))
 
 
 # Umbral de "scraper silencioso": si lleva más de N horas sin éxito
@@ -29,7 +29,7 @@ async def _register_and_get_token(client: AsyncClient) -> tuple[str, str]:
 
 def _job_data(idx: int, **overrides) -> dict:
     base = {
-        "hash": f"app{idx:029d}"[:32],
+        "hash": f"a{idx:031d}",
         "source": "test_source",
         "title": f"Engineer {idx}",
         "company": f"Corp {idx}",
@@ -96,10 +96,20 @@ class TestApplicationsCRUD:
         resp = await client.post(
             "/api/v1/applications",
             headers=_auth(token),
-            json={"job_hash": "nonexistent000000000000000000000"},
+            json={"job_hash": "f" * 32},
         )
         assert resp.status_code == 404
 
+    async def test_create_malformed_hash_rejected(self, client: AsyncClient):
+        token, _ = await _register_and_get_token(client)
+        for bad in ("abc", "g" * 32, "A" * 32, "'; DROP TABLE jobs; --"):
+            resp = await client.post(
+                "/api/v1/applications",
+                headers=_auth(token),
+                json={"job_hash": bad},
+            )
+            assert resp.status_code == 422, bad
+
     async def test_create_duplicate_conflict(
         self, client: AsyncClient, db_session: AsyncSession
     ):
@@ -160,6 +170,28 @@ class TestApplicationsCRUD:
         assert resp.status_code == 200
         assert resp.json()["notes"] == "Updated notes"
 
+    async def test_update_returns_job_and_fresh_updated_at(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        token, _ = await _register_and_get_token(client)
+        job_hash = await _insert_job(db_session)
+
+        create_resp = await client.post(
+            "/api/v1/applications",
+            headers=_auth(token),
+            json={"job_hash": job_hash},
+        )
+        created = create_resp.json()
+
+        resp = await client.patch(
+            f"/api/v1/applications/{created['id']}",
+            headers=_auth(token),
+            json={"notes": "Follow up next week"},
+        )
+        data = resp.json()
+        assert data["job_title"] == created["job_title"]
+        assert data["updated_at"] > created["updated_at"]
+
     async def test_update_not_found(self, client: AsyncClient):
         token, _ = await _register_and_get_token(client)
         fake_id = str(uuid.uuid4())
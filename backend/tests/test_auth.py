@@ -185,6 +185,28 @@ class TestMe:
         assert response.status_code == 200
         assert response.json()["email"] == email
 
+    async def test_me_revalidates_with_etag(self, client: AsyncClient):
+        reg = await client.post(
+            "/api/v1/auth/register",
+            json={
+                "email": random_email(),
+                "password": "SecureP@ss1",
+                "gdpr_consent": True,
+            },
+        )
+        headers = {"Authorization": f"Bearer {reg.json()['access_token']}"}
+
+        first = await client.get("/api/v1/auth/me", headers=headers)
+        # Datos del usuario: revalidar siempre, nunca servir los de otro token
+        assert first.headers["cache-control"] == "private, no-cache"
+        assert "Authorization" in first.headers["vary"]
+
+        second = await client.get(
+            "/api/v1/auth/me",
+            headers={**headers, "If-None-Match": first.headers["etag"]},
+        )
+        assert second.status_code == 304
+
     async def test_me_no_token(self, client: AsyncClient):
         response = await client.get("/api/v1/auth/me")
         assert response.status_code == 401
@@ -218,3 +240,25 @@ class TestMe:
             headers={"Authorization": f"Bearer {expired_token}"},
         )
         assert response.status_code == 401
+
+    async def test_current_user_comes_with_profile_loaded(
+        self, client: AsyncClient, db_session
+    ):
+        from sqlalchemy import inspect
+
+        from core.security import get_current_user
+
+        response = await client.post(
+            "/api/v1/auth/register",
+            json={
+                "email": random_email(),
+                "password": "SecureP@ss1",
+                "gdpr_consent": True,
+            },
+        )
+        token = response.json()["access_token"]
+
+        user = await get_current_user(token=token, db=db_session)
+        # lazy="raise": si no viniera precargado, acceder lanzaría
+        assert "profile" not in inspect(user).unloaded
+        assert user.profile.user_id == user.id
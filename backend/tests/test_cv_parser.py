@@ -72,6 +72,23 @@ class TestExtractText:
             CVParser.extract_text(b"data", "text/plain")
 
 
+class TestExtractTextFromStream:
+    def test_docx_from_spooled_file(self):
+        import tempfile
+
+        # max_size mínimo: el contenido ya está volcado a disco
+        with tempfile.SpooledTemporaryFile(max_size=16) as spool:
+            spool.write(_make_docx("Hello from a spooled DOCX"))
+            result = CVParser.extract_text_from_stream(spool, DOCX_TYPE)
+        assert "spooled" in result
+
+    def test_pdf_from_stream_rewinds(self):
+        stream = io.BytesIO(_make_pdf("Hello from a PDF stream"))
+        stream.seek(0, io.SEEK_END)
+        result = CVParser.extract_text_from_stream(stream, PDF_TYPE)
+        assert "Hello" in result
+
+
 class TestExtractSkills:
     def test_finds_known_skills(self):
         # SKILL_PATTERNS (Fase 5) cubre idiomas, docencia, contenido, RRHH y gestión.
@@ -1,6 +1,7 @@
 """Tests for DataNormalizer service: salary, language, seniority, contract type."""
 
-from services.data_normalizer import DataNormalizer
+from services import data_normalizer
+from services.data_normalizer import LANGDETECT_MAX_CHARS, DataNormalizer
 
 
 def _base_job(**overrides):
@@ -125,6 +126,24 @@ class TestSalaryNormalization:
         assert result["salary_min_chf"] == 56_000
         assert result["salary_max_chf"] == 56_000
 
+    def test_parse_number_separators(self):
+        """Thousands vs decimal separators, US and European style."""
+        parse = DataNormalizer._parse_number
+        assert parse("100.000") == 100_000
+        assert parse("80,000") == 80_000
+        assert parse("1.200.000") == 1_200_000
+        assert parse("1,234.56") == 1234.56
+        assert parse("1.234,56") == 1234.56
+        assert parse("12,50") == 12.5
+        assert parse("80.5", "80.5k") == 80_500
+
+    def test_parse_decimal_k_salary(self):
+        """'80.5k-95k' keeps the decimal instead of reading 805k."""
+        job = _base_job(salary_original="80.5k-95k CHF")
+        result = DataNormalizer.normalize_salary(job)
+        assert result["salary_min_chf"] == 80_500
+        assert result["salary_max_chf"] == 95_000
+
     def test_salary_with_period_multiplier(self):
         """Salary with explicit period uses the correct multiplier."""
         job = _base_job(
@@ -188,6 +207,20 @@ class TestLanguageDetection:
         result = DataNormalizer.detect_language(job)
         assert result["language"] is None
 
+    def test_long_text_capped_before_detection(self, monkeypatch):
+        """Only the first LANGDETECT_MAX_CHARS characters reach langdetect."""
+        seen: list[str] = []
+
+        def fake_detect_langs(text):
+            seen.append(text)
+            return []
+
+        monkeypatch.setattr(data_normalizer, "detect_langs", fake_detect_langs)
+        job = _base_job(title="Software Engineer", description="word " * 2000)
+        DataNormalizer.detect_language(job)
+        assert len(seen[0]) == LANGDETECT_MAX_CHARS
+        assert seen[0].startswith("Software Engineer word")
+
 
 # ---------------------------------------------------------------------------
 # Seniority inference
@@ -333,3 +366,15 @@ class TestNormalizeIntegration:
 
         # Contract type was "contract" -> not overwritten
         assert result["contract_type"] == "contract"
+
+    def test_small_domain_values_interned(self):
+        """Repeated enum-like strings share one object across jobs."""
+        # decode() crea un str nuevo por job, como el texto parseado de una página
+        jobs = [
+            DataNormalizer.normalize(
+                _base_job(source=b"financejobs".decode(), canton=b"ZH".decode())
+            )
+            for _ in range(2)
+        ]
+        assert jobs[0]["source"] is jobs[1]["source"]
+        assert jobs[0]["canton"] is jobs[1]["canton"]
@@ -32,6 +32,14 @@ class TestComputeFuzzyHash:
         h2 = Deduplicator.compute_fuzzy_hash("Developer", "Acme")
         assert h1 == h2
 
+    def test_title_normalization_matches_stored_hashes(self):
+        """Seniority words are stripped as substrings, as when hashes were stored."""
+        assert (
+            Deduplicator._normalize_title("Sr. International Team Lead (m/w/d)")
+            == "ational team"
+        )
+        assert Deduplicator._normalize_title("Head of Sales, m/f/d") == "of sales"
+
     def test_company_suffix_ag(self):
         """Legal suffix 'AG' is stripped from company name."""
         h1 = Deduplicator.compute_fuzzy_hash("Developer", "Acme AG")
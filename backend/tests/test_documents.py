@@ -1,15 +1,23 @@
 """Tests for AI document generation endpoints (CV and cover letter)."""
 
+import asyncio
+import json
 import uuid
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from httpx import AsyncClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
+from main import app
+from models.generated_document import GeneratedDocument
 from models.job import Job
 from models.user import User
+from routers.documents import _release_generation_lock
+from services.document_generator import DocumentGeneratorService
 from tests.conftest import random_email
 
 
@@ -51,7 +59,7 @@ async def _register_and_get_token(client: AsyncClient) -> tuple[str, str]:
 async def _insert_job(db: AsyncSession, idx: int = 0) -> str:
     valid_columns = {c.key for c in Job.__table__.columns}
     data = {
-        "hash": f"doc{idx:029d}"[:32],
+        "hash": f"d{idx:031d}",
         "source": "test_source",
         "title": f"Senior Python Developer {idx}",
         "company": f"SwissTech Corp {idx}",
@@ -74,8 +82,13 @@ async def _insert_job(db: AsyncSession, idx: int = 0) -> str:
 
 async def _set_cv_text(db: AsyncSession, user_email: str) -> None:
     """Set CV text on user's profile for testing."""
-    user = (await db.execute(select(User).where(User.email == user_email))).scalar_one()
-    await db.refresh(user, ["profile"])
+    user = (
+        await db.execute(
+            select(User)
+            .options(joinedload(User.profile))
+            .where(User.email == user_email)
+        )
+    ).scalar_one()
     user.profile.cv_text = (
         "Experienced Python developer with 5 years in backend development. "
         "Skills: Python, FastAPI, Django, PostgreSQL, Docker, Kubernetes."
@@ -94,7 +107,7 @@ class TestDocumentValidation:
     async def test_generate_requires_auth(self, client: AsyncClient):
         resp = await client.post(
             "/api/v1/documents/generate",
-            json={"job_hash": "x" * 32, "doc_type": "cv"},
+            json={"job_hash": "f" * 32, "doc_type": "cv"},
         )
         assert resp.status_code == 401
 
@@ -120,7 +133,7 @@ class TestDocumentValidation:
             "/api/v1/documents/generate",
             headers=_auth(token),
             json={
-                "job_hash": "nonexistent000000000000000000000",
+                "job_hash": "f" * 32,
                 "doc_type": "cv",
             },
         )
@@ -315,6 +328,172 @@ class TestDocumentGeneration:
         assert resp.status_code == 503
         assert "GEMINI_API_KEY" in resp.json()["detail"]
 
+    @staticmethod
+    async def _inflight_setup(
+        client, db_session, redis_client, monkeypatch, mock_get_groq, mock_get_gemini
+    ):
+        """Usuario con CV + oferta; devuelve (token, job_hash, cache_key, groq)."""
+        mock_groq = AsyncMock()
+        mock_groq.is_available = True
+        mock_groq.get_chat_response = AsyncMock(return_value=_MOCK_CV_CONTENT)
+        mock_get_groq.return_value = mock_groq
+        mock_get_gemini.return_value = _gemini_off()
+        monkeypatch.setattr(app.state, "redis_client", redis_client, raising=False)
+
+        token, email = await _register_and_get_token(client)
+        await _set_cv_text(db_session, email)
+        job_hash = await _insert_job(db_session, idx=13)
+        user = (
+            await db_session.execute(select(User).where(User.email == email))
+        ).scalar_one()
+        cache_key = DocumentGeneratorService.cache_key(
+            str(user.id), job_hash, "cv", "en"
+        )
+        return token, job_hash, cache_key, mock_groq
+
+    @patch("routers.documents._GEN_POLL_INITIAL_SECONDS", 0.05)
+    @patch("routers.documents._get_gemini")
+    @patch("routers.documents._get_groq")
+    async def test_concurrent_request_waits_for_inflight_generation(
+        self,
+        mock_get_groq,
+        mock_get_gemini,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        redis_client,
+        monkeypatch,
+    ):
+        # Otro request ya tiene el lock: este espera al documento cacheado y NO
+        # vuelve a llamar al LLM.
+        token, job_hash, cache_key, mock_groq = await self._inflight_setup(
+            client,
+            db_session,
+            redis_client,
+            monkeypatch,
+            mock_get_groq,
+            mock_get_gemini,
+        )
+        await redis_client.set(f"{cache_key}:lock", "other", ex=30)
+
+        inflight = {
+            "id": str(uuid.uuid4()),
+            "job_hash": job_hash,
+            "doc_type": "cv",
+            "content": "# CV from first request",
+            "language": "en",
+            "created_at": "2026-01-01T00:00:00Z",
+        }
+
+        async def _first_request_finishes():
+            await asyncio.sleep(0.1)
+            await redis_client.set(cache_key, json.dumps(inflight), ex=30)
+
+        try:
+            publisher = asyncio.create_task(_first_request_finishes())
+            resp = await client.post(
+                "/api/v1/documents/generate",
+                headers=_auth(token),
+                json={"job_hash": job_hash, "doc_type": "cv", "language": "en"},
+            )
+            await publisher
+        finally:
+            await redis_client.delete(cache_key, f"{cache_key}:lock")
+
+        assert resp.status_code == 200
+        assert resp.json()["content"] == "# CV from first request"
+        mock_groq.get_chat_response.assert_not_awaited()
+
+    @patch("routers.documents._GEN_POLL_INITIAL_SECONDS", 0.05)
+    @patch("routers.documents._GEN_WAIT_MAX_SECONDS", 0.2)
+    @patch("routers.documents._get_gemini")
+    @patch("routers.documents._get_groq")
+    async def test_wait_timeout_returns_conflict_without_generating(
+        self,
+        mock_get_groq,
+        mock_get_gemini,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        redis_client,
+        monkeypatch,
+    ):
+        token, job_hash, cache_key, mock_groq = await self._inflight_setup(
+            client,
+            db_session,
+            redis_client,
+            monkeypatch,
+            mock_get_groq,
+            mock_get_gemini,
+        )
+        await redis_client.set(f"{cache_key}:lock", "other", ex=30)
+        try:
+            resp = await client.post(
+                "/api/v1/documents/generate",
+                headers=_auth(token),
+                json={"job_hash": job_hash, "doc_type": "cv", "language": "en"},
+            )
+        finally:
+            await redis_client.delete(cache_key, f"{cache_key}:lock")
+
+        assert resp.status_code == 409
+        mock_groq.get_chat_response.assert_not_awaited()
+
+    @patch("routers.documents._GEN_POLL_INITIAL_SECONDS", 0.05)
+    @patch("routers.documents._get_gemini")
+    @patch("routers.documents._get_groq")
+    async def test_waiter_generates_when_inflight_request_fails(
+        self,
+        mock_get_groq,
+        mock_get_gemini,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        redis_client,
+        monkeypatch,
+    ):
+        # El primer request suelta el lock sin publicar documento: el que
+        # espera toma el lock y genera él mismo.
+        token, job_hash, cache_key, mock_groq = await self._inflight_setup(
+            client,
+            db_session,
+            redis_client,
+            monkeypatch,
+            mock_get_groq,
+            mock_get_gemini,
+        )
+        await redis_client.set(f"{cache_key}:lock", "other", ex=30)
+
+        async def _first_request_fails():
+            await asyncio.sleep(0.1)
+            await redis_client.delete(f"{cache_key}:lock")
+
+        try:
+            failing = asyncio.create_task(_first_request_fails())
+            resp = await client.post(
+                "/api/v1/documents/generate",
+                headers=_auth(token),
+                json={"job_hash": job_hash, "doc_type": "cv", "language": "en"},
+            )
+            await failing
+            lock_left = await redis_client.exists(f"{cache_key}:lock")
+        finally:
+            await redis_client.delete(cache_key, f"{cache_key}:lock")
+
+        assert resp.status_code == 200
+        mock_groq.get_chat_response.assert_awaited_once()
+        assert lock_left == 0
+
+    async def test_release_keeps_lock_taken_by_another_request(self, redis_client):
+        # Generación más larga que el TTL: el lock ya es de otro request.
+        key = f"doc_lock_test:{uuid.uuid4().hex}"
+        await redis_client.set(f"{key}:lock", "newer-owner", ex=30)
+        try:
+            await _release_generation_lock(redis_client, key, "expired-owner")
+            assert await redis_client.get(f"{key}:lock") == b"newer-owner"
+
+            await _release_generation_lock(redis_client, key, "newer-owner")
+            assert await redis_client.exists(f"{key}:lock") == 0
+        finally:
+            await redis_client.delete(f"{key}:lock")
+
 
 # ---------------------------------------------------------------------------
 # List & Delete
@@ -375,6 +554,114 @@ class TestDocumentCRUD:
         assert data["total"] == 1
         assert data["data"][0]["doc_type"] == "cv"
 
+    async def test_list_paginates_with_created_at_cursor(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        token, email = await _register_and_get_token(client)
+        job_hash = await _insert_job(db_session, idx=8)
+        user = (
+            await db_session.execute(select(User).where(User.email == email))
+        ).scalar_one()
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for i in range(3):
+            db_session.add(
+                GeneratedDocument(
+                    user_id=user.id,
+                    job_hash=job_hash,
+                    doc_type="cv",
+                    content=f"doc {i}",
+                    language="en",
+                    created_at=base + timedelta(minutes=i),
+                )
+            )
+        await db_session.commit()
+
+        first = await client.get(
+            f"/api/v1/documents/{job_hash}?limit=2", headers=_auth(token)
+        )
+        page1 = first.json()["data"]
+        assert [d["content"] for d in page1] == ["doc 2", "doc 1"]
+        assert page1[0]["job_title"] == "Senior Python Developer 8"
+        # total cuenta todos los documentos, no solo los de la página
+        assert first.json()["total"] == 3
+
+        second = await client.get(
+            f"/api/v1/documents/{job_hash}",
+            params={"limit": 2, "before": page1[-1]["created_at"]},
+            headers=_auth(token),
+        )
+        assert [d["content"] for d in second.json()["data"]] == ["doc 0"]
+        assert second.json()["total"] == 3
+
+    async def test_list_without_limit_returns_every_document(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        token, email = await _register_and_get_token(client)
+        job_hash = await _insert_job(db_session, idx=10)
+        user = (
+            await db_session.execute(select(User).where(User.email == email))
+        ).scalar_one()
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for i in range(60):
+            db_session.add(
+                GeneratedDocument(
+                    user_id=user.id,
+                    job_hash=job_hash,
+                    doc_type="cv",
+                    content=f"doc {i}",
+                    language="en",
+                    created_at=base + timedelta(minutes=i),
+                )
+            )
+        await db_session.commit()
+
+        resp = await client.get(f"/api/v1/documents/{job_hash}", headers=_auth(token))
+        data = resp.json()
+        # listForJob no envía limit: la lista no se trunca
+        assert len(data["data"]) == 60
+        assert data["total"] == 60
+        assert data["data"][0]["content"] == "doc 59"
+        assert data["data"][0]["job_title"] == "Senior Python Developer 10"
+
+    async def test_list_cursor_keeps_rows_with_same_created_at(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        token, email = await _register_and_get_token(client)
+        job_hash = await _insert_job(db_session, idx=9)
+        user = (
+            await db_session.execute(select(User).where(User.email == email))
+        ).scalar_one()
+        same = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for i in range(3):
+            db_session.add(
+                GeneratedDocument(
+                    user_id=user.id,
+                    job_hash=job_hash,
+                    doc_type="cv",
+                    content=f"doc {i}",
+                    language="en",
+                    created_at=same,
+                )
+            )
+        await db_session.commit()
+
+        seen: list[str] = []
+        params: dict = {"limit": 2}
+        for _ in range(3):
+            resp = await client.get(
+                f"/api/v1/documents/{job_hash}", params=params, headers=_auth(token)
+            )
+            page = resp.json()["data"]
+            if not page:
+                break
+            seen.extend(d["id"] for d in page)
+            params = {
+                "limit": 2,
+                "before": page[-1]["created_at"],
+                "before_id": page[-1]["id"],
+            }
+        assert len(seen) == len(set(seen)) == 3
+
     @patch("routers.documents._get_groq")
     async def test_delete_document(
         self,
@@ -11,3 +11,52 @@ async def test_health_v1(client: AsyncClient):
     response = await client.get("/api/v1/health")
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
+
+
+async def test_healthz_reports_pool_stats(client: AsyncClient):
+    response = await client.get("/healthz")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "healthy"
+    pool = body["db_pool"]
+    assert pool["capacity"] >= pool["size"]
+    assert 0.0 <= pool["saturation"] <= 1.0
+
+
+def _api_routes():
+    """APIRoutes of the app, including those behind include_router().
+
+    Los routers incluidos aparecen en ``app.routes`` como un único
+    ``_IncludedRouter``: hay que recorrerlos con ``iter_route_contexts``.
+    """
+    from fastapi.routing import APIRoute, iter_route_contexts
+
+    from main import app
+
+    return [
+        ctx
+        for ctx in iter_route_contexts(app.routes)
+        if isinstance(ctx.original_route, APIRoute)
+    ]
+
+
+def test_routes_registered_once():
+    routes = _api_routes()
+    assert any(route.path == "/api/v1/jobs/search" for route in routes)
+
+    seen = [(route.path, method) for route in routes for method in route.methods]
+    assert len(seen) == len(set(seen))
+
+
+def test_api_routes_use_pydantic_json_fast_path():
+    """Routes with a response_model keep FastAPI's default response class."""
+    from fastapi.datastructures import DefaultPlaceholder
+
+    routes = [
+        route
+        for route in _api_routes()
+        if route.path.startswith("/api/v1/") and route.response_field is not None
+    ]
+    assert routes
+    for route in routes:
+        assert isinstance(route.response_class, DefaultPlaceholder), route.path
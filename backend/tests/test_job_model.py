@@ -5,7 +5,7 @@ from sqlalchemy import select
 
 from models.enums import ContractType, SalaryPeriod, Seniority
 from models.job import Job
-from schemas.job import JobBrief, JobCreate
+from schemas.job import JobCreate
 
 
 # ---------------------------------------------------------------------------
@@ -118,6 +118,28 @@ class TestJobModel:
         assert fetched.contract_type is None
         assert fetched.embedding is None
 
+    async def test_embedding_round_trips_as_halfvec(self, db_session):
+        job = Job(
+            hash="d" * 32,
+            source="test",
+            title="Dev",
+            company="Co",
+            url="https://example.com/job/halfvec",
+            remote=False,
+            tags=[],
+            embedding=[0.1] * 384,
+        )
+        db_session.add(job)
+        await db_session.commit()
+
+        result = await db_session.execute(
+            select(Job.embedding).where(Job.hash == "d" * 32)
+        )
+        embedding = result.scalar_one()
+        assert len(embedding) == 384
+        # FP16: ~3 dígitos significativos
+        assert embedding[0] == pytest.approx(0.1, abs=1e-3)
+
 
 # ---------------------------------------------------------------------------
 # Pydantic schemas
@@ -136,21 +158,3 @@ class TestJobSchemas:
         assert data.hash == "a" * 32
         assert data.remote is False
         assert data.tags == []
-
-    def test_job_brief_from_attributes(self):
-        """Test that JobBrief can be constructed from a dict (simulating ORM)."""
-        from datetime import datetime, timezone
-
-        now = datetime.now(timezone.utc)
-        brief = JobBrief(
-            hash="d" * 32,
-            title="QA Engineer",
-            company="TestCo",
-            url="https://example.com/2",
-            source="remotive",
-            first_seen_at=now,
-            is_active=True,
-        )
-        assert brief.title == "QA Engineer"
-        assert brief.remote is False
-        assert brief.tags == []
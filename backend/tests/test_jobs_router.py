@@ -1,7 +1,10 @@
 """Tests for jobs router — search, detail, stats, sources."""
 
+import json
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.job import Job
@@ -66,6 +69,31 @@ class TestSearchJobs:
         assert resp.json()["total"] == 3
         assert len(resp.json()["data"]) == 3
 
+    async def test_search_returns_cards(self, client: AsyncClient, db_session):
+        await _insert_job(db_session, tags=[f"t{i}" for i in range(8)])
+        resp = await client.get("/api/v1/jobs/search")
+        card = resp.json()["data"][0]
+        assert card["tags"] == ["t0", "t1", "t2", "t3", "t4"]
+        assert card["title"] == "Python Developer"
+        assert "url" not in card
+        assert "description" not in card
+
+    async def test_search_card_with_json_null_tags(
+        self, client: AsyncClient, db_session
+    ):
+        h = await _insert_job(db_session)
+        await db_session.execute(
+            text("UPDATE jobs SET tags = 'null'::jsonb WHERE hash = :h"), {"h": h}
+        )
+        await db_session.commit()
+
+        resp = await client.get("/api/v1/jobs/search")
+        assert resp.status_code == 200
+        assert resp.json()["data"][0]["tags"] == []
+
+        lines = (await client.get("/api/v1/jobs/search.ndjson")).text.splitlines()
+        assert json.loads(lines[0])["tags"] == []
+
     async def test_search_fulltext_q(self, client: AsyncClient, db_session):
         await _insert_job(
             db_session,
@@ -195,6 +223,10 @@ class TestSearchJobs:
         resp = await client.get("/api/v1/jobs/search", params={"seniority": "senior"})
         assert resp.json()["total"] == 1
 
+    async def test_search_filter_invalid_seniority_rejected(self, client: AsyncClient):
+        resp = await client.get("/api/v1/jobs/search", params={"seniority": "guru"})
+        assert resp.status_code == 422
+
     async def test_search_filter_contract_type(self, client: AsyncClient, db_session):
         await _insert_job(
             db_session,
@@ -329,7 +361,8 @@ class TestSearchJobs:
         # Highest salary first, nulls last
         assert data[0]["salary_max_chf"] == 150000
         assert data[1]["salary_max_chf"] == 60000
-        assert data[2]["salary_max_chf"] is None
+        # Los null se omiten de la respuesta de búsqueda
+        assert "salary_max_chf" not in data[2]
 
     async def test_search_limit_max_100(self, client: AsyncClient):
         resp = await client.get("/api/v1/jobs/search", params={"limit": 200})
@@ -383,6 +416,45 @@ class TestSearchJobs:
         assert "contract_type" in job
 
 
+@pytest.mark.anyio
+class TestSearchJobsNdjson:
+    async def test_streams_one_card_per_line(self, client: AsyncClient, db_session):
+        for i in range(3):
+            await _insert_job(
+                db_session,
+                hash=(f"n{i}" + "0" * 30)[:32],
+                url=f"https://example.com/n/{i}",
+                salary_max_chf=None,
+            )
+        resp = await client.get("/api/v1/jobs/search.ndjson")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/x-ndjson"
+        lines = resp.text.splitlines()
+        assert len(lines) == 3
+        card = json.loads(lines[0])
+        assert card["title"] == "Python Developer"
+        assert "salary_max_chf" not in card
+        assert "url" not in card
+
+    async def test_applies_search_filters(self, client: AsyncClient, db_session):
+        await _insert_job(db_session, hash=("z" + "0" * 31), canton="ZH")
+        await _insert_job(
+            db_session,
+            hash=("b" + "0" * 31),
+            canton="BE",
+            url="https://example.com/be",
+        )
+        resp = await client.get(
+            "/api/v1/jobs/search.ndjson", params={"canton": "be", "limit": 10}
+        )
+        lines = resp.text.splitlines()
+        assert [json.loads(line)["canton"] for line in lines] == ["BE"]
+
+    async def test_limit_is_capped(self, client: AsyncClient):
+        resp = await client.get("/api/v1/jobs/search.ndjson", params={"limit": 100_000})
+        assert resp.status_code == 422
+
+
 # ---------------------------------------------------------------------------
 # Job detail endpoint
 # ---------------------------------------------------------------------------
@@ -453,6 +525,27 @@ class TestJobStats:
         assert data["by_source"]["adzuna"] == 1
         assert data["by_canton"]["ZH"] == 2
         assert data["by_language"]["en"] == 2
+        assert data["by_seniority"] == {"mid": 3}
+        assert data["by_contract"] == {"full_time": 3}
+
+    async def test_stats_conditional_get_returns_304(self, client: AsyncClient):
+        first = await client.get("/api/v1/jobs/stats")
+        etag = first.headers["etag"]
+        assert etag.startswith('W/"')
+        assert "max-age=30" in first.headers["cache-control"]
+        assert "Authorization" in first.headers["vary"]
+
+        second = await client.get("/api/v1/jobs/stats", headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+
+    async def test_stats_etag_changes_with_data(self, client: AsyncClient, db_session):
+        etag = (await client.get("/api/v1/jobs/stats")).headers["etag"]
+        await _insert_job(db_session)
+        resp = await client.get("/api/v1/jobs/stats", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.json()["total_jobs"] == 1
 
     async def test_stats_salary(self, client: AsyncClient, db_session):
         await _insert_job(
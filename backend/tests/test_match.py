@@ -173,6 +173,19 @@ class TestMatchAnalyze:
         # With random embeddings, few or none should pass a 90 threshold
         assert data["results_count"] <= data["total_candidates"]
 
+    async def test_analyze_stage1_top_k_limits_candidates(
+        self, client: AsyncClient, db_session: AsyncSession, monkeypatch
+    ):
+        from config import settings
+
+        monkeypatch.setattr(settings, "MATCH_STAGE1_TOP_K", 3)
+        token, _uid = await _setup_user_with_embedding(client, db_session)
+        await _insert_jobs_with_embeddings(db_session, count=5)
+
+        resp = await client.post("/api/v1/match/analyze", headers=_auth(token))
+        assert resp.status_code == 200
+        assert resp.json()["total_candidates"] == 3
+
 
 # ---------------------------------------------------------------------------
 # Results endpoint
@@ -193,6 +206,13 @@ class TestMatchResults:
         assert data["total"] == 0
         assert data["data"] == []
 
+    async def test_results_report_default_weights(self, client: AsyncClient):
+        from services.job_matcher import DEFAULT_WEIGHTS
+
+        token, _email = await _register_and_get_token(client)
+        resp = await client.get("/api/v1/match/results", headers=_auth(token))
+        assert resp.json()["weights_used"] == dict(DEFAULT_WEIGHTS)
+
     async def test_results_after_analyze(
         self, client: AsyncClient, db_session: AsyncSession
     ):
@@ -259,6 +279,80 @@ class TestMatchResults:
         hashes_page2 = {r["job_hash"] for r in data2["data"]}
         assert hashes_page1.isdisjoint(hashes_page2)
 
+    async def test_results_cursor_pagination(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        token, _uid = await _setup_user_with_embedding(client, db_session)
+        await _insert_jobs_with_embeddings(db_session, count=5)
+
+        await client.post("/api/v1/match/analyze", headers=_auth(token))
+
+        full = await client.get("/api/v1/match/results", headers=_auth(token))
+        expected = [r["job_hash"] for r in full.json()["data"]]
+
+        seen: list[str] = []
+        params = {"limit": 2}
+        while True:
+            resp = await client.get(
+                "/api/v1/match/results", headers=_auth(token), params=params
+            )
+            assert resp.status_code == 200
+            data = resp.json()
+            assert data["total"] == 5
+            seen.extend(r["job_hash"] for r in data["data"])
+            if data["next_cursor"] is None:
+                break
+            params = {"limit": 2, "cursor": data["next_cursor"]}
+
+        assert seen == expected
+
+    async def test_results_brief_omits_detail_fields(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        token, _uid = await _setup_user_with_embedding(client, db_session)
+        await _insert_jobs_with_embeddings(db_session, count=2)
+
+        await client.post("/api/v1/match/analyze", headers=_auth(token))
+
+        resp = await client.get(
+            "/api/v1/match/results", headers=_auth(token), params={"brief": True}
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total"] == 2
+        item = data["data"][0]
+        assert item["job_title"] is not None
+        assert "scores" in item
+        assert "explanation" not in item
+        assert "matching_skills" not in item
+
+    async def test_match_detail(self, client: AsyncClient, db_session: AsyncSession):
+        token, _uid = await _setup_user_with_embedding(client, db_session)
+        hashes = await _insert_jobs_with_embeddings(db_session, count=1)
+
+        await client.post("/api/v1/match/analyze", headers=_auth(token))
+
+        resp = await client.get(f"/api/v1/match/{hashes[0]}", headers=_auth(token))
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["job_hash"] == hashes[0]
+        assert "matching_skills" in data
+        assert "explanation" in data
+
+    async def test_match_detail_not_found(self, client: AsyncClient):
+        token, _email = await _register_and_get_token(client)
+        resp = await client.get("/api/v1/match/" + "0" * 32, headers=_auth(token))
+        assert resp.status_code == 404
+
+    async def test_results_invalid_cursor(self, client: AsyncClient):
+        token, _email = await _register_and_get_token(client)
+        resp = await client.get(
+            "/api/v1/match/results",
+            headers=_auth(token),
+            params={"cursor": "not-a-cursor"},
+        )
+        assert resp.status_code == 400
+
 
 # ---------------------------------------------------------------------------
 # Feedback endpoint
@@ -105,7 +105,7 @@ class TestGetSavedJobs:
 
         results, total = await _svc(db_session).get_saved_jobs(user_id)
 
-        hashes = [r["match"].job_hash for r in results]
+        hashes = [match.job_hash for match, _job in results]
         assert total == 2
         assert hashes == ["s2", "s1"]  # ordenado por score_final desc
 
@@ -1,5 +1,7 @@
 """Tests for notification history and mark-read endpoints."""
 
+import asyncio
+import json
 import uuid
 
 import pytest
@@ -100,6 +102,25 @@ class TestNotificationHistory:
         assert data["total"] == 5
         assert len(data["data"]) == 2
 
+    async def test_list_offset_past_end_keeps_totals(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        token, _ = await _register_and_get_token(client)
+        user_id = await _get_user_id(client, token)
+
+        await _insert_notification(db_session, user_id)
+        await _insert_notification(db_session, user_id, is_read=True)
+
+        resp = await client.get(
+            "/api/v1/notifications",
+            headers=_auth(token),
+            params={"limit": 2, "offset": 10},
+        )
+        data = resp.json()
+        assert data["data"] == []
+        assert data["total"] == 2
+        assert data["unread_count"] == 1
+
     async def test_user_isolation(self, client: AsyncClient, db_session: AsyncSession):
         token_a, _ = await _register_and_get_token(client)
         token_b, _ = await _register_and_get_token(client)
@@ -159,3 +180,36 @@ class TestNotificationMarkRead:
             headers=_auth(token_b),
         )
         assert resp.status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# SSE stream
+# ---------------------------------------------------------------------------
+
+
+class TestNotificationStream:
+    async def test_stream_rejects_invalid_token(self, client: AsyncClient):
+        resp = await client.get("/api/v1/notifications/stream?token=bad.token")
+        assert resp.status_code == 401
+
+    async def test_stream_yields_events_and_unsubscribes(self, sse_manager):
+        from types import SimpleNamespace
+
+        from routers.notifications import notification_stream
+
+        user_id = uuid.uuid4()
+        request = SimpleNamespace(
+            app=SimpleNamespace(state=SimpleNamespace(sse_manager=sse_manager))
+        )
+        stream = notification_stream(request, user_id)
+
+        connected = await stream.__anext__()
+        assert connected.event == "connected"
+
+        await sse_manager.broadcast_to_user(user_id, "new_matches", {"count": 2})
+        event = await asyncio.wait_for(stream.__anext__(), timeout=2.0)
+        assert event.event == "new_matches"
+        assert json.loads(event.raw_data) == {"count": 2}
+
+        await stream.aclose()
+        assert str(user_id) not in sse_manager.get_active_connections()
@@ -1,9 +1,12 @@
 """Tests for GDPR profile endpoints: export and delete-all."""
 
+import uuid
+
 from httpx import AsyncClient
 from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from models.notification import Notification
 from models.user import User
 from tests.conftest import random_email
 
@@ -97,6 +100,34 @@ class TestProfileDeleteAll:
         )
         assert result.fetchone() is None
 
+    async def test_delete_cascades_notifications(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        token, _email, password = await register_and_get_token(client)
+        me_resp = await client.get(
+            "/api/v1/auth/me",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        user_id = uuid.UUID(me_resp.json()["id"])
+        db_session.add(
+            Notification(user_id=user_id, event_type="test", title="t", body="b")
+        )
+        await db_session.commit()
+
+        resp = await client.request(
+            "DELETE",
+            "/api/v1/profile/delete-all",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"password": password},
+        )
+        assert resp.status_code == 200
+
+        result = await db_session.execute(
+            text("SELECT id FROM notifications WHERE user_id = :uid"),
+            {"uid": user_id},
+        )
+        assert result.fetchone() is None
+
     async def test_delete_requires_auth(self, client: AsyncClient):
         resp = await client.delete("/api/v1/profile/delete-all")
         assert resp.status_code == 401
@@ -194,9 +194,9 @@ class TestUpdateProfile:
 
 
 class TestUploadCV:
-    @patch("tasks.embedding_tasks.generate_profile_embedding")
+    @patch("routers.profile.celery_app.send_task")
     async def test_upload_pdf_success(self, mock_task, client):
-        mock_task.delay.return_value = MagicMock(id="task-123")
+        mock_task.return_value = MagicMock(id="task-123")
         token, _ = await _register_and_get_token(client)
 
         cv_text = (
@@ -215,10 +215,13 @@ class TestUploadCV:
         assert data["message"] == "CV uploaded and parsed successfully"
         assert data["cv_text_length"] > 0
         assert "English" in data["skills_extracted"]
+        assert data["embedding_task_id"] == "task-123"
+        mock_task.assert_called_once()
+        assert mock_task.call_args.args == ("tasks.ai.generate_profile_embedding",)
 
-    @patch("tasks.embedding_tasks.generate_profile_embedding")
+    @patch("routers.profile.celery_app.send_task")
     async def test_upload_docx_success(self, mock_task, client):
-        mock_task.delay.return_value = MagicMock(id="task-456")
+        mock_task.return_value = MagicMock(id="task-456")
         token, _ = await _register_and_get_token(client)
 
         cv_text = (
@@ -262,6 +265,18 @@ class TestUploadCV:
         )
         assert resp.status_code == 400
 
+    async def test_upload_too_large(self, client, monkeypatch):
+        from config import settings
+
+        monkeypatch.setattr(settings, "CV_MAX_SIZE_MB", 0)
+        token, _ = await _register_and_get_token(client)
+        resp = await client.post(
+            "/api/v1/profile/cv",
+            headers=_auth(token),
+            files={"file": ("cv.pdf", _make_pdf("x" * 60), "application/pdf")},
+        )
+        assert resp.status_code == 413
+
     async def test_upload_unauthenticated(self, client):
         resp = await client.post(
             "/api/v1/profile/cv",
@@ -269,16 +284,16 @@ class TestUploadCV:
         )
         assert resp.status_code == 401
 
-    @patch("tasks.embedding_tasks.generate_profile_embedding")
+    @patch("routers.profile.celery_app.send_task")
     async def test_upload_merges_skills(self, mock_task, client):
-        mock_task.delay.return_value = MagicMock(id="task-789")
+        mock_task.return_value = MagicMock(id="task-789")
         token, _ = await _register_and_get_token(client)
 
         # Set existing skills
         await client.put(
             "/api/v1/profile",
             headers=_auth(token),
-            json={"skills": ["Go", "Rust"]},
+            json={"skills": ["Rust", "Go", "Agile"]},
         )
 
         # Upload CV with different skills (los que el parser sí reconoce, Fase 5)
@@ -299,7 +314,31 @@ class TestUploadCV:
         all_skills = profile_resp.json()["skills"]
         assert "Go" in all_skills
         assert "Rust" in all_skills
-        assert "Agile" in all_skills
+        assert all_skills.count("Agile") == 1
+        assert all_skills == sorted(all_skills, key=str.lower)
+
+    @patch("routers.profile.celery_app.send_task")
+    async def test_upload_without_skills_keeps_existing(self, mock_task, client):
+        mock_task.return_value = MagicMock(id="task-000")
+        token, _ = await _register_and_get_token(client)
+        await client.put(
+            "/api/v1/profile",
+            headers=_auth(token),
+            json={"skills": ["Rust", "Go"]},
+        )
+
+        cv_text = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 2
+        resp = await client.post(
+            "/api/v1/profile/cv",
+            headers=_auth(token),
+            files={"file": ("cv.pdf", _make_pdf(cv_text), "application/pdf")},
+        )
+        assert resp.status_code == 200
+        assert resp.json()["skills_extracted"] == []
+
+        profile_resp = await client.get("/api/v1/profile", headers=_auth(token))
+        # Sin skills nuevas la lista queda tal cual (ni siquiera se reordena)
+        assert profile_resp.json()["skills"] == ["Rust", "Go"]
 
 
 class TestDeleteCV:
@@ -316,3 +355,30 @@ class TestDeleteCV:
         resp2 = await client.delete("/api/v1/profile/cv", headers=_auth(token))
         assert resp1.status_code == 200
         assert resp2.status_code == 200
+
+
+class TestMergeSkills:
+    def test_merges_sorted_lists(self):
+        from routers.profile import _merge_skills
+
+        assert _merge_skills(["Agile", "Go", "rust"], ["Python", "agile", "Go"]) == [
+            "Agile",
+            "agile",
+            "Go",
+            "Python",
+            "rust",
+        ]
+
+    def test_unsorted_existing_matches_full_sort(self):
+        from routers.profile import _merge_skills
+
+        existing = ["Rust", "Go", "Agile", "Go"]
+        extracted = ["English", "Agile"]
+        assert _merge_skills(existing, extracted) == sorted(
+            dict.fromkeys([*existing, *extracted]), key=str.lower
+        )
+
+    def test_duplicates_across_case_variants(self):
+        from routers.profile import _merge_skills
+
+        assert _merge_skills(["Python", "python"], ["Python"]) == ["Python", "python"]
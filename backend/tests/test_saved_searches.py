@@ -44,6 +44,24 @@ class TestSavedSearchesCRUD:
         assert data["total"] == 0
         assert data["data"] == []
 
+    async def test_list_paginates_with_total(self, client: AsyncClient):
+        token, _ = await _register_and_get_token(client)
+        for i in range(3):
+            await client.post(
+                "/api/v1/searches", headers=_auth(token), json={"name": f"S{i}"}
+            )
+
+        page = await client.get(
+            "/api/v1/searches", headers=_auth(token), params={"limit": 2}
+        )
+        assert len(page.json()["data"]) == 2
+        assert page.json()["total"] == 3
+
+        past_end = await client.get(
+            "/api/v1/searches", headers=_auth(token), params={"offset": 5}
+        )
+        assert past_end.json() == {"data": [], "total": 3}
+
     async def test_create_search(self, client: AsyncClient):
         token, _ = await _register_and_get_token(client)
         resp = await client.post(
@@ -1,12 +1,13 @@
 """Tests for BaseScraper engine — compliance, rate limiting, mode selection."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 from bs4 import BeautifulSoup
 
-from services.scraper_engine import BaseScraper
+from services.scraper_engine import BaseScraper, PrioritySelector
 
 
 class ConcreteScraper(BaseScraper):
@@ -60,6 +61,21 @@ class ConcreteScraper(BaseScraper):
         }
 
 
+class TestPrioritySelector:
+    def test_highest_priority_selector_wins(self):
+        soup = BeautifulSoup(
+            '<li class="row">a</li><div class="job">b</div><div class="job">c</div>',
+            "lxml",
+        )
+        selector = PrioritySelector(".job", ".row")
+        assert [el.get_text() for el in selector.first_matching(soup)] == ["b", "c"]
+
+    def test_falls_back_to_lower_priority(self):
+        soup = BeautifulSoup('<li class="row">a</li>', "lxml")
+        assert len(PrioritySelector(".job", ".row").first_matching(soup)) == 1
+        assert PrioritySelector(".job").first_matching(soup) == []
+
+
 class TestBaseScraperPreCheck:
     @pytest.mark.asyncio
     async def test_pre_check_allowed(self):
@@ -207,6 +223,36 @@ class TestBaseScraperHttpx:
         assert len(result) == 1
         assert result[0]["title"] == "Developer"
 
+    @pytest.mark.asyncio
+    async def test_listing_pacing_overlaps_request_without_details(self):
+        """Sin detalles, la espera entre páginas corre mientras llega la respuesta."""
+        scraper = ConcreteScraper()
+        html = '<div class="job">A</div><div class="job">B</div>'
+        state = {"waiting": False, "overlapped": [], "waits": 0}
+
+        async def fake_delay():
+            state["waits"] += 1
+            state["waiting"] = True
+            await asyncio.sleep(0.02)
+            state["waiting"] = False
+
+        async def fake_call(do_request):
+            await asyncio.sleep(0.01)
+            state["overlapped"].append(state["waiting"])
+            response = MagicMock()
+            response.status_code = 200
+            response.text = html
+            return response
+
+        scraper._rate_limit_delay = fake_delay
+        with patch.object(scraper._circuit, "call", side_effect=fake_call):
+            result = await scraper._scrape_with_httpx("")
+
+        assert len(result) == 4
+        # Una espera por página; la de la última se cancela al salir
+        assert state["waits"] == 2
+        assert state["overlapped"] == [True, True]
+
     @pytest.mark.asyncio
     async def test_scrape_with_httpx_stops_on_empty(self):
         scraper = ConcreteScraper()
@@ -302,6 +348,26 @@ class TestBaseScraperDetailFetch:
         )
         assert detail == {"description": "Detail page content"}
 
+    @pytest.mark.asyncio
+    async def test_fetch_detail_raw_skips_soup(self):
+        scraper = ConcreteScraper()
+        scraper.PARSE_DETAIL_RAW = True
+        scraper.parse_job_detail = MagicMock()
+        scraper.parse_job_detail_raw = MagicMock(return_value={"title": "Raw"})
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b"<html></html>"
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(return_value=mock_response)
+
+        detail = await scraper._fetch_detail_httpx(
+            mock_client, "https://example.com/job/1"
+        )
+        assert detail == {"title": "Raw"}
+        scraper.parse_job_detail_raw.assert_called_once_with(b"<html></html>")
+        scraper.parse_job_detail.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_fetch_detail_403_reports_block(self):
         scraper = ConcreteScraper()
@@ -319,6 +385,158 @@ class TestBaseScraperDetailFetch:
         assert detail is None
         scraper._report_block.assert_called_once_with(403)
 
+    @staticmethod
+    def _tracking_scraper(concurrency: int):
+        """Scraper whose detail fetches record how many run at once."""
+        scraper = ConcreteScraper()
+        scraper.DETAIL_CONCURRENCY = concurrency
+        scraper._rate_limit_delay = AsyncMock()
+        state = {"in_flight": 0, "peak": 0}
+
+        async def fake_fetch(client, url):
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(0.01)
+            state["in_flight"] -= 1
+            return {"description": url}
+
+        scraper._fetch_detail_httpx = fake_fetch
+        return scraper, state
+
+    @pytest.mark.asyncio
+    async def test_fetch_details_concurrent_up_to_limit(self):
+        scraper, state = self._tracking_scraper(concurrency=3)
+        stubs = [{"detail_url": f"https://example.com/d/{i}"} for i in range(7)]
+        stubs.append({"title": "no detail"})
+
+        await scraper._fetch_details(MagicMock(), stubs)
+
+        assert state["peak"] == 3
+        assert [s.get("description") for s in stubs[:7]] == [
+            s["detail_url"] for s in stubs[:7]
+        ]
+        assert "description" not in stubs[7]
+        # El rate-limit se sigue aplicando una vez por petición
+        assert scraper._rate_limit_delay.await_count == 7
+
+    @pytest.mark.asyncio
+    async def test_fetch_details_sequential_by_default(self):
+        scraper, state = self._tracking_scraper(concurrency=1)
+        stubs = [{"detail_url": f"https://example.com/d/{i}"} for i in range(3)]
+
+        await scraper._fetch_details(MagicMock(), stubs)
+
+        assert state["peak"] == 1
+
+    @staticmethod
+    def _streaming_scraper(
+        chunks: list[bytes], status: int = 200, headers: dict | None = None
+    ):
+        """Raw+streaming scraper over a chunked body; records chunks served."""
+        scraper = ConcreteScraper()
+        scraper.PARSE_DETAIL_RAW = True
+        scraper.STREAM_DETAIL = True
+        parsed: list[bytes] = []
+
+        def parse(content: bytes) -> dict:
+            parsed.append(content)
+            return {"title": "Found"} if b"MARK" in content else {}
+
+        scraper.parse_job_detail_raw = parse
+        scraper.parsed = parsed
+        served: list[bytes] = []
+
+        async def body():
+            for chunk in chunks:
+                served.append(chunk)
+                yield chunk
+
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(status, headers=headers, content=body())
+        )
+        return scraper, httpx.AsyncClient(transport=transport), served
+
+    @pytest.mark.asyncio
+    async def test_fetch_detail_streamed_stops_early(self):
+        chunks = [b"<head>", b"MARK</script>", b"<body>", b"</body>"]
+        scraper, client, served = self._streaming_scraper(chunks)
+
+        async with client:
+            detail = await scraper._fetch_detail_httpx(client, "https://x.test/d")
+
+        assert detail == {"title": "Found"}
+        assert served == chunks[:2]
+
+    @pytest.mark.asyncio
+    async def test_fetch_detail_streamed_parses_only_on_marker(self):
+        # El marcador llega partido entre dos trozos: se parsea una sola vez
+        chunks = [b"<head>", b"<p>", b"MARK</scr", b"ipt>", b"<body>"]
+        scraper, client, _ = self._streaming_scraper(chunks)
+
+        async with client:
+            detail = await scraper._fetch_detail_httpx(client, "https://x.test/d")
+
+        assert detail == {"title": "Found"}
+        assert scraper.parsed == [b"<head><p>MARK</script>"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_detail_streamed_upper_case_marker(self):
+        chunks = [b"<head>", b"MARK</SCRIPT>", b"<body>", b"</body>"]
+        scraper, client, served = self._streaming_scraper(chunks)
+
+        async with client:
+            detail = await scraper._fetch_detail_httpx(client, "https://x.test/d")
+
+        assert detail == {"title": "Found"}
+        assert served == chunks[:2]
+
+    @pytest.mark.asyncio
+    async def test_fetch_detail_streamed_parses_body_without_marker(self):
+        chunks = [b"<head>MARK", b"</head>"]
+        scraper, client, _ = self._streaming_scraper(chunks)
+
+        async with client:
+            detail = await scraper._fetch_detail_httpx(client, "https://x.test/d")
+
+        assert detail == {"title": "Found"}
+        assert scraper.parsed == [b"<head>MARK</head>"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_detail_streamed_drains_small_rest(self):
+        chunks = [b"MARK</script>", b"<body>", b"</body>"]
+        length = str(sum(len(c) for c in chunks))
+        scraper, client, served = self._streaming_scraper(
+            chunks, headers={"content-length": length}
+        )
+
+        async with client:
+            detail = await scraper._fetch_detail_httpx(client, "https://x.test/d")
+
+        assert detail == {"title": "Found"}
+        assert served == chunks
+        assert len(scraper.parsed) == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_detail_streamed_without_data(self):
+        scraper, client, served = self._streaming_scraper([b"<html>", b"</html>"])
+
+        async with client:
+            detail = await scraper._fetch_detail_httpx(client, "https://x.test/d")
+
+        assert detail == {}
+        assert len(served) == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_detail_streamed_403_reports_block(self):
+        scraper, client, _ = self._streaming_scraper([b""], status=403)
+        scraper._report_block = AsyncMock()
+
+        async with client:
+            detail = await scraper._fetch_detail_httpx(client, "https://x.test/d")
+
+        assert detail is None
+        scraper._report_block.assert_called_once_with(403)
+
     @pytest.mark.asyncio
     async def test_fetch_detail_error_returns_none(self):
         scraper = ConcreteScraper()
@@ -331,6 +549,125 @@ class TestBaseScraperDetailFetch:
         assert detail is None
 
 
+class _FakeRedis:
+    def __init__(self):
+        self.store: dict[str, bytes] = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+
+class TestBaseScraperDetailCache:
+    @staticmethod
+    def _cached_scraper(handler, **flags):
+        from services.detail_cache import DetailCache
+
+        scraper = ConcreteScraper()
+        scraper.CACHE_DETAILS = True
+        for name, value in flags.items():
+            setattr(scraper, name, value)
+        scraper._detail_cache = DetailCache(_FakeRedis())
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return scraper, client
+
+    @pytest.mark.asyncio
+    async def test_304_reuses_cached_detail(self):
+        seen_headers: list[httpx.Headers] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_headers.append(request.headers)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200, html="<html>Detail</html>", headers={"ETag": '"v1"'}
+            )
+
+        scraper, client = self._cached_scraper(handler)
+        async with client:
+            first = await scraper._fetch_detail_httpx(client, "https://x.test/d")
+            scraper.parse_job_detail = MagicMock()
+            second = await scraper._fetch_detail_httpx(client, "https://x.test/d")
+
+        assert first == second == {"description": "Detail page content"}
+        assert "if-none-match" not in seen_headers[0]
+        scraper.parse_job_detail.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_streamed_304_reuses_cached_detail(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("if-modified-since"):
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                content=b"MARK</script>",
+                headers={"Last-Modified": "Wed, 01 Oct 2026 10:00:00 GMT"},
+            )
+
+        scraper, client = self._cached_scraper(
+            handler, PARSE_DETAIL_RAW=True, STREAM_DETAIL=True
+        )
+        scraper.parse_job_detail_raw = lambda content: (
+            {"title": "Found"} if b"MARK" in content else {}
+        )
+        async with client:
+            first = await scraper._fetch_detail_httpx(client, "https://x.test/d")
+            second = await scraper._fetch_detail_httpx(client, "https://x.test/d")
+
+        assert first == second == {"title": "Found"}
+
+    @pytest.mark.asyncio
+    async def test_no_validators_not_cached(self):
+        calls: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(1)
+            assert "if-none-match" not in request.headers
+            return httpx.Response(200, html="<html>Detail</html>")
+
+        scraper, client = self._cached_scraper(handler)
+        async with client:
+            for _ in range(2):
+                await scraper._fetch_detail_httpx(client, "https://x.test/d")
+
+        assert len(calls) == 2
+        assert scraper._detail_cache._redis.store == {}
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_and_corrupt_entries_are_misses(self):
+        from redis.exceptions import ConnectionError as RedisConnectionError
+
+        from services.detail_cache import DetailCache, detail_cache_key
+
+        class _DownRedis:
+            async def get(self, key):
+                raise RedisConnectionError("down")
+
+            async def set(self, key, value, ex=None):
+                raise RedisConnectionError("down")
+
+        down = DetailCache(_DownRedis())
+        assert await down.get("src", "https://x.test/d") is None
+        await down.set("src", "https://x.test/d", {"etag": '"v1"'}, {"a": 1})
+
+        redis = _FakeRedis()
+        redis.store[detail_cache_key("src", "https://x.test/d")] = b"{not json"
+        assert await DetailCache(redis).get("src", "https://x.test/d") is None
+
+    @pytest.mark.asyncio
+    async def test_programming_errors_are_not_swallowed(self):
+        from services.detail_cache import DetailCache
+
+        class _BrokenRedis:
+            async def get(self, key):
+                raise TypeError("bad call")
+
+        with pytest.raises(TypeError):
+            await DetailCache(_BrokenRedis()).get("src", "https://x.test/d")
+
+
 class TestBaseScraperConfig:
     def test_default_config(self):
         scraper = ConcreteScraper()
@@ -1,7 +1,12 @@
 """Tests for all 7 scraper normalize_job + parse_listing_page methods."""
 
+import asyncio
 from pathlib import Path
+from unittest.mock import AsyncMock
 
+import httpx
+import orjson
+import pytest
 from bs4 import BeautifulSoup
 
 from scrapers.financejobs import FinancejobsScraper
@@ -134,6 +139,16 @@ class TestFinancejobsScraper:
         soup = BeautifulSoup("<html><body></body></html>", "lxml")
         assert FinancejobsScraper().parse_listing_page(soup) == []
 
+    def test_parse_listing_page_unexpected_layout(self):
+        html = '<script id="__NEXT_DATA__">{"props": {"pageProps": {}}}</script>'
+        soup = BeautifulSoup(html, "lxml")
+        assert FinancejobsScraper().parse_listing_page(soup) == []
+
+    def test_parse_listing_page_malformed_next_data(self):
+        html = '<script id="__NEXT_DATA__">{"props": {</script>'
+        soup = BeautifulSoup(html, "lxml")
+        assert FinancejobsScraper().parse_listing_page(soup) == []
+
     def test_normalize_job(self):
         raw = {
             "title": "Portfolio Manager",
@@ -184,6 +199,24 @@ class TestGastrojobScraper:
         soup = BeautifulSoup(html, "lxml")
         assert GastrojobScraper().parse_listing_page(soup) == []
 
+    def test_parse_listing_page_selector_priority(self):
+        html = (
+            '<div class="list-group-item"><h3>Servicemitarbeiter</h3>'
+            '<a href="/stelle/2">x</a></div>'
+            '<div class="job-item"><h3>Koch / Köchin</h3><a href="/stelle/1">x</a></div>'
+        )
+        stubs = GastrojobScraper().parse_listing_page(BeautifulSoup(html, "lxml"))
+        assert [s["title"] for s in stubs] == ["Koch / Köchin"]
+
+    def test_parse_listing_page_link_fallback(self):
+        html = (
+            '<a href="/stelle/123">Chef de Partie Restaurant</a>'
+            '<a href="/kontakt">Kontakt und Impressum</a>'
+        )
+        stubs = GastrojobScraper().parse_listing_page(BeautifulSoup(html, "lxml"))
+        assert len(stubs) == 1
+        assert stubs[0]["url"] == "https://www.gastrojob.ch/stelle/123"
+
     def test_normalize_job(self):
         raw = {
             "title": "Sous Chef",
@@ -226,6 +259,33 @@ class TestMedJobsScraper:
         soup = BeautifulSoup("<html><body></body></html>", "lxml")
         assert MedJobsScraper().parse_listing_page(soup) == []
 
+    def test_parse_listing_selector_priority(self):
+        """.job-item wins over later selectors even when they come first."""
+        html = """
+        <html><body>
+          <div class="list-group-item"><h3>Pflegefachfrau HF</h3></div>
+          <div class="job-item">
+            <h3><a href="/de/stelle/1">Assistenzarzt Innere Medizin</a></h3>
+          </div>
+        </body></html>
+        """
+        stubs = MedJobsScraper().parse_listing_page(BeautifulSoup(html, "lxml"))
+        assert [s["title"] for s in stubs] == ["Assistenzarzt Innere Medizin"]
+        assert stubs[0]["url"] == "https://www.med-jobs.com/de/stelle/1"
+
+    def test_parse_job_detail_description_whitespace(self):
+        html = """
+        <html><body><div class="job-description">
+          <h2>Ihre Aufgaben</h2>
+          <ul><li>Visiten   und
+              Sprechstunden</li><li>Notfalldienst</li></ul>
+        </div></body></html>
+        """
+        detail = MedJobsScraper().parse_job_detail(BeautifulSoup(html, "lxml"))
+        assert detail["description"] == (
+            "Ihre Aufgaben Visiten und Sprechstunden Notfalldienst"
+        )
+
     def test_normalize_job(self):
         raw = {
             "title": "Facharzt Chirurgie",
@@ -278,6 +338,29 @@ class TestStelleAdminScraper:
         soup = BeautifulSoup("<html><body></body></html>", "lxml")
         assert StelleAdminScraper().parse_listing_page(soup) == []
 
+    def test_parse_listing_structured_skips_link_fallback(self):
+        html = """
+        <html><body>
+          <div class="job-card">
+            <h3><a href="/job/1">Fachspezialistin Steuern</a></h3>
+          </div>
+          <a href="/job/99">Weitere Stelle ausserhalb der Liste</a>
+        </body></html>
+        """
+        stubs = StelleAdminScraper().parse_listing_page(BeautifulSoup(html, "lxml"))
+        assert [s["url"] for s in stubs] == ["https://jobs.admin.ch/job/1"]
+
+    def test_parse_listing_link_fallback_case_insensitive(self):
+        html = """
+        <html><body>
+          <a href="/JOB/42">Wissenschaftliche Mitarbeiterin</a>
+          <a href="/JOB/42">Wissenschaftliche Mitarbeiterin</a>
+          <a href="/about">Über uns und die Bundesverwaltung</a>
+        </body></html>
+        """
+        stubs = StelleAdminScraper().parse_listing_page(BeautifulSoup(html, "lxml"))
+        assert [s["url"] for s in stubs] == ["https://jobs.admin.ch/JOB/42"]
+
     def test_normalize_job(self):
         raw = {
             "title": "IT Projektleiter/in",
@@ -334,6 +417,17 @@ class TestTESScraper:
         soup = BeautifulSoup("<html><body></body></html>", "lxml")
         assert TESScraper().parse_listing_page(soup) == []
 
+    def test_parse_listing_page_raw_matches_soup(self):
+        html = (FIXTURES / "tes_listing.html").read_text()
+        scraper = TESScraper()
+        assert scraper.PARSE_LISTING_RAW is True
+        raw = scraper.parse_listing_page_raw(html.encode())
+        assert raw == scraper.parse_listing_page(BeautifulSoup(html, "lxml"))
+        assert len(raw) == 3
+
+    def test_parse_listing_page_raw_without_next_data(self):
+        assert TESScraper().parse_listing_page_raw(b"<html></html>") == []
+
     def test_normalize_job(self):
         raw = {
             "title": "Primary Teacher",
@@ -403,6 +497,138 @@ class TestSchulJobsScraper:
         assert "Primarlehrer" in detail["description"]
         assert detail["logo"].endswith("fuerdaskind.png")
 
+    def test_parse_listing_page_meta_follows_own_heading(self):
+        html = """
+        <div>
+          <h3><a class="js-joboffer-detail" href="/job/a/J1">Lehrperson Musik</a></h3>
+          <p>ZH · Zürich · Schule A</p>
+          <h3><a class="js-joboffer-detail" href="/job/b/J2">Lehrperson Sport</a></h3>
+          <p>BE · Thun · Schule B</p>
+        </div>
+        """
+        stubs = SchulJobsScraper().parse_listing_page(BeautifulSoup(html, "lxml"))
+        assert [(s["canton"], s["company"]) for s in stubs] == [
+            ("ZH", "Schule A"),
+            ("BE", "Schule B"),
+        ]
+
+    def test_parse_listing_page_meta_stops_at_next_heading(self):
+        html = """
+        <div>
+          <h3><a class="js-joboffer-detail" href="/job/a/J1">Lehrperson Musik</a></h3>
+          <h3><a class="js-joboffer-detail" href="/job/b/J2">Lehrperson Sport</a></h3>
+          <p>BE · Thun · Schule B</p>
+        </div>
+        """
+        stubs = SchulJobsScraper().parse_listing_page(BeautifulSoup(html, "lxml"))
+        assert [(s["canton"], s["company"]) for s in stubs] == [
+            (None, "Unknown"),
+            ("BE", "Schule B"),
+        ]
+
+    def test_parse_listing_page_skips_seen_urls(self):
+        html = (FIXTURES / "schuljobs_listing.html").read_text()
+        first = BeautifulSoup(html, "lxml")
+        seen: set[str] = set()
+        stubs = SchulJobsScraper().parse_listing_page(first, seen)
+        assert seen == {s["url"] for s in stubs}
+        again = SchulJobsScraper().parse_listing_page(BeautifulSoup(html, "lxml"), seen)
+        assert again == []
+
+    @pytest.mark.asyncio
+    async def test_scroll_stops_on_repeated_duplicate_pages(self):
+        listing = (FIXTURES / "schuljobs_listing.html").read_text()
+        links = "".join(
+            f'<h3><a class="js-joboffer-detail" href="/job/x/J{i}">Job {i}</a></h3>'
+            for i in range(20)
+        )
+        initial = (
+            f'<div data-searchhash="h"></div><div data-nextpage="2"></div>{listing}'
+        )
+        requests: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            if "/scroll/" in request.url.path:
+                # Cursor roto: siempre devuelve la misma página
+                return httpx.Response(
+                    200, content=orjson.dumps({"html": links, "nextpage": 3})
+                )
+            return httpx.Response(200, text=initial)
+
+        scraper = SchulJobsScraper()
+        scraper.FETCH_DETAILS = False
+        scraper._rate_limit_delay = AsyncMock()
+        scraper._circuit.call = lambda do_request: do_request()
+        scraper._build_httpx_kwargs = lambda: {
+            "transport": httpx.MockTransport(handler)
+        }
+
+        stubs = await scraper._scrape_with_httpx("")
+
+        scroll_requests = [p for p in requests if "/scroll/" in p]
+        assert len(scroll_requests) == 3  # 1 página nueva + 2 repetidas
+        assert len(stubs) == len({s["url"] for s in stubs})
+
+    @pytest.mark.asyncio
+    async def test_scroll_error_cancels_pending_pacing(self):
+        links = "".join(
+            f'<h3><a class="js-joboffer-detail" href="/job/x/J{i}">Job {i}</a></h3>'
+            for i in range(20)
+        )
+        initial = '<div data-searchhash="h"></div><div data-nextpage="2"></div>'
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if "/scroll/" in request.url.path:
+                # nextpage corrupto: revienta a mitad del bucle
+                return httpx.Response(
+                    200, content=orjson.dumps({"html": links, "nextpage": "x"})
+                )
+            return httpx.Response(200, text=initial)
+
+        calls = 0
+
+        async def rate_limit_delay():
+            nonlocal calls
+            calls += 1
+            if calls > 1:
+                await asyncio.sleep(3600)
+
+        scraper = SchulJobsScraper()
+        scraper.FETCH_DETAILS = False
+        scraper._rate_limit_delay = rate_limit_delay
+        scraper._circuit.call = lambda do_request: do_request()
+        scraper._build_httpx_kwargs = lambda: {
+            "transport": httpx.MockTransport(handler)
+        }
+
+        with pytest.raises(ValueError):
+            await scraper._scrape_with_httpx("")
+        await asyncio.sleep(0)
+
+        # La espera pendiente se canceló: no queda ninguna tarea colgada
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    def test_parse_job_detail_raw_matches_soup(self):
+        html = (FIXTURES / "schuljobs_detail.html").read_text()
+        scraper = SchulJobsScraper()
+        assert scraper.PARSE_DETAIL_RAW is True
+        raw = scraper.parse_job_detail_raw(html.encode())
+        assert raw == scraper.parse_job_detail(BeautifulSoup(html, "lxml"))
+        assert raw["title"] == "Primarlehrperson Zyklus 2"
+
+    def test_parse_job_detail_raw_skips_bad_blocks(self):
+        html = b"""
+        <script type="application/ld+json">{not json</script>
+        <script type='application/ld+json'>[1, 2]</script>
+        <SCRIPT TYPE="application/ld+json" id="x">
+          {"@type": "JobPosting", "title": "Lehrperson Musik"}
+        </SCRIPT>
+        """
+        assert SchulJobsScraper().parse_job_detail_raw(html) == {
+            "title": "Lehrperson Musik"
+        }
+
     def test_normalize_job(self):
         raw = {
             "title": "Primarlehrperson Zyklus 2",
@@ -482,3 +708,32 @@ class TestSchulJobsScraper:
         btn = soup.select_one("[data-nextpage]")
         assert btn is not None
         assert int(btn.get("data-nextpage")) == 2
+
+
+class TestScraperRegistry:
+    def test_every_registered_path_resolves(self):
+        import scrapers
+
+        for name in scrapers.get_scraper_names():
+            scraper = scrapers.get_scraper(name)
+            assert scraper.SOURCE_NAME == name
+
+    def test_unknown_scraper_is_none(self):
+        import scrapers
+
+        assert scrapers.get_scraper("does_not_exist") is None
+
+    def test_registry_import_is_lazy(self):
+        """Listing scraper names must not import the scraper modules."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, scrapers; scrapers.get_scraper_names(); "
+            "assert 'scrapers.gastrojob' not in sys.modules"
+        )
+        subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parents[1],
+            check=True,
+        )
@@ -1,6 +1,7 @@
 """Tests for base services: job_service, circuit_breaker, sse_manager, job_matcher."""
 
 import asyncio
+import pickle
 import uuid
 
 import pytest
@@ -66,6 +67,12 @@ class TestCircuitBreaker:
             await cb.call(fail)
         assert "test" in str(exc_info.value)
 
+    def test_open_error_message_and_pickle(self):
+        exc = CircuitBreakerOpen("my_source", 42.4)
+        assert str(exc) == "Circuit breaker open for 'my_source'. Retry after 42s."
+        restored = pickle.loads(pickle.dumps(exc))
+        assert (restored.source, restored.retry_after) == ("my_source", 42.4)
+
     async def test_half_open_after_timeout(self):
         cb = CircuitBreaker(name="test", failure_threshold=1, recovery_timeout=0)
 
@@ -229,17 +236,21 @@ class TestSSEManager:
 
         # Fill queue to capacity (maxsize=10) via direct local fanout
         for i in range(10):
-            sse_manager._fanout_to_local(user_id, {"event": "fill", "data": {"i": i}})
+            await sse_manager._fanout_to_local(
+                user_id, {"event": "fill", "data": {"i": i}}
+            )
 
         assert queue.full()
 
         # Push one more — should drop oldest (i=0) and insert new
-        sse_manager._fanout_to_local(user_id, {"event": "overflow", "data": {"i": 10}})
+        await sse_manager._fanout_to_local(
+            user_id, {"event": "overflow", "data": {"i": 10}}
+        )
 
         assert sse_manager.dropped_events == 1
 
         # First item in queue should now be i=1 (i=0 was dropped)
-        msg = queue.get_nowait()
+        msg = await queue.get()
         assert msg["data"]["i"] == 1
 
     async def test_dropped_events_counter(self, sse_manager):
@@ -249,14 +260,38 @@ class TestSSEManager:
 
         # Push 15 events into a queue with maxsize=10
         for i in range(15):
-            sse_manager._fanout_to_local(user_id, {"event": "test", "data": {"i": i}})
+            await sse_manager._fanout_to_local(
+                user_id, {"event": "test", "data": {"i": i}}
+            )
 
         assert sse_manager.dropped_events == 5
 
-    def test_format_sse(self):
-        result = SSEManager.format_sse("test_event", {"key": "value"})
-        assert "event: test_event" in result
-        assert '"key": "value"' in result
+    async def test_resize_trims_live_buffers(self, sse_manager):
+        user_id = uuid.uuid4()
+        queue = await sse_manager.subscribe(user_id)
+        for i in range(8):
+            await sse_manager._fanout_to_local(
+                user_id, {"event": "test", "data": {"i": i}}
+            )
+
+        await sse_manager.set_max_buffered(3)
+
+        assert len(queue) == 3
+        assert sse_manager.dropped_events == 5
+        assert (await queue.get())["data"]["i"] == 5
+        # Las suscripciones nuevas heredan el nuevo límite
+        assert (await sse_manager.subscribe(user_id)).max_buffered == 3
+
+    async def test_stop_wakes_waiting_stream(self, redis_client):
+        mgr = SSEManager(redis_client, queue_maxsize=5)
+        await mgr.start()
+        queue = await mgr.subscribe(uuid.uuid4())
+        waiter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+
+        await mgr.stop()
+
+        assert await asyncio.wait_for(waiter, timeout=1.0) is None
 
     async def test_get_active_connections(self, sse_manager):
         user_id = uuid.uuid4()
@@ -1,6 +1,9 @@
 """Tests for utils/text.py and utils/http.py."""
 
+from utils.http import absolute_url
 from utils.text import (
+    JOB_TAGS,
+    collapse_whitespace,
     extract_canton,
     extract_job_skills,
     strip_html_tags,
@@ -34,6 +37,14 @@ class TestStripHtmlTags:
         assert result == "Hello World"
 
 
+class TestCollapseWhitespace:
+    def test_collapses_and_trims(self):
+        assert collapse_whitespace("  Hello\n\t  World \u00a0") == "Hello World"
+
+    def test_empty_string(self):
+        assert collapse_whitespace("") == ""
+
+
 # ---------------------------------------------------------------------------
 # extract_job_skills
 # ---------------------------------------------------------------------------
@@ -64,6 +75,10 @@ class TestExtractJobSkills:
         skills = extract_job_skills("Full Stack Developer", desc)
         assert len(skills) <= 15
 
+    def test_keeps_tag_order_when_capped(self):
+        skills = extract_job_skills("", " ".join(JOB_TAGS))
+        assert skills == JOB_TAGS[:15]
+
     def test_empty_inputs(self):
         assert extract_job_skills("", "") == []
 
@@ -117,3 +132,17 @@ class TestExtractCanton:
         assert extract_canton("valais") == "VS"
         assert extract_canton("neuchatel") == "NE"
         assert extract_canton("jura") == "JU"
+
+
+# ---------------------------------------------------------------------------
+# absolute_url
+# ---------------------------------------------------------------------------
+
+
+class TestAbsoluteUrl:
+    def test_relative_path_gets_base(self):
+        assert absolute_url("https://a.ch", "/job/1") == "https://a.ch/job/1"
+
+    def test_absolute_url_unchanged(self):
+        url = "https://cdn.b.ch/logo.png"
+        assert absolute_url("https://a.ch", url) == url
@@ -12,6 +12,15 @@ logger = logging.getLogger(__name__)
 DEFAULT_RETRY_STATUSES = [429, 500, 502, 503, 504]
 
 
+def absolute_url(base: str, href: str) -> str:
+    """Resolve a scraped href against its site root.
+
+    Los portales devuelven rutas absolutas ("/stelle/1") o URLs completas; no
+    hace falta urljoin, basta con anteponer la raíz cuando no empieza por http.
+    """
+    return href if href.startswith("http") else base + href
+
+
 async def fetch_with_retry(
     client: httpx.AsyncClient,
     url: str,
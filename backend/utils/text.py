@@ -220,14 +220,33 @@ SWISS_CANTONS: dict[str, str] = {
     "ju": "JU",
 }
 
+# Tablas derivadas, calculadas una vez al importar: los tags ya están en
+# minúsculas y sin duplicados, y las variantes de ≤2 letras ("zh", "ge") solo
+# valen como coincidencia exacta — darían falsos positivos como subcadena.
+_MAX_JOB_SKILLS = 15
+_JOB_TAGS_LOWER: tuple[str, ...] = tuple(dict.fromkeys(t.lower() for t in JOB_TAGS))
+_CANTON_SUBSTRINGS: tuple[tuple[str, str], ...] = tuple(
+    (name, code) for name, code in SWISS_CANTONS.items() if len(name) > 2
+)
+
+
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
 
 def strip_html_tags(text: str) -> str:
     """Remove HTML tags and normalize whitespace."""
     if not text:
         return ""
-    cleaned = re.sub(r"<[^>]+>", " ", text)
-    cleaned = re.sub(r"\s+", " ", cleaned)
-    return cleaned.strip()
+    return collapse_whitespace(_HTML_TAG_RE.sub(" ", text))
+
+
+def collapse_whitespace(text: str) -> str:
+    """Collapse runs of whitespace into single spaces and trim the ends.
+
+    Para texto ya extraído del DOM (``get_text``): no hace falta volver a
+    buscar etiquetas, basta con normalizar espacios — split/join en C.
+    """
+    return " ".join(text.split())
 
 
 def extract_job_skills(title: str, description: str) -> list[str]:
@@ -237,10 +256,12 @@ def extract_job_skills(title: str, description: str) -> list[str]:
     """
     found: list[str] = []
     combined = f"{title} {description}".lower()
-    for tag in JOB_TAGS:
-        if tag.lower() in combined and tag not in found:
+    for tag in _JOB_TAGS_LOWER:
+        if tag in combined:
             found.append(tag)
-    return found[:15]
+            if len(found) == _MAX_JOB_SKILLS:
+                break
+    return found
 
 
 def extract_canton(location: str) -> str | None:
@@ -257,8 +278,8 @@ def extract_canton(location: str) -> str | None:
         return SWISS_CANTONS[loc_lower]
 
     # Substring match — only use names longer than 2 chars to avoid false positives
-    for name, code in SWISS_CANTONS.items():
-        if len(name) > 2 and name in loc_lower:
+    for name, code in _CANTON_SUBSTRINGS:
+        if name in loc_lower:
             return code
 
     return None